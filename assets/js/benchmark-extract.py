@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the certificate extraction pipeline.
+
+Run from the repo root:
+
+    python assets/js/benchmark-extract.py [skill-section] [regions] [text-search] [records]
+
+skill-section  find_skill_section() on adversarial inputs of doubling size.
+               Fails if the cost per character grows by more than
+               LINEAR_TOLERANCE between the smallest and largest input, and
+               checks the scanner against the regex it replaced.
+regions        Layout-aware reading of the LinkedIn template (page_runs() +
+               linkedin_regions()) against pypdf's whole-page extract_text()
+               on the first page of every archived certificate. Fails if the
+               region reader is not faster.
+text-search    BM25 queries against a text_search index of SEARCH_DOCUMENTS
+               documents (the archived certificates' text, repeated). Fails
+               if a query takes longer than QUERY_BUDGET_MS.
+records        Memory per certificate and learning-data.json dump time of
+               certificate_record's records against plain dicts with json,
+               at RECORDS certificates (the dataset, repeated). Fails if the
+               records take more memory, their dump is not faster or their
+               output differs.
+"""
+
+import argparse
+import importlib.util
+import json
+import re
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+ROOT = Path(__file__).resolve().parents[2]
+SIZES = [20_000, 40_000, 80_000, 160_000, 320_000, 640_000, 1_280_000]
+REPEATS = 5
+# The archive benchmarks read every certificate per repeat
+ARCHIVE_REPEATS = 2
+# Allowed growth of the per-character cost from the smallest to the largest input
+LINEAR_TOLERANCE = 3.0
+
+# Size of the text-search corpus and the per-query latency budget
+SEARCH_DOCUMENTS = 20_000
+QUERY_BUDGET_MS = 50
+SEARCH_QUERIES = ["python", "machine learning", '"prompt engineering"', "security incident response",
+                  'python "machine learning" data', "certificate"]
+
+# Size of the records benchmark dataset
+RECORDS = 100_000
+
+# The backtracking pattern find_skill_section() replaced, kept as the reference
+LEGACY_SKILL_SECTION = re.compile(
+    r'Top\s+skills\s+covered[:\s]*\n((?:[^\n]+\n?)+?)(?=\n\s*\n|\nCertificate\s+ID'
+    r'|\n[A-Z][a-z]+\s+[A-Z][a-z]+\s+Head|\n[A-Z][A-Z\s]{15,}|$)',
+    re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+
+def load_extractor():
+    """Import assets/js/extract-pdf-data.py (its name is not a valid module name)."""
+    spec = importlib.util.spec_from_file_location(
+        "extract_pdf_data", ROOT / "assets" / "js" / "extract-pdf-data.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_time(func, *args):
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def repeat_to(unit, size):
+    return unit * max(1, size // len(unit))
+
+
+# Inputs that defeat naive scanners: no terminating blank line, near-miss
+# stop markers on every line, header runs without a line break, and many
+# headers that each fail to qualify.
+ADVERSARIAL_INPUTS = {
+    "no blank line": lambda n: "Top skills covered\n" + repeat_to("Generative AI Security\n", n),
+    "one long line": lambda n: "Top skills covered\n" + repeat_to("ab ", n),
+    "near-miss stops": lambda n: "Top skills covered\n" + repeat_to("Certificate Head OF LEARNING CONTENT\n", n),
+    "whitespace run": lambda n: "Top skills covered" + " " * n + "x",
+    "newline run": lambda n: "Top skills covered" + "\n" * n,
+    "failing headers": lambda n: repeat_to("Top skills covered: x ", n),
+    "space-only lines": lambda n: "Top skills covered \n" + repeat_to(" \n", n),
+}
+
+
+def benchmark_skill_section():
+    extractor = load_extractor()
+    worst = 0.0
+    print(f"{'input (ms)':<18}" + "".join(f"{size // 1000:>8}k" for size in SIZES)
+          + f"{'growth':>9}{'legacy':>9}")
+    for name, build in ADVERSARIAL_INPUTS.items():
+        texts = [build(size) for size in SIZES]
+        for text in texts[:2]:
+            legacy = LEGACY_SKILL_SECTION.search(text)
+            if extractor.find_skill_section(text) != (legacy.group(1) if legacy else None):
+                raise SystemExit(f"find_skill_section differs from the legacy regex on '{name}'")
+        timings = [best_time(extractor.find_skill_section, text) for text in texts]
+        per_char = [t / len(text) for t, text in zip(timings, texts)]
+        # Per-character cost at the largest size relative to the smallest
+        growth = per_char[-1] / per_char[0]
+        worst = max(worst, growth)
+        legacy_time = best_time(LEGACY_SKILL_SECTION.search, texts[-1])
+        print(f"{name:<18}" + "".join(f"{t * 1000:>9.2f}" for t in timings)
+              + f"{growth:>8.2f}x{legacy_time * 1000:>9.2f}")
+    if worst > LINEAR_TOLERANCE:
+        raise SystemExit(f"Per-character cost grew {worst:.1f}x (> {LINEAR_TOLERANCE}x): not linear")
+    print(f"\nLinear: per-character cost grew at most {worst:.2f}x over a {SIZES[-1] // SIZES[0]}x size range")
+
+
+def archive_pages(paths):
+    """First pages of paths, each from a fresh reader (nothing cached)."""
+    return [pypdf.PdfReader(path).pages[0] for path in paths]
+
+
+def benchmark_regions():
+    if pypdf is None:
+        raise SystemExit("The regions benchmark needs pypdf (pip install pypdf)")
+    extractor = load_extractor()
+    paths = sorted((ROOT / "archived").rglob("CertificateOfCompletion*.pdf"))
+    if not paths:
+        raise SystemExit("No certificates under archived/")
+
+    def read_regions(pages):
+        return [extractor.linkedin_regions(extractor.page_runs(page) or []) for page in pages]
+
+    def extract_text(pages):
+        return [page.extract_text() for page in pages]
+
+    # Page objects are rebuilt for every repeat: pypdf caches decoded streams
+    timings = {}
+    for name, func in (("extract_text", extract_text), ("regions", read_regions)):
+        best = float("inf")
+        for _ in range(ARCHIVE_REPEATS):
+            pages = archive_pages(paths)
+            started = time.perf_counter()
+            result = func(pages)
+            best = min(best, time.perf_counter() - started)
+        timings[name] = best
+        if name == "regions":
+            matched = sum(1 for regions in result if regions)
+    print(f"{len(paths)} certificates, {matched} read by template regions")
+    for name, seconds in timings.items():
+        print(f"{name:<14}{seconds * 1000:>9.1f} ms{seconds / len(paths) * 1000:>9.2f} ms/page")
+    speedup = timings["extract_text"] / timings["regions"]
+    if speedup <= 1:
+        raise SystemExit(f"Region reading is not faster than extract_text ({speedup:.2f}x)")
+    print(f"\nRegion reading is {speedup:.1f}x faster than extract_text")
+
+
+def benchmark_text_search():
+    import text_search
+    if not text_search.TEXT_STORE.exists():
+        raise SystemExit("The text-search benchmark needs the text store: run extract-pdf-data.py first")
+    texts = list(text_search.store_texts().values())
+    if not texts:
+        raise SystemExit("No certificate text in the text store")
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = text_search.connect(Path(tmp) / "index.sqlite")
+        started = time.perf_counter()
+        with conn:
+            text_search.update(conn, {f"doc-{i}": texts[i % len(texts)] for i in range(SEARCH_DOCUMENTS)})
+        print(f"Indexed {SEARCH_DOCUMENTS} documents in {time.perf_counter() - started:.1f}s\n")
+        worst = 0.0
+        print(f"{'query':<34}{'ms':>8}{'hits':>6}")
+        for query in SEARCH_QUERIES:
+            seconds = best_time(text_search.search, conn, query, 10)
+            worst = max(worst, seconds)
+            print(f"{query:<34}{seconds * 1000:>8.2f}{len(text_search.search(conn, query, 10)):>6}")
+        conn.close()
+    if worst * 1000 > QUERY_BUDGET_MS:
+        raise SystemExit(f"Slowest query took {worst * 1000:.1f} ms (> {QUERY_BUDGET_MS} ms)")
+    print(f"\nSlowest query: {worst * 1000:.2f} ms over {SEARCH_DOCUMENTS} documents")
+
+
+def traced_bytes(func, *args):
+    """Memory held by the result of func(*args)."""
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        held = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return held
+
+
+def benchmark_records():
+    import certificate_record
+    data = json.loads((ROOT / "assets" / "data" / "learning-data.json").read_text(encoding="utf-8-sig"))
+    base = data["certificates"]
+    if not base:
+        raise SystemExit("No certificates in learning-data.json")
+    # Repeats get their own id and title, like distinct certificates
+    data["certificates"] = [{**base[i % len(base)], "id": i + 1,
+                             "title": f"{base[i % len(base)]['title']} {i // len(base) or ''}".rstrip()}
+                            for i in range(RECORDS)]
+
+    def dump_dicts(data):
+        return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def load_records(text):
+        loaded = json.loads(text)
+        loaded["certificates"] = [certificate_record.Certificate.from_dict(cert)
+                                  for cert in loaded["certificates"]]
+        return loaded
+
+    text = dump_dicts(data)
+    records = load_records(text)
+    if certificate_record.dumps(records) != text:
+        raise SystemExit("certificate_record.dumps differs from json.dumps(indent=2)")
+    memory = {"dicts": traced_bytes(json.loads, text), "records": traced_bytes(load_records, text)}
+    timings = {"dicts": best_time(dump_dicts, data), "records": best_time(certificate_record.dumps, records)}
+    print(f"{RECORDS} certificates, {len(text) / 1e6:.1f} MB of JSON\n")
+    print(f"{'':<10}{'bytes/record':>14}{'dump ms':>10}")
+    for name, dump in timings.items():
+        print(f"{name:<10}{memory[name] / RECORDS:>14.0f}{dump * 1000:>10.0f}")
+    if memory["records"] >= memory["dicts"]:
+        raise SystemExit("Records take no less memory than dicts")
+    if timings["records"] >= timings["dicts"]:
+        raise SystemExit(f"Record dump is not faster ({timings['dicts'] / timings['records']:.2f}x)")
+    print(f"\nRecords: {memory['dicts'] / memory['records']:.1f}x less memory, "
+          f"dump {timings['dicts'] / timings['records']:.1f}x faster than dicts")
+
+
+BENCHMARKS = {
+    "skill-section": benchmark_skill_section,
+    "regions": benchmark_regions,
+    "text-search": benchmark_text_search,
+    "records": benchmark_records,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the extraction pipeline")
+    parser.add_argument("names", nargs="*", metavar="name",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    args = parser.parse_args()
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(sorted(unknown))}")
+    for name in args.names or BENCHMARKS:
+        print(f"== {name}")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""SQLite catalog: the canonical certificate store.
+
+assets/data/learning-data.json is exported from archived/learning-catalog.sqlite
+and should not be edited by hand any more. Extraction (extract-pdf-data.py)
+upserts into the catalog, and publish-site.py exports the JSON and queries
+the JSON-LD items from it. Certificates are indexed by year, date and
+domain, and skills are kept in their own indexed table.
+
+Rows keep their id across runs: an upsert matches the path, then the id,
+then (for moved PDFs) the content hash. The JSON lists rows in `position`
+order. Existing rows keep their place and new rows are added at the top.
+
+    python assets/js/catalog.py import [learning-data.json]   # seed / merge hand edits
+    python assets/js/catalog.py export                        # rewrite learning-data.json
+    python assets/js/catalog.py query [--year Y] [--domain D] [--skill S]
+"""
+
+import argparse
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import certificate_record
+
+ROOT = Path(__file__).resolve().parents[2]
+CATALOG = ROOT / "archived" / "learning-catalog.sqlite"
+DATA = ROOT / "assets" / "data" / "learning-data.json"
+
+# Certificate fields in learning-data.json order (skills are stored separately)
+FIELDS = ["id", "title", "path", "domain", "year", "date", "duration", "skills", "provider"]
+COLUMNS = ["title", "path", "domain", "year", "date", "duration", "provider"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS certificates (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    path TEXT UNIQUE,
+    domain TEXT,
+    year TEXT,
+    date TEXT,
+    duration TEXT,
+    provider TEXT,
+    source_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS certificates_year ON certificates (year);
+CREATE INDEX IF NOT EXISTS certificates_date ON certificates (date);
+CREATE INDEX IF NOT EXISTS certificates_domain ON certificates (domain);
+CREATE INDEX IF NOT EXISTS certificates_position ON certificates (position);
+CREATE INDEX IF NOT EXISTS certificates_source_hash ON certificates (source_hash);
+CREATE TABLE IF NOT EXISTS certificate_skills (
+    certificate_id INTEGER NOT NULL REFERENCES certificates (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (certificate_id, position)
+);
+CREATE INDEX IF NOT EXISTS certificate_skills_skill ON certificate_skills (skill);
+CREATE TABLE IF NOT EXISTS catalog_metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def connect(path=CATALOG):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def get_metadata(conn, key, default=None):
+    row = conn.execute("SELECT value FROM catalog_metadata WHERE key = ?", (key,)).fetchone()
+    return row["value"] if row else default
+
+
+def set_metadata(conn, key, value):
+    conn.execute("INSERT INTO catalog_metadata (key, value) VALUES (?, ?) "
+                 "ON CONFLICT (key) DO UPDATE SET value = excluded.value", (key, value))
+
+
+def find_existing(conn, cert, claimed=()):
+    """Row id of the stored certificate cert corresponds to, or None.
+
+    Rows are matched by path, then by id. A PDF that was moved or renamed
+    is matched by its content hash, skipping rows whose path is in claimed
+    (identical copies of one PDF keep their own rows).
+    """
+    for column, value in (("path", cert.get("path")), ("id", cert.get("id"))):
+        if value is not None:
+            row = conn.execute(f"SELECT id FROM certificates WHERE {column} = ?", (value,)).fetchone()
+            if row:
+                return row["id"]
+    if cert.get("source_hash") is not None:
+        for row in conn.execute("SELECT id, path FROM certificates WHERE source_hash = ?",
+                                (cert["source_hash"],)):
+            if row["path"] not in claimed:
+                return row["id"]
+    return None
+
+
+def stored(conn, cert_id):
+    row = conn.execute(f"SELECT {', '.join(COLUMNS)}, source_hash FROM certificates WHERE id = ?",
+                       (cert_id,)).fetchone()
+    skills = [r["skill"] for r in conn.execute(
+        "SELECT skill FROM certificate_skills WHERE certificate_id = ? ORDER BY position", (cert_id,))]
+    return dict(row), skills
+
+
+def upsert(conn, certificates, prepend=True):
+    """Insert or update certificates; only rows whose fields differ are written.
+
+    New rows are placed before all existing ones (in the given order) when
+    prepend is set, after them otherwise. Returns (inserted, updated,
+    unchanged) counts.
+    """
+    inserted = updated = unchanged = 0
+    new_rows = []
+    claimed = {cert.get("path") for cert in certificates}
+    for cert in certificates:
+        values = {column: cert.get(column) for column in COLUMNS}
+        skills = list(cert.get("skills") or [])
+        cert_id = find_existing(conn, cert, claimed)
+        if cert_id is None:
+            new_rows.append((cert, values, skills))
+            continue
+        row, old_skills = stored(conn, cert_id)
+        source_hash = cert.get("source_hash") or row["source_hash"]
+        if {c: row[c] for c in COLUMNS} == values and old_skills == skills \
+                and row["source_hash"] == source_hash:
+            unchanged += 1
+            continue
+        conn.execute(f"UPDATE certificates SET {', '.join(f'{c} = ?' for c in COLUMNS)}, "
+                     "source_hash = ? WHERE id = ?",
+                     [values[c] for c in COLUMNS] + [source_hash, cert_id])
+        write_skills(conn, cert_id, skills)
+        updated += 1
+
+    if new_rows:
+        bounds = conn.execute("SELECT MIN(position), MAX(position), MAX(id) FROM certificates").fetchone()
+        first, last, max_id = (bounds[0] or 0), (bounds[1] or 0), (bounds[2] or 0)
+        start = first - len(new_rows) if prepend else last + 1
+        for offset, (cert, values, skills) in enumerate(new_rows):
+            # Keep a given id unless another row already holds it
+            cert_id = cert.get("id")
+            if cert_id is None or conn.execute("SELECT 1 FROM certificates WHERE id = ?",
+                                               (cert_id,)).fetchone():
+                max_id += 1
+                cert_id = max_id
+            max_id = max(max_id, cert_id)
+            conn.execute(f"INSERT INTO certificates (id, position, {', '.join(COLUMNS)}, source_hash) "
+                         f"VALUES (?, ?, {', '.join('?' for _ in COLUMNS)}, ?)",
+                         [cert_id, start + offset] + [values[c] for c in COLUMNS]
+                         + [cert.get("source_hash")])
+            write_skills(conn, cert_id, skills)
+            inserted += 1
+
+    if inserted or updated:
+        set_metadata(conn, "last_updated", datetime.now().isoformat())
+    return inserted, updated, unchanged
+
+
+def write_skills(conn, cert_id, skills):
+    conn.execute("DELETE FROM certificate_skills WHERE certificate_id = ?", (cert_id,))
+    conn.executemany("INSERT INTO certificate_skills (certificate_id, position, skill) VALUES (?, ?, ?)",
+                     [(cert_id, i, skill) for i, skill in enumerate(skills)])
+
+
+def delete(conn, cert_ids):
+    conn.executemany("DELETE FROM certificates WHERE id = ?", [(i,) for i in cert_ids])
+    if cert_ids:
+        set_metadata(conn, "last_updated", datetime.now().isoformat())
+    return len(cert_ids)
+
+
+def rows_to_certificates(conn, rows):
+    """Certificate records (see certificate_record.py) for certificate rows."""
+    rows = list(rows)
+    skills = {}
+    ids = [row["id"] for row in rows]
+    # One skills query per chunk of ids (SQLite caps bound parameters)
+    for i in range(0, len(ids), 500):
+        chunk = ids[i:i + 500]
+        for row in conn.execute(
+                f"SELECT certificate_id, skill FROM certificate_skills WHERE certificate_id IN "
+                f"({', '.join('?' for _ in chunk)}) ORDER BY certificate_id, position", chunk):
+            skills.setdefault(row["certificate_id"], []).append(row["skill"])
+    return [certificate_record.Certificate(row["title"], row["path"], row["domain"], row["year"], row["date"],
+                                           row["duration"], skills.get(row["id"], ()), row["provider"],
+                                           row["id"])
+            for row in rows]
+
+
+def certificates(conn, year=None, domain=None, skill=None):
+    """Certificates in export order, optionally filtered (indexed lookups)."""
+    where, params = [], []
+    if year is not None:
+        where.append("year = ?")
+        params.append(str(year))
+    if domain is not None:
+        where.append("domain = ?")
+        params.append(domain)
+    if skill is not None:
+        where.append("id IN (SELECT certificate_id FROM certificate_skills WHERE skill = ?)")
+        params.append(skill)
+    sql = "SELECT * FROM certificates"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return rows_to_certificates(conn, conn.execute(sql + " ORDER BY position", params))
+
+
+def top_certificates(conn, n):
+    """The n most recent certificates, one per (title, date); ties keep
+    export order."""
+    rows = conn.execute(
+        "SELECT * FROM certificates WHERE position IN "
+        "(SELECT MIN(position) FROM certificates GROUP BY title, date) "
+        "ORDER BY COALESCE(date, '') DESC, position LIMIT ?", (n,))
+    return rows_to_certificates(conn, rows)
+
+
+def metadata(conn):
+    return {
+        "total": conn.execute("SELECT COUNT(*) FROM certificates").fetchone()[0],
+        "domains": conn.execute("SELECT COUNT(DISTINCT domain) FROM certificates").fetchone()[0],
+        "years": [row[0] for row in conn.execute(
+            "SELECT DISTINCT year FROM certificates WHERE year IS NOT NULL ORDER BY year DESC")],
+        "last_updated": get_metadata(conn, "last_updated"),
+    }
+
+
+def dataset(conn):
+    """The full learning-data.json structure."""
+    return {"metadata": metadata(conn), "certificates": certificates(conn)}
+
+
+def dump(data):
+    """learning-data.json bytes for a dataset."""
+    return certificate_record.dumps(data)
+
+
+def export_json(conn, path=DATA):
+    """Rewrite learning-data.json from the catalog if its content changed.
+    Returns True when the file was written."""
+    new = dump(dataset(conn))
+    if path.exists() and path.read_bytes() == new:
+        return False
+    path.write_bytes(new)
+    return True
+
+
+def import_json(conn, path=DATA):
+    """Merge learning-data.json into the catalog (rows matched by path or id)."""
+    data = json.loads(path.read_text(encoding="utf-8-sig"))
+    seeding = conn.execute("SELECT COUNT(*) FROM certificates").fetchone()[0] == 0
+    result = upsert(conn, data["certificates"], prepend=False)
+    if seeding:
+        # A fresh catalog inherits the dataset's own timestamp
+        set_metadata(conn, "last_updated", data["metadata"].get("last_updated"))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the certificate catalog")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_cmd = commands.add_parser("import", help="merge a learning-data.json into the catalog")
+    import_cmd.add_argument("json", nargs="?", type=Path, default=DATA)
+    commands.add_parser("export", help="rewrite learning-data.json from the catalog")
+    query = commands.add_parser("query", help="list certificates matching all filters")
+    query.add_argument("--year")
+    query.add_argument("--domain")
+    query.add_argument("--skill")
+    args = parser.parse_args()
+
+    conn = connect()
+    with conn:
+        if args.command == "import":
+            inserted, updated, unchanged = import_json(conn, args.json)
+            print(f"Catalog: {inserted} inserted, {updated} updated, {unchanged} unchanged")
+        elif args.command == "export":
+            written = export_json(conn)
+            print(f"{DATA.relative_to(ROOT)}: {'written' if written else 'up to date'}")
+        else:
+            for cert in certificates(conn, args.year, args.domain, args.skill):
+                print(f"{cert['id']:>5}  {cert['date'] or '':<10}  {cert['domain']:<13}  {cert['title']}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""In-memory query index over assets/data/learning-data.json.
+
+CertificateIndex loads the dataset once into compact columns (row i is the
+i-th certificate of the JSON) and indexes them for set algebra:
+
+  - one bitmap per domain, year and skill: a Python int whose bit i is set
+    when row i matches, so combined filters are `&` / `|` of ints and
+    counts are popcounts
+  - a sorted array of rows by date (newest first, ties in dataset order)
+    for date ranges (bisect) and top-k-by-date queries
+
+Building the index parses the JSON; loading it from the binary snapshot
+(archived/.certificate-index.pickle) does not. The snapshot is keyed by the
+SHA-256 of the JSON and rebuilt whenever the JSON changes.
+
+    from certificate_index import CertificateIndex
+    index = CertificateIndex.load()
+    mask = index.query(domain="ai", year=["2025", "2026"], skill="Python")
+    index.count(mask), index.top_by_date(5, mask), index.facet("domain", mask)
+
+    python assets/js/certificate_index.py [--domain D] [--year Y] [--skill S]
+        [--from DATE] [--to DATE] [--top N] [--facet domain|year|skill|provider]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+DATA = ROOT / "assets" / "data" / "learning-data.json"
+SNAPSHOT = ROOT / "archived" / ".certificate-index.pickle"
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 1
+
+# Categorical columns: one value table plus a code per row
+CATEGORIES = ["domain", "year", "provider"]
+
+
+def bitmap(rows, size):
+    """Bitmap (int) with the bits of rows set."""
+    bits = bytearray((size + 7) // 8)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little")
+
+
+def iter_bits(mask):
+    """Set bit positions of mask, in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def date_key(value):
+    """Sort key of a date column value: newest first, missing dates last."""
+    return -date.fromisoformat(value).toordinal() if value else 0
+
+
+class CertificateIndex:
+    """Columns and bitmap / sorted-array indexes of the certificate dataset."""
+
+    def __init__(self, data):
+        certificates = data["certificates"]
+        self.size = len(certificates)
+        self.metadata = data["metadata"]
+        self.ids = array("I", (cert["id"] for cert in certificates))
+        self.titles = [cert["title"] for cert in certificates]
+        self.paths = [cert.get("path") for cert in certificates]
+        self.dates = [cert.get("date") for cert in certificates]
+        self.durations = [cert.get("duration") for cert in certificates]
+
+        # Categorical columns: values[column][codes[column][row]]
+        self.values, self.codes, self.bitmaps = {}, {}, {}
+        for column in CATEGORIES:
+            table, codes, rows = {}, array("H"), {}
+            for row, cert in enumerate(certificates):
+                code = table.setdefault(cert.get(column), len(table))
+                codes.append(code)
+                rows.setdefault(cert.get(column), []).append(row)
+            self.values[column] = list(table)
+            self.codes[column] = codes
+            self.bitmaps[column] = {value: bitmap(r, self.size) for value, r in rows.items()}
+
+        # Skills: flattened codes with per-row offsets (row i owns
+        # skill_codes[skill_offsets[i]:skill_offsets[i + 1]])
+        table, rows = {}, {}
+        self.skill_codes, self.skill_offsets = array("H"), array("I", [0])
+        for row, cert in enumerate(certificates):
+            for skill in cert.get("skills") or []:
+                self.skill_codes.append(table.setdefault(skill, len(table)))
+                rows.setdefault(skill, []).append(row)
+            self.skill_offsets.append(len(self.skill_codes))
+        self.values["skill"] = list(table)
+        self.bitmaps["skill"] = {skill: bitmap(r, self.size) for skill, r in rows.items()}
+
+        # Rows sorted newest first; date_keys is ascending for bisect
+        self.by_date = array("I", sorted(range(self.size), key=lambda row: date_key(self.dates[row])))
+        self.date_keys = array("q", (date_key(self.dates[row]) for row in self.by_date))
+        self.all = (1 << self.size) - 1
+
+    @classmethod
+    def load(cls, path=DATA, snapshot=SNAPSHOT):
+        """Index of the JSON at path, from the snapshot when it is current."""
+        raw = path.read_bytes()
+        source_hash = hashlib.sha256(raw).hexdigest()
+        try:
+            with open(snapshot, "rb") as f:
+                header, state = pickle.load(f)
+            if header == {"version": SNAPSHOT_VERSION, "source_hash": source_hash}:
+                index = cls.__new__(cls)
+                index.__dict__.update(state)
+                return index
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            pass  # missing or unreadable snapshot: rebuild it
+        index = cls(json.loads(raw.decode("utf-8-sig")))
+        index.save(snapshot, source_hash)
+        return index
+
+    def save(self, snapshot, source_hash):
+        tmp = snapshot.with_name(snapshot.name + ".tmp")
+        with open(tmp, "wb") as f:
+            # Plain attributes only, so the snapshot does not depend on the module name
+            pickle.dump(({"version": SNAPSHOT_VERSION, "source_hash": source_hash}, vars(self)), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, snapshot)
+
+    def lookup(self, column, values):
+        """Bitmap of rows whose column equals any of values (a value or a list)."""
+        if isinstance(values, str) or not hasattr(values, "__iter__"):
+            values = [values]
+        mask = 0
+        for value in values:
+            mask |= self.bitmaps[column].get(value, 0)
+        return mask
+
+    def date_range(self, start=None, end=None):
+        """Bitmap of rows dated within [start, end] (ISO dates, inclusive)."""
+        lo = bisect_left(self.date_keys, date_key(end)) if end else 0
+        hi = bisect_right(self.date_keys, date_key(start)) if start else bisect_left(self.date_keys, 0)
+        return bitmap(self.by_date[lo:hi], self.size)
+
+    def query(self, domain=None, year=None, skill=None, provider=None, start=None, end=None):
+        """Bitmap of rows matching every given filter; list filters match any
+        of their values."""
+        mask = self.all
+        for column, values in (("domain", domain), ("year", year), ("skill", skill),
+                               ("provider", provider)):
+            if values is not None:
+                mask &= self.lookup(column, values)
+        if start or end:
+            mask &= self.date_range(start, end)
+        return mask
+
+    def count(self, mask=None):
+        return (self.all if mask is None else mask).bit_count()
+
+    def facet(self, column, mask=None):
+        """Row count per value of column within mask, largest first."""
+        mask = self.all if mask is None else mask
+        counts = ((value, (bits & mask).bit_count()) for value, bits in self.bitmaps[column].items())
+        return dict(sorted(((v, n) for v, n in counts if n), key=lambda item: -item[1]))
+
+    def certificate(self, row):
+        """The learning-data.json certificate dict of a row."""
+        skills = self.values["skill"]
+        return {
+            "id": self.ids[row],
+            "title": self.titles[row],
+            "path": self.paths[row],
+            "domain": self.values["domain"][self.codes["domain"][row]],
+            "year": self.values["year"][self.codes["year"][row]],
+            "date": self.dates[row],
+            "duration": self.durations[row],
+            "skills": [skills[code] for code in
+                       self.skill_codes[self.skill_offsets[row]:self.skill_offsets[row + 1]]],
+            "provider": self.values["provider"][self.codes["provider"][row]],
+        }
+
+    def rows(self, mask=None):
+        """Certificates of mask in dataset order."""
+        return [self.certificate(row) for row in iter_bits(self.all if mask is None else mask)]
+
+    def top_by_date(self, k, mask=None):
+        """The k most recent certificates of mask; ties keep dataset order."""
+        mask = self.all if mask is None else mask
+        top = []
+        for row in self.by_date:
+            if len(top) == k:
+                break
+            if mask >> row & 1:
+                top.append(self.certificate(row))
+        return top
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the certificate dataset")
+    parser.add_argument("--domain", action="append", help="repeat to match any of several")
+    parser.add_argument("--year", action="append")
+    parser.add_argument("--skill", action="append")
+    parser.add_argument("--from", dest="start", metavar="DATE", help="earliest date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", metavar="DATE", help="latest date (YYYY-MM-DD)")
+    parser.add_argument("--top", type=int, metavar="N", help="only the N most recent matches")
+    parser.add_argument("--facet", choices=CATEGORIES + ["skill"],
+                        help="print match counts per value of a column instead")
+    args = parser.parse_args()
+
+    index = CertificateIndex.load()
+    mask = index.query(args.domain, args.year, args.skill, start=args.start, end=args.end)
+    if args.facet:
+        for value, count in index.facet(args.facet, mask).items():
+            print(f"{count:>5}  {value}")
+        return
+    certs = index.top_by_date(args.top, mask) if args.top else index.rows(mask)
+    for cert in certs:
+        print(f"{cert['id']:>5}  {cert['date'] or '':<10}  {cert['domain']:<13}  {cert['title']}")
+    print(f"\n{index.count(mask)} of {index.size} certificates match")
+
+
+if __name__ == "__main__":
+    main()
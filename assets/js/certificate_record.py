@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""The Certificate record passed between the pipeline stages.
+
+A Certificate holds the fields of one learning-data.json entry in slots (no
+per-record __dict__ or key table), and its enum-like values are interned:
+every record shares one string object per domain, provider, year and
+skill, so a dataset costs a fraction of the memory of the equivalent
+dicts. Records read like the dicts they replace (cert["title"],
+cert.get("skills")), so the catalog and publish stages take either.
+
+dumps() writes learning-data.json byte for byte as
+json.dumps(data, indent=2, ensure_ascii=False) does, with one template per
+record and the encoded interned values cached, instead of the json
+module's pure-Python indenting encoder. Reading stays with json.loads: its
+C parser builds the dicts faster than any per-record Python hook builds
+records, so readers that want records convert with Certificate.from_dict.
+
+    import certificate_record
+    records = [certificate_record.Certificate.from_dict(cert) for cert in data["certificates"]]
+    path.write_bytes(certificate_record.dumps({**data, "certificates": records}))
+
+    python assets/js/benchmark-extract.py records   # memory and dump speed at 100k records
+"""
+
+import json
+import sys
+from json.encoder import encode_basestring
+
+# Fields in learning-data.json order; source_hash is only set by extraction
+FIELDS = ("id", "title", "path", "domain", "year", "date", "duration", "skills", "provider")
+SLOTS = FIELDS + ("source_hash",)
+_SLOT_SET = frozenset(SLOTS)
+
+
+def intern(value):
+    """The shared copy of a string value (None is kept)."""
+    return value if value is None else sys.intern(value)
+
+
+class Certificate:
+    __slots__ = SLOTS
+
+    def __init__(self, title, path=None, domain=None, year=None, date=None, duration=None,
+                 skills=(), provider=None, id=None, source_hash=None):
+        self.id = id
+        self.title = title
+        self.path = path
+        self.domain = intern(domain)
+        self.year = intern(year)
+        self.date = date
+        self.duration = duration
+        self.skills = tuple(map(sys.intern, skills or ()))
+        self.provider = intern(provider)
+        self.source_hash = source_hash
+
+    @classmethod
+    def from_dict(cls, fields):
+        """Record of a learning-data.json (or partial result) certificate dict."""
+        get = fields.get
+        return cls(get("title"), get("path"), get("domain"), get("year"), get("date"), get("duration"),
+                   get("skills"), get("provider"), get("id"), get("source_hash"))
+
+    def to_dict(self):
+        """The learning-data.json dict, with source_hash when it is set."""
+        fields = {field: getattr(self, field) for field in FIELDS}
+        fields["skills"] = list(self.skills)
+        if self.source_hash is not None:
+            fields["source_hash"] = self.source_hash
+        return fields
+
+    # Read access of the dict the record replaces
+    def __getitem__(self, field):
+        if field not in _SLOT_SET:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def get(self, field, default=None):
+        return getattr(self, field) if field in _SLOT_SET else default
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def __eq__(self, other):
+        if not isinstance(other, Certificate):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in SLOTS)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Certificate(id={self.id!r}, title={self.title!r}, domain={self.domain!r}, date={self.date!r})"
+
+
+# One record of the "certificates" array at json.dumps(indent=2) depth
+RECORD = ('    {\n      "id": %s,\n      "title": %s,\n      "path": %s,\n      "domain": %s,\n'
+          '      "year": %s,\n      "date": %s,\n      "duration": %s,\n      "skills": %s,\n'
+          '      "provider": %s%s\n    }')
+
+
+def encode(value):
+    """JSON text of a field value."""
+    if value is None:
+        return "null"
+    if type(value) is str:
+        return encode_basestring(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+_ENCODED = {}
+
+
+def encode_interned(value):
+    """encode() of an interned value (domain, year, provider, skill), cached:
+    a dataset only has a few hundred distinct ones."""
+    encoded = _ENCODED.get(value)
+    if encoded is None:
+        encoded = _ENCODED[value] = encode(value)
+    return encoded
+
+
+def encode_record(cert, encode_str=encode_basestring, cached=_ENCODED.get):
+    """RECORD of a certificate."""
+    # Inlined fast paths (str, int, cached) of encode() and encode_interned():
+    # the per-field calls cost more than the encoding itself
+    id, title, path, date, duration, skills = cert.id, cert.title, cert.path, cert.date, cert.duration, cert.skills
+    if skills:
+        skills = "[\n        " + ",\n        ".join([cached(skill) or encode_interned(skill)
+                                                   for skill in skills]) + "\n      ]"
+    else:
+        skills = "[]"
+    source_hash = cert.source_hash
+    return RECORD % (
+        id if type(id) is int else encode(id),
+        encode_str(title) if type(title) is str else encode(title),
+        encode_str(path) if type(path) is str else encode(path),
+        cached(cert.domain) or encode_interned(cert.domain),
+        cached(cert.year) or encode_interned(cert.year),
+        encode_str(date) if type(date) is str else encode(date),
+        encode_str(duration) if type(duration) is str else encode(duration),
+        skills,
+        cached(cert.provider) or encode_interned(cert.provider),
+        "" if source_hash is None else f',\n      "source_hash": {encode(source_hash)}',
+    )
+
+
+def dumps(data):
+    """learning-data.json bytes of a dataset whose "certificates" are records;
+    identical to json.dumps(data, indent=2, ensure_ascii=False) + newline."""
+    members = []
+    for key, value in data.items():
+        if key == "certificates" and value:
+            body = "[\n" + ",\n".join(map(encode_record, value)) + "\n  ]"
+        else:
+            body = json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        members.append(f"  {encode(key)}: {body}")
+    return ("{\n" + ",\n".join(members) + "\n}\n").encode("utf-8")
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Offline page-weight and performance budget check.
+
+Parses every HTML page, resolves what a browser would download for it
+(stylesheets, scripts, images, icons, fonts and CSS url() references, and
+the JSON files the page's scripts fetch) and totals the raw and
+compressed bytes per resource type. The number of render-blocking requests
+(<head> stylesheets and synchronous scripts) is counted as well.
+
+Budgets live in .github/performance-budgets.json: "default" applies to
+every page, "pages" overrides it per page. Sizes are compressed (transfer)
+KB, the way Lighthouse reports them. Any page over budget prints its
+per-asset breakdown and the script exits non-zero, so run it before
+pushing:
+
+    python assets/js/publish-site.py
+    python assets/js/check-budgets.py [pages/learning.html ...] [--verbose]
+"""
+
+import argparse
+import gzip
+import json
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional: compressed sizes fall back to gzip
+    brotli = None
+
+ROOT = Path(__file__).resolve().parents[2]
+CONFIG = ROOT / ".github" / "performance-budgets.json"
+COMPRESSIBLE = {".html", ".json", ".js", ".css", ".svg", ".txt", ".xml"}
+# Device pixel ratio assumed when picking a srcset candidate
+ASSUMED_DPR = 2
+RESOURCE_TYPES = {
+    ".css": "stylesheet", ".js": "script", ".json": "data",
+    ".woff": "font", ".woff2": "font", ".ttf": "font", ".otf": "font",
+    ".avif": "image", ".webp": "image", ".png": "image", ".jpg": "image",
+    ".jpeg": "image", ".gif": "image", ".svg": "image", ".ico": "image",
+}
+CSS_URL = re.compile(r"""url\(\s*['"]?([^'")]+)['"]?\s*\)""")
+# Same-origin JSON fetched by scripts: fetch('/assets/data/x.json')
+FETCH_URL = re.compile(r"""fetch\(\s*['"`]([^'"`]+\.json)['"`]""")
+
+
+def page_files():
+    return [ROOT / "index.html", ROOT / "about.html", ROOT / "learning.html",
+            *sorted((ROOT / "pages").glob("*.html"))]
+
+
+def resolve(base, url):
+    """Local file a URL points at (relative to the file base), None for
+    external or data URLs."""
+    url = url.split("#", 1)[0].split("?", 1)[0].strip()
+    if not url or "://" in url or url.startswith(("data:", "//", "mailto:")):
+        return None
+    target = (ROOT / url.lstrip("/")) if url.startswith("/") else (base.parent / url)
+    target = target.resolve()
+    if target.is_dir():
+        target = target / "index.html"
+    try:
+        target.relative_to(ROOT)
+    except ValueError:
+        return None
+    return target
+
+
+def pick_candidate(srcset, width):
+    """The srcset candidate a browser at ASSUMED_DPR would choose for an
+    image rendered `width` CSS pixels wide."""
+    candidates = []
+    for part in srcset.split(","):
+        bits = part.split()
+        if not bits:
+            continue
+        descriptor = bits[1] if len(bits) > 1 else "1x"
+        if descriptor.endswith("w"):
+            size = int(descriptor[:-1])
+        else:
+            size = float(descriptor[:-1]) * (width or 1)
+        candidates.append((size, bits[0]))
+    if not candidates:
+        return None
+    candidates.sort()
+    wanted = (width or candidates[-1][0]) * ASSUMED_DPR
+    return next((url for size, url in candidates if size >= wanted), candidates[-1][1])
+
+
+class PageResources(HTMLParser):
+    """Collect the requests an HTML page makes while loading."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.requests = []          # (url, kind hint)
+        self.external = []          # third-party URLs (not measured)
+        self.render_blocking = []
+        self.in_head = True
+        self.noscript = 0
+        self.picture_sources = []   # first <source> srcset in the open <picture>
+
+    def add(self, url, hint=None, blocking=False):
+        if not url:
+            return
+        if "://" in url or url.startswith("//"):
+            self.external.append(url)
+        else:
+            self.requests.append((url, hint))
+        if blocking:
+            self.render_blocking.append(url)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "body":
+            self.in_head = False
+        elif tag == "noscript":
+            self.noscript += 1
+        elif tag == "picture":
+            self.picture_sources = []
+        if self.noscript:
+            return
+        rel = set((attrs.get("rel") or "").lower().split())
+        if tag == "link" and attrs.get("href"):
+            if "stylesheet" in rel:
+                blocking = self.in_head and attrs.get("media", "all") in ("all", "screen")
+                self.add(attrs["href"], "stylesheet", blocking)
+            # apple-touch-icon and manifest are only fetched on install
+            elif "preload" in rel or "icon" in rel:
+                self.add(attrs["href"])
+        elif tag == "script" and attrs.get("src"):
+            blocking = (self.in_head and "async" not in attrs and "defer" not in attrs
+                        and attrs.get("type") != "module")
+            self.add(attrs["src"], "script", blocking)
+        elif tag == "source" and attrs.get("srcset"):
+            self.picture_sources.append(attrs["srcset"])
+        elif tag == "img":
+            width = int(attrs["width"]) if (attrs.get("width") or "").isdigit() else None
+            # A browser takes the first <source> it supports; assume AVIF/WebP support
+            srcset = self.picture_sources[0] if self.picture_sources else attrs.get("srcset")
+            url = pick_candidate(srcset, width) if srcset else attrs.get("src")
+            if attrs.get("loading") != "lazy":
+                self.add(url, "image")
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.in_head = False
+        elif tag == "noscript" and self.noscript:
+            self.noscript -= 1
+        elif tag == "picture":
+            self.picture_sources = []
+
+
+def compressed_size(path, content):
+    if path.suffix not in COMPRESSIBLE:
+        return len(content)
+    sizes = [len(gzip.compress(content, 9, mtime=0))]
+    if brotli is not None:
+        sizes.append(len(brotli.compress(content, quality=11)))
+    return min(sizes)
+
+
+def collect(page):
+    """(assets, render-blocking URLs, external URLs) for a page. Each asset
+    is a dict with path, type, raw and compressed sizes."""
+    text = page.read_text(encoding="utf-8")
+    parser = PageResources()
+    parser.feed(text)
+    parser.close()
+
+    assets, seen, missing = [], set(), []
+
+    def add(path, kind):
+        if path in seen:
+            return
+        seen.add(path)
+        if not path.is_file():
+            missing.append(path)
+            return
+        content = path.read_bytes()
+        assets.append({
+            "path": path,
+            "type": kind or RESOURCE_TYPES.get(path.suffix.lower(), "other"),
+            "raw": len(content),
+            "compressed": compressed_size(path, content),
+        })
+        if path.suffix == ".css":
+            for url in CSS_URL.findall(content.decode("utf-8-sig")):
+                target = resolve(path, url)
+                if target:
+                    add(target, None)
+        elif path.suffix == ".js":
+            for url in FETCH_URL.findall(content.decode("utf-8-sig")):
+                # fetch() resolves against the document, not the script
+                target = resolve(page, url)
+                if target:
+                    add(target, "data")
+
+    add(page, "document")
+    for url, hint in parser.requests:
+        target = resolve(page, url)
+        if target:
+            add(target, hint)
+    if missing:
+        raise SystemExit(f"{page.relative_to(ROOT)} references missing files: "
+                         + ", ".join(str(p.relative_to(ROOT)) for p in missing))
+    return assets, parser.render_blocking, parser.external
+
+
+def budgets_for(config, page):
+    rel = page.relative_to(ROOT).as_posix()
+    return {**config.get("default", {}), **config.get("pages", {}).get(rel, {})}
+
+
+def measure(assets, blocking, external):
+    """Metric name -> value, matching the budget keys."""
+    metrics = {
+        "total_kb": sum(a["compressed"] for a in assets) / 1024,
+        "requests": len(assets) + len(external),
+        "render_blocking": len(blocking),
+    }
+    for kind in ("document", "stylesheet", "script", "image", "font", "data"):
+        metrics[f"{kind}_kb"] = sum(a["compressed"] for a in assets if a["type"] == kind) / 1024
+    return metrics
+
+
+def print_breakdown(page, assets, blocking, external):
+    print(f"  {'type':<11} {'raw':>10} {'compressed':>11}  asset")
+    for asset in sorted(assets, key=lambda a: -a["compressed"]):
+        print(f"  {asset['type']:<11} {asset['raw'] / 1024:>8.1f}KB {asset['compressed'] / 1024:>9.1f}KB  "
+              f"{asset['path'].relative_to(ROOT).as_posix()}")
+    for url in external:
+        print(f"  {'external':<11} {'?':>10} {'?':>11}  {url}")
+    if blocking:
+        print("  render-blocking: " + ", ".join(blocking))
+
+
+def check(page, config, verbose):
+    assets, blocking, external = collect(page)
+    metrics = measure(assets, blocking, external)
+    budgets = budgets_for(config, page)
+    over = [(name, metrics[name], limit) for name, limit in budgets.items()
+            if name in metrics and metrics[name] > limit]
+
+    raw = sum(a["raw"] for a in assets) / 1024
+    status = "OVER BUDGET" if over else "ok"
+    print(f"{page.relative_to(ROOT).as_posix()}: {metrics['total_kb']:.1f} KB compressed "
+          f"({raw:.1f} KB raw), {metrics['requests']} requests, "
+          f"{metrics['render_blocking']} render-blocking - {status}")
+    for name, value, limit in over:
+        unit = " KB" if name.endswith("_kb") else ""
+        print(f"  {name}: {value:.1f}{unit} > budget {limit}{unit}")
+    if over or verbose:
+        print_breakdown(page, assets, blocking, external)
+    return not over
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check pages against the performance budgets")
+    parser.add_argument("pages", nargs="*", help="pages to check (default: every page)")
+    parser.add_argument("--config", type=Path, default=CONFIG)
+    parser.add_argument("--verbose", action="store_true",
+                        help="print the per-asset breakdown for every page")
+    args = parser.parse_args()
+
+    if not args.config.exists():
+        raise SystemExit(f"Budget config not found: {args.config}")
+    config = json.loads(args.config.read_text(encoding="utf-8"))
+    pages = [Path(p).resolve() for p in args.pages] if args.pages else page_files()
+
+    failed = [page for page in pages if not check(page, config, args.verbose)]
+    if failed:
+        raise SystemExit(f"\n{len(failed)} page(s) over budget")
+    print("\nAll pages within budget")
+
+
+if __name__ == "__main__":
+    main()
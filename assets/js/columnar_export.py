@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Typed columnar export of the certificate catalog for notebooks and BI tools.
+
+Writes two tables to archived/exports/, so reports do not have to parse
+and flatten the nested learning-data.json:
+
+  - certificates: one row per certificate in export order, with the date
+    as a date, the duration also as integer minutes, the year as an
+    integer and domain / provider as categories
+  - certificate_skills: the skills exploded, one row per (certificate,
+    skill) with the skill's position, joined to certificates on
+    certificate_id = id
+
+The format is Parquet when pyarrow is installed (Arrow IPC if pyarrow was
+built without Parquet), and CSV otherwise. CSV cells are typed by
+convention: ISO dates, integers, and an empty cell for null.
+manifest.json lists every table's file, row count and column types (read
+the CSVs with those dtypes). The manifest also records a digest of the
+exported certificates, and an export is only rewritten when that digest
+or the format changes. publish-site.py runs the export after
+learning-data.json.
+
+    import pandas as pd
+    certificates = pd.read_parquet("archived/exports/certificates.parquet")
+
+    python assets/js/columnar_export.py [--format auto|parquet|arrow|csv] [--force]
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+from datetime import date
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional: the export falls back to CSV
+    pa = None
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow without Parquet support writes Arrow IPC
+    pq = None
+
+import catalog
+import certificate_record
+import learning_analytics
+
+ROOT = Path(__file__).resolve().parents[2]
+EXPORT_DIR = ROOT / "archived" / "exports"
+MANIFEST = EXPORT_DIR / "manifest.json"
+# Bump when the tables or their types change, so existing exports are rewritten
+EXPORT_VERSION = 1
+
+# Column types; "category" is a dictionary-encoded string
+TABLES = {
+    "certificates": {
+        "id": "int64",
+        "title": "string",
+        "path": "string",
+        "domain": "category",
+        "provider": "category",
+        "year": "int16",
+        "date": "date",
+        "duration": "string",
+        "minutes": "int32",
+        "skill_count": "int16",
+    },
+    "certificate_skills": {
+        "certificate_id": "int64",
+        "position": "int16",
+        "skill": "category",
+    },
+}
+SUFFIXES = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+
+
+def available_format():
+    if pq is not None:
+        return "parquet"
+    return "arrow" if pa is not None else "csv"
+
+
+def parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_year(value):
+    return int(value) if value and str(value).isdigit() else None
+
+
+def columns(certificates):
+    """{table: {column: values}} of certificates, typed as in TABLES."""
+    tables = {name: {column: [] for column in spec} for name, spec in TABLES.items()}
+    rows, skills = tables["certificates"], tables["certificate_skills"]
+    for cert in certificates:
+        cert_skills = cert.get("skills") or ()
+        for column, value in (("id", cert["id"]), ("title", cert["title"]), ("path", cert.get("path")),
+                              ("domain", cert.get("domain")), ("provider", cert.get("provider")),
+                              ("year", parse_year(cert.get("year"))), ("date", parse_date(cert.get("date"))),
+                              ("duration", cert.get("duration")),
+                              ("minutes", learning_analytics.duration_minutes(cert.get("duration"))),
+                              ("skill_count", len(cert_skills))):
+            rows[column].append(value)
+        for position, skill in enumerate(cert_skills):
+            skills["certificate_id"].append(cert["id"])
+            skills["position"].append(position)
+            skills["skill"].append(skill)
+    return tables
+
+
+def digest(certificates):
+    """Hash of what the export holds: the certificates and EXPORT_VERSION."""
+    records = [cert if isinstance(cert, certificate_record.Certificate)
+               else certificate_record.Certificate.from_dict(cert) for cert in certificates]
+    content = certificate_record.dumps({"certificates": records})
+    return hashlib.sha256(f"v{EXPORT_VERSION}\n".encode("utf-8") + content).hexdigest()
+
+
+def arrow_type(name):
+    if name == "category":
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.date32() if name == "date" else getattr(pa, name)()
+
+
+def arrow_table(name, values):
+    spec = TABLES[name]
+    arrays = [pa.array(values[column], arrow_type(kind)) if kind != "category"
+              else pa.array(values[column], pa.string()).dictionary_encode()
+              for column, kind in spec.items()]
+    return pa.Table.from_arrays(arrays, names=list(spec))
+
+
+def write_table(path, name, values, fmt):
+    if fmt == "parquet":
+        pq.write_table(arrow_table(name, values), path)
+    elif fmt == "arrow":
+        table = arrow_table(name, values)
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(TABLES[name])
+            # None -> empty cell, date -> ISO date
+            writer.writerows(zip(*values.values()))
+
+
+def load_manifest():
+    try:
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def export(certificates, fmt=None, force=False):
+    """Write the tables of certificates to EXPORT_DIR unless the export is
+    already up to date. Returns (manifest, paths written)."""
+    fmt = fmt or available_format()
+    source = digest(certificates)
+    previous = load_manifest()
+    if not force and previous.get("source") == source and previous.get("format") == fmt \
+            and all((EXPORT_DIR / table["file"]).exists() for table in previous["tables"].values()):
+        return previous, []
+
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    tables = columns(certificates)
+    manifest = {"version": EXPORT_VERSION, "source": source, "format": fmt, "tables": {}}
+    written = []
+    for name, values in tables.items():
+        path = EXPORT_DIR / (name + SUFFIXES[fmt])
+        write_table(path, name, values, fmt)
+        written.append(path)
+        manifest["tables"][name] = {"file": path.name, "rows": len(next(iter(values.values()))),
+                                    "columns": TABLES[name]}
+    # Files of a previous export in another format
+    for table in previous.get("tables", {}).values():
+        stale = EXPORT_DIR / table["file"]
+        if stale not in written and stale.exists():
+            stale.unlink()
+    MANIFEST.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    written.append(MANIFEST)
+    return manifest, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the certificate catalog as typed columnar tables")
+    parser.add_argument("--format", choices=["auto", *SUFFIXES], default="auto",
+                        help="output format (auto: Parquet with pyarrow, CSV without)")
+    parser.add_argument("--force", action="store_true", help="rewrite even if the export is up to date")
+    args = parser.parse_args()
+    if args.format in ("parquet", "arrow") and (pa is None or args.format == "parquet" and pq is None):
+        raise SystemExit(f"--format {args.format} needs pyarrow (pip install pyarrow)")
+
+    conn = catalog.connect()
+    certificates = catalog.certificates(conn)
+    conn.close()
+    manifest, written = export(certificates, None if args.format == "auto" else args.format, args.force)
+    for name, table in manifest["tables"].items():
+        print(f"{EXPORT_DIR.relative_to(ROOT) / table['file']}: {table['rows']} rows")
+    print(f"{manifest['format']} export {'written' if written else 'up to date'}")
+
+
+if __name__ == "__main__":
+    main()
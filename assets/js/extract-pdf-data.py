@@ -2,14 +2,76 @@
 """
 Extract certificate data from PDF files and update learning-data.json
 This script reads PDF files to extract: date, title, skills, duration
+
+A cheap classifier runs first: file size, page count and producer metadata
+rule out study material (handouts, notes, slide decks) before any text is
+extracted. The remaining PDFs are dispatched to one provider parser
+(LinkedIn Learning, Coursera, Udemy or a generic certificate parser) by a
+fingerprint of the first kilobyte of their first page. Excluded files are
+listed at the end with the reason. LinkedIn Learning certificates are read
+by layout: the text runs of the first page, with their positions, are
+pulled from the content stream and only the template's regions (title
+block, date line, skill pills) are read, one skill per pill.
+
+PDFs are read in isolated worker processes with a wall-clock timeout and a
+memory cap per file. A worker that exceeds either limit (or crashes) is
+killed and replaced, and the file is quarantined: it is listed in
+archived/.extraction-quarantine.json and skipped by later runs until
+--retry-quarantined is given.
+
+Each run writes its metrics (PDFs discovered/parsed/cached/failed/excluded,
+per-file stage durations, bytes read, output size) in Prometheus
+textfile-collector format to $PROMETHEUS_TEXTFILE_DIR/learning_extract.prom,
+or archived/.extraction-metrics.prom when that variable is not set.
+
+Certificates are upserted into the SQLite catalog (see catalog.py), which
+is the canonical store: rows keep their id, only changed rows are written,
+rows of PDFs that were deleted or are now excluded are removed, and
+assets/data/learning-data.json is exported from the catalog. The text of
+the certificates is kept in a BM25 full-text index
+(archived/.certificate-text-index.sqlite, see text_search.py) that is
+updated in the same pass.
+
+Extraction can be split across machines: `--shard i/N` (0 <= i < N) only
+handles the PDFs whose path hashes to shard i and writes a partial result
+(archived/.extraction-shard-i-of-N.json by default) instead of touching the
+catalog; `--merge PARTIAL...` combines the partial files of all N shards
+into the catalog and exports learning-data.json as a single run would.
+
+The parser rules (date, duration, stop, skip, metadata and known-skill
+patterns) are instrumented: `--profile-rules` counts hits and time per rule
+over a run and lists the dead and the most expensive rules, and
+`--explain FILE` prints the fields extracted from one PDF with the rules
+and template regions that produced each.
+
+The raw text of every PDF is kept in a compressed store keyed by the PDF's
+SHA-256 (archived/.pdf-text-store.json.gz). After changing a text-to-field
+rule, `--reparse` re-runs dispatch and field extraction from that store
+without opening the PDFs (only new or changed files are read):
+
+    python assets/js/extract-pdf-data.py [--reparse] [--workers N]
+        [--timeout SECONDS] [--max-memory MB] [--retry-quarantined]
+        [--metrics-file PATH] [--shard i/N [--partial PATH]] [--profile-rules]
+    python assets/js/extract-pdf-data.py --merge PARTIAL [PARTIAL ...]
+    python assets/js/extract-pdf-data.py --explain FILE
 """
 
 import os
+import argparse
+import gzip
+import hashlib
 import json
+import multiprocessing
 import re
+import time
+from multiprocessing.connection import wait
 from pathlib import Path
 from datetime import datetime
 
+import catalog
+import certificate_record
+import text_search
+
 # Try to import PDF libraries
 try:
     import pypdf
@@ -26,6 +88,12 @@ except ImportError:
             PDF_LIB = None
             print("Warning: No PDF library found. Install with: pip install pypdf")
 
+# Per-file memory caps need POSIX resource limits
+try:
+    import resource
+except ImportError:
+    resource = None
+
 def extract_text_from_pdf(pdf_path):
     """Extract text from PDF using available library."""
     if not PDF_LIB:
@@ -46,25 +114,601 @@ def extract_text_from_pdf(pdf_path):
                 for page in pdf_reader.pages:
                     text += page.extract_text()
                 return text
+    except MemoryError:
+        # Let the worker report it; the process is recycled
+        raise
     except Exception as e:
         print(f"Error reading {pdf_path.name}: {e}")
         return None
 
+# Certificates are single-page (two at most) and a few hundred KB
+MAX_CERTIFICATE_PAGES = 2
+MAX_CERTIFICATE_BYTES = 2 * 1024 * 1024
+# Producers of documents, never of certificates (lowercase substrings)
+DOCUMENT_PRODUCERS = [
+    'google docs renderer', 'microsoft word', 'microsoft® word', 'microsoft® powerpoint',
+    'libreoffice', 'openoffice', 'pdftex', 'xetex', 'luatex', 'acrobat pdfmaker',
+]
+
+def metadata_exclusion(size, producer=None, page_count=None):
+    """Why a PDF cannot be a certificate judging by its size, page count and
+    producer alone, or None if it may be one."""
+    if size > MAX_CERTIFICATE_BYTES:
+        return f"{size / 1024 / 1024:.1f} MB file"
+    if page_count is not None:
+        if page_count == 0:
+            return "unreadable"
+        if page_count > MAX_CERTIFICATE_PAGES:
+            return f"{page_count} pages"
+    producer_lower = (producer or '').lower()
+    for document_producer in DOCUMENT_PRODUCERS:
+        if document_producer in producer_lower:
+            return f"produced by {producer}"
+    return None
+
+# Layout-aware reading of the LinkedIn Learning certificate template: the
+# text-showing operators of the first page's content stream are scanned
+# directly (no glyph-width layout like extract_text) into runs of
+# (x, y, font size, text), one per positioned text object. The template is
+# read by region: the title lines, the line under "Course completed by"
+# (date, bullet, duration), and the skill pills under "Top skills covered",
+# one skill per run.
+CONTENT_TOKEN = re.compile(
+    rb'\((?:[^()\\]|\\.|\((?:[^()\\]|\\.)*\))*\)'   # literal string (one nesting level)
+    rb'|<[0-9A-Fa-f\s]*>(?!>)'                    # hex string
+    rb'|<<|>>|\[|\]'
+    rb'|/[^\s/\[\]()<>{}%]*'                      # name
+    rb'|[-+]?(?:\d+\.?\d*|\.\d+)'                 # number
+    rb'|[A-Za-z\'"*][A-Za-z0-9*]*'                # operator
+    rb'|%[^\r\n]*', re.DOTALL)
+INLINE_IMAGE = re.compile(rb'\bBI\b.*?\bID\s.*?\sEI\b', re.DOTALL)
+LITERAL_ESCAPES = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f'}
+LITERAL_ESCAPE = re.compile(rb'\\([0-7]{1,3}|\r\n|[\s\S])')
+CMAP_CODESPACE = re.compile(rb'begincodespacerange\s*<([0-9A-Fa-f]+)>')
+CMAP_BFCHAR = re.compile(rb'beginbfchar(.*?)endbfchar', re.DOTALL)
+CMAP_BFRANGE = re.compile(rb'beginbfrange(.*?)endbfrange', re.DOTALL)
+CMAP_HEX = re.compile(rb'<([0-9A-Fa-f]*)>|\[|\]')
+# Skill pill lines follow each other (and the header) this many header
+# font sizes apart at most
+SKILL_LINE_GAP = 2.5
+# Runs whose baselines differ by less than this belong to one line
+LINE_TOLERANCE = 2
+
+def literal_bytes(token):
+    """Bytes of a literal string token, escapes resolved."""
+    def unescape(match):
+        escape = match.group(1)
+        if escape[:1].isdigit():
+            return bytes([int(escape, 8) & 0xFF])
+        if escape in (b'\r\n', b'\n', b'\r'):
+            return b''  # line continuation
+        return LITERAL_ESCAPES.get(escape, escape)
+    return LITERAL_ESCAPE.sub(unescape, token[1:-1])
+
+def string_bytes(token):
+    if token[:1] == b'(':
+        return literal_bytes(token)
+    digits = re.sub(rb'\s', b'', token[1:-1])
+    return bytes.fromhex((digits + b'0' * (len(digits) % 2)).decode())
+
+def utf16_hex(digits):
+    return bytes.fromhex(digits.decode()).decode('utf-16-be', 'replace')
+
+def parse_to_unicode(data):
+    """(code width in bytes, {code: text}) from a ToUnicode CMap."""
+    codespace = CMAP_CODESPACE.search(data)
+    width = len(codespace.group(1)) // 2 if codespace else 2
+    mapping = {}
+    for section in CMAP_BFCHAR.findall(data):
+        pairs = CMAP_HEX.findall(section)
+        for src, dst in zip(pairs[::2], pairs[1::2]):
+            mapping[int(src, 16)] = utf16_hex(dst)
+    for section in CMAP_BFRANGE.findall(data):
+        tokens = [m.group(0) for m in CMAP_HEX.finditer(section)]
+        i = 0
+        while i + 2 < len(tokens):
+            lo, hi = int(tokens[i][1:-1], 16), int(tokens[i + 1][1:-1], 16)
+            if tokens[i + 2] == b'[':
+                end = tokens.index(b']', i + 3)
+                for code, dst in zip(range(lo, hi + 1), tokens[i + 3:end]):
+                    mapping[code] = utf16_hex(dst[1:-1])
+                i = end + 1
+            else:
+                start = bytes.fromhex(tokens[i + 2][1:-1].decode())
+                base = int.from_bytes(start[-2:], 'big')
+                for offset in range(hi - lo + 1):
+                    dst = start[:-2] + (base + offset).to_bytes(2, 'big')
+                    mapping[lo + offset] = dst.decode('utf-16-be', 'replace')
+                i += 3
+    return width, mapping
+
+def font_decoder(font):
+    """Function decoding a shown string's bytes for a font, or None when
+    the font has neither a ToUnicode CMap nor a simple Latin encoding."""
+    font = font.get_object()
+    if '/ToUnicode' in font:
+        width, mapping = parse_to_unicode(font['/ToUnicode'].get_object().get_data())
+        def decode(data):
+            codes = (int.from_bytes(data[i:i + width], 'big') for i in range(0, len(data), width))
+            return ''.join(mapping.get(code, '') for code in codes)
+        return decode
+    if font.get('/Subtype') in ('/Type1', '/TrueType') and \
+            font.get('/Encoding') in (None, '/WinAnsiEncoding', '/StandardEncoding'):
+        return lambda data: data.decode('cp1252', 'replace')
+    return None
+
+def page_runs(page):
+    """Text runs [x, y, size, text] of a page in content-stream order, or
+    None when a font cannot be decoded. Runs drawn twice at (almost) the
+    same position are kept once."""
+    fonts = (page.get('/Resources') or {}).get('/Font') or {}
+    fonts = fonts.get_object() if hasattr(fonts, 'get_object') else fonts
+    decoders = {}
+    contents = page.get_contents()
+    if contents is None:
+        return []
+    ctm, ctm_stack = (1, 0, 0, 1, 0, 0), []
+    tm = tlm = (1, 0, 0, 1, 0, 0)
+    decode, size, leading = None, 0, 0
+    runs, seen, operands = [], {}, []
+    
+    def show(strings):
+        a, b, c, d, e, f = tm
+        x = e * ctm[0] + f * ctm[2] + ctm[4]
+        y = e * ctm[1] + f * ctm[3] + ctm[5]
+        text = ''.join(decode(s) for s in strings)
+        if runs and runs[-1][:2] == [round(x, 1), round(y, 1)]:
+            runs[-1][3] += text  # same text object, not repositioned
+            return
+        runs.append([round(x, 1), round(y, 1), round(size * abs(d or a), 1), text])
+    
+    # Inline image data is binary; drop it before tokenizing
+    data = INLINE_IMAGE.sub(b' ', contents.get_data())
+    for match in CONTENT_TOKEN.finditer(data):
+        token = match.group(0)
+        first = token[:1]
+        if first == b'%':
+            continue
+        if not (first.isalpha() or first in b'\'"*') or token in (b'true', b'false', b'null'):
+            operands.append(token)
+            continue
+        op = token
+        if op == b'q':
+            ctm_stack.append(ctm)
+        elif op == b'Q':
+            ctm = ctm_stack.pop() if ctm_stack else ctm
+        elif op == b'cm' and len(operands) >= 6:
+            a, b, c, d, e, f = (float(v) for v in operands[-6:])
+            A, B, C, D, E, F = ctm
+            ctm = (a * A + b * C, a * B + b * D, c * A + d * C, c * B + d * D,
+                   e * A + f * C + E, e * B + f * D + F)
+        elif op == b'BT':
+            tm = tlm = (1, 0, 0, 1, 0, 0)
+        elif op == b'Tf' and len(operands) >= 2:
+            name = operands[-2].decode('latin-1')
+            if name not in decoders:
+                font = fonts.get(name)
+                decoders[name] = font_decoder(font) if font is not None else None
+            decode, size = decoders[name], float(operands[-1])
+            if decode is None:
+                return None
+        elif op == b'Tm' and len(operands) >= 6:
+            tm = tlm = tuple(float(v) for v in operands[-6:])
+        elif op in (b'Td', b'TD') and len(operands) >= 2:
+            tx, ty = float(operands[-2]), float(operands[-1])
+            if op == b'TD':
+                leading = -ty
+            a, b, c, d, e, f = tlm
+            tm = tlm = (a, b, c, d, tx * a + ty * c + e, tx * b + ty * d + f)
+        elif op == b'TL' and operands:
+            leading = float(operands[-1])
+        elif op in (b'T*', b"'", b'"'):
+            a, b, c, d, e, f = tlm
+            tm = tlm = (a, b, c, d, -leading * c + e, -leading * d + f)
+        if op in (b'Tj', b"'", b'"', b'TJ') and decode is not None and operands:
+            if op == b'TJ':
+                strings = [string_bytes(t) for t in operands if t[:1] in (b'(', b'<') and t != b'<<']
+            else:
+                strings = [string_bytes(operands[-1])]
+            show(strings)
+        operands = []
+    
+    unique = []
+    for run in runs:
+        key = run[3].strip()
+        if not key:
+            continue
+        positions = seen.setdefault(key, [])
+        if any(abs(run[0] - x) < 1 and abs(run[1] - y) < 1 for x, y in positions):
+            continue
+        positions.append((run[0], run[1]))
+        unique.append(run)
+    return unique
+
+def run_lines(runs):
+    """Runs grouped into lines, top to bottom, each line left to right."""
+    lines = []
+    for run in sorted(runs, key=lambda r: (-r[1], r[0])):
+        if lines and abs(lines[-1][0][1] - run[1]) < LINE_TOLERANCE:
+            lines[-1].append(run)
+        else:
+            lines.append([run])
+    return [sorted(line, key=lambda r: r[0]) for line in lines]
+
+def runs_text(runs):
+    """Plain text of runs in reading order, one run per line."""
+    return '\n'.join(run[3].strip() for line in run_lines(runs) for run in line) + '\n'
+
+def linkedin_regions(runs):
+    """The LinkedIn template's regions as {'title': [lines], 'date_line':
+    [texts], 'skills': [texts]}, or None when the runs do not follow it.
+    
+    Regions are found relative to the "Course completed by" line (the title
+    is set larger above it, the date line follows it) and the "Top skills
+    covered" header (the skill pills follow it, one run each, on lines at
+    most SKILL_LINE_GAP header heights apart), so both the plain and the
+    CPE-credit variant of the template are read.
+    """
+    lines = run_lines(runs)
+    anchor = next((i for i, line in enumerate(lines)
+                   if line[0][3].strip().lower().startswith('course completed by')), None)
+    if anchor is None or anchor + 1 >= len(lines):
+        return None
+    body_size = lines[anchor][0][2]
+    title = [' '.join(run[3].strip() for run in line) for line in lines[:anchor]
+             if line[0][2] > body_size]
+    if not title:
+        return None
+    skills = []
+    header = next((i for i, line in enumerate(lines)
+                   if line[0][3].strip().lower() == 'top skills covered'), None)
+    if header is not None:
+        previous, pill_size = lines[header][0], None
+        for line in lines[header + 1:]:
+            if previous[1] - line[0][1] > SKILL_LINE_GAP * lines[header][0][2] \
+                    or line[0][2] != (pill_size or line[0][2]):
+                break
+            pill_size = line[0][2]
+            skills.extend(run[3].strip() for run in line)
+            previous = line[0]
+    return {
+        'title': title,
+        'date_line': [run[3].strip() for run in lines[anchor + 1]],
+        'skills': skills,
+    }
+
+def probe_pdf(pdf_path, size):
+    """Read only what classification and dispatch need: (producer, page
+    count, first page text, first page runs). The first page is not
+    extracted when the metadata already rules the file out. With pypdf, a
+    first page that follows the LinkedIn template is read from its runs
+    (one run per line) instead of extract_text; runs is None otherwise."""
+    if not PDF_LIB:
+        return None, 0, None, None
+    
+    try:
+        if PDF_LIB == 'pdfplumber':
+            with pdfplumber.open(pdf_path) as pdf:
+                producer = (pdf.metadata or {}).get('Producer')
+                if metadata_exclusion(size, producer, len(pdf.pages)):
+                    return producer, len(pdf.pages), None, None
+                return producer, len(pdf.pages), pdf.pages[0].extract_text() or "", None
+        else:
+            # pypdf or PyPDF2
+            with open(pdf_path, 'rb') as file:
+                pdf_reader = pypdf.PdfReader(file)
+                producer = (pdf_reader.metadata or {}).get('/Producer')
+                page_count = len(pdf_reader.pages)
+                if metadata_exclusion(size, producer, page_count):
+                    return producer, page_count, None, None
+                page = pdf_reader.pages[0]
+                runs = page_runs(page) if PDF_LIB == 'pypdf' else None
+                if runs and linkedin_regions(runs):
+                    return producer, page_count, runs_text(runs), runs
+                return producer, page_count, page.extract_text() or "", None
+    except MemoryError:
+        raise
+    except Exception as e:
+        print(f"Error reading {pdf_path.name}: {e}")
+        return None, 0, None, None
+
+# Raw PDF text keyed by the SHA-256 of the PDF bytes (gitignored via *.gz)
+TEXT_STORE = Path('archived/.pdf-text-store.json.gz')
+TEXT_STORE_VERSION = 2
+
+def file_hash(pdf_path):
+    """SHA-256 of a PDF's bytes; identical files share one store entry."""
+    return hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+
+def load_text_store():
+    """{hash: {producer, page_count, first_page, text, runs}} from TEXT_STORE."""
+    if not TEXT_STORE.exists():
+        return {}
+    try:
+        with gzip.open(TEXT_STORE, 'rt', encoding='utf-8') as f:
+            store = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring unreadable {TEXT_STORE}: {e}")
+        return {}
+    # Text from another PDF library (or store layout) is not comparable
+    if store.get('version') != TEXT_STORE_VERSION or store.get('library') != PDF_LIB:
+        return {}
+    return store.get('entries', {})
+
+def save_text_store(entries):
+    payload = {'version': TEXT_STORE_VERSION, 'library': PDF_LIB, 'entries': entries}
+    data = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    with open(TEXT_STORE, 'wb') as f:
+        f.write(gzip.compress(data.encode('utf-8'), 9, mtime=0))
+
+def read_pdf_record(pdf_path, size):
+    """Read a PDF into a store record. The full text of multi-page PDFs is
+    only extracted when a parser claims the file."""
+    producer, page_count, first_page, runs = probe_pdf(pdf_path, size)
+    record = {
+        'producer': producer,
+        'page_count': page_count,
+        'first_page': first_page,
+        'text': first_page if page_count == 1 else None,
+        'runs': runs,
+    }
+    if record['text'] is None and classify_pdf(size, record)[0]:
+        record['text'] = extract_text_from_pdf(pdf_path) or ""
+    return record
+
+def needs_read(record, size):
+    """Whether a stored record lacks something the current rules need."""
+    if record is None:
+        return True
+    if record['first_page'] is None:
+        return not metadata_exclusion(size, record['producer'], record['page_count'])
+    return record['text'] is None and classify_pdf(size, record)[0] is not None
+
+# Canonical certificate store and the dataset exported from it
+CATALOG = Path('archived/learning-catalog.sqlite')
+OUTPUT_FILE = Path('assets/data/learning-data.json')
+
+def update_catalog(certificates, excluded_paths, present_paths):
+    """Upsert certificates into the catalog, remove the rows of archived PDFs
+    that are excluded or no longer present, and export OUTPUT_FILE.
+    Returns ({operation: rows}, catalog metadata)."""
+    # New rows go on top of the catalog, newest year first, then by title
+    certificates = sorted(certificates, key=lambda c: (c['year'], c['title'], c['path']), reverse=True)
+    conn = catalog.connect(CATALOG)
+    with conn:
+        inserted, updated, unchanged = catalog.upsert(conn, certificates)
+        stale = [row['id'] for row in conn.execute(
+                     "SELECT id, path FROM certificates WHERE path LIKE 'archived/%'")
+                 if row['path'] in excluded_paths or row['path'] not in present_paths]
+        removed = catalog.delete(conn, stale)
+        catalog.export_json(conn, OUTPUT_FILE)
+        stats = catalog.metadata(conn)
+    conn.close()
+    changes = {'inserted': inserted, 'updated': updated, 'unchanged': unchanged, 'removed': removed}
+    return changes, stats
+
+# Full-text index of the certificates' text (see text_search.py)
+TEXT_INDEX = Path('archived/.certificate-text-index.sqlite')
+
+def update_text_index(certificates, store):
+    """Bring the full-text index up to date with the certificates' text."""
+    texts = {}
+    for certificate in certificates:
+        record = store.get(certificate['source_hash'])
+        if record is None:
+            print(f"  Text index: not updated, {certificate['path']} is missing from {TEXT_STORE}")
+            return
+        if record['text']:
+            texts[certificate['source_hash']] = record['text']
+    conn = text_search.connect(TEXT_INDEX)
+    with conn:
+        added, removed = text_search.update(conn, texts)
+    conn.close()
+    print(f"  Text index: {added} added, {removed} removed, {len(texts)} documents")
+
+def print_catalog_update(changes, stats, from_pdfs):
+    print(f"\nâœ“ Generated {OUTPUT_FILE} with {stats['total']} certificates "
+          f"({from_pdfs} from PDFs)")
+    print(f"  Catalog: {', '.join(f'{count} {operation}' for operation, count in changes.items())}")
+    print(f"  Domains: {stats['domains']}")
+    print(f"  Years: {', '.join(stats['years'])}")
+
+# Partial results of `--shard i/N` runs
+PARTIAL_VERSION = 1
+
+def parse_shard(value):
+    """'i/N' -> (i, N) with 0 <= i < N."""
+    match = re.fullmatch(r'(\d+)/(\d+)', value)
+    if not match or not int(match.group(1)) < int(match.group(2)):
+        raise argparse.ArgumentTypeError(f"expected i/N with 0 <= i < N, got {value!r}")
+    return int(match.group(1)), int(match.group(2))
+
+def shard_of(pdf_file, count):
+    """Stable shard of a PDF: a hash of its path, the same on every machine."""
+    digest = hashlib.sha256(pdf_file.as_posix().encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count
+
+def default_partial_file(shard):
+    return Path(f'archived/.extraction-shard-{shard[0]}-of-{shard[1]}.json')
+
+def write_partial(path, shard, pdf_files, certificates, excluded):
+    payload = {
+        'version': PARTIAL_VERSION,
+        'library': PDF_LIB,
+        'shard': list(shard),
+        'files': sorted(pdf_file.as_posix() for pdf_file in pdf_files),
+        'excluded': sorted([pdf_file.as_posix(), reason] for pdf_file, reason in excluded),
+        'certificates': [c.to_dict() for c in sorted(certificates, key=lambda c: c.path)],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=1, ensure_ascii=False, sort_keys=True)
+
+def merge(partial_files):
+    """Combine the partial results of all N shards into the catalog."""
+    partials = []
+    for path in partial_files:
+        with open(path, encoding='utf-8') as f:
+            partial = json.load(f)
+        if partial.get('version') != PARTIAL_VERSION:
+            raise SystemExit(f"{path}: not a partial result of this script version")
+        partials.append(partial)
+    counts = {partial['shard'][1] for partial in partials}
+    if len(counts) != 1:
+        raise SystemExit(f"Partials come from different shard counts: {sorted(counts)}")
+    count = counts.pop()
+    shards = sorted(partial['shard'][0] for partial in partials)
+    if shards != list(range(count)):
+        missing = sorted(set(range(count)) - set(shards))
+        repeated = sorted({i for i in shards if shards.count(i) > 1})
+        raise SystemExit(f"Need each of the {count} shards exactly once "
+                         f"(missing: {missing or 'none'}, repeated: {repeated or 'none'})")
+    libraries = {partial['library'] for partial in partials}
+    if len(libraries) > 1:
+        print(f"Warning: shards were read with different PDF libraries: {sorted(libraries)}")
+    
+    # Keyed by path: a PDF belongs to one shard, so this only guards duplicates
+    certificates = {}
+    excluded, present = {}, set()
+    for partial in partials:
+        present.update(partial['files'])
+        excluded.update(partial['excluded'])
+        for certificate in map(certificate_record.Certificate.from_dict, partial['certificates']):
+            certificates[certificate.path] = certificate
+    changes, stats = update_catalog(list(certificates.values()), set(excluded), present)
+    print(f"Merged {len(partials)} shards: {len(present)} PDFs")
+    print_catalog_update(changes, stats, len(certificates))
+    update_text_index(certificates.values(), load_text_store())
+    if excluded:
+        print(f"\nExcluded {len(excluded)} non-certificate PDFs:")
+        for path, reason in sorted(excluded.items()):
+            print(f"  - {path} ({reason})")
+
+# Files whose worker timed out, ran out of memory or crashed
+QUARANTINE_REPORT = Path('archived/.extraction-quarantine.json')
+
+def load_quarantine():
+    if not QUARANTINE_REPORT.exists():
+        return {}
+    return json.loads(QUARANTINE_REPORT.read_text(encoding='utf-8'))
+
+def save_quarantine(quarantine):
+    if quarantine:
+        QUARANTINE_REPORT.write_text(json.dumps(quarantine, indent=2, ensure_ascii=False) + '\n',
+                                     encoding='utf-8')
+    elif QUARANTINE_REPORT.exists():
+        QUARANTINE_REPORT.unlink()
+
+def limit_memory(max_memory_mb):
+    """Cap this process's address space (POSIX only)."""
+    if resource is None or not max_memory_mb:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def worker_loop(conn, max_memory_mb):
+    """Worker process: read the PDFs sent over conn until it receives None."""
+    limit_memory(max_memory_mb)
+    while True:
+        task = conn.recv()
+        if task is None:
+            return
+        path, size = task
+        try:
+            conn.send(('ok', read_pdf_record(Path(path), size)))
+        except MemoryError:
+            conn.send(('memory', None))
+            return
+
+def start_worker(max_memory_mb):
+    parent_conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=worker_loop, args=(child_conn, max_memory_mb), daemon=True)
+    process.start()
+    child_conn.close()
+    return process, parent_conn
+
+def stop_worker(process, conn, kill=False):
+    if kill:
+        process.kill()
+    else:
+        try:
+            conn.send(None)
+        except OSError:
+            pass
+    process.join(5)
+    conn.close()
+
+def parse_workers(value):
+    """'N' -> N >= 1 worker processes."""
+    if not value.isdigit() or int(value) < 1:
+        raise argparse.ArgumentTypeError(f"expected a worker count of at least 1, got {value!r}")
+    return int(value)
+
+def read_isolated(tasks, workers, timeout, max_memory_mb):
+    """Read PDFs in worker processes, one file per worker at a time.
+    
+    tasks maps digest -> (pdf path, size). Yields (digest, status, record,
+    seconds) as files finish, with status 'ok', 'timeout', 'memory' or
+    'crashed'.
+    A worker that fails is killed and, while files are still queued,
+    replaced, so one bad file only costs its own timeout.
+    """
+    queue = list(tasks.items())
+    idle = [start_worker(max_memory_mb) for _ in range(min(workers, len(queue)))]
+    busy = {}  # conn -> (process, digest, started)
+    try:
+        while queue or busy:
+            while queue and idle:
+                process, conn = idle.pop()
+                digest, (pdf_file, size) = queue.pop()
+                conn.send((str(pdf_file), size))
+                busy[conn] = (process, digest, time.monotonic())
+            
+            next_deadline = min(started for _, _, started in busy.values()) + timeout
+            ready = wait(list(busy), timeout=max(0, next_deadline - time.monotonic()))
+            for conn in ready:
+                process, digest, started = busy.pop(conn)
+                try:
+                    status, record = conn.recv()
+                except (EOFError, OSError):
+                    status, record = 'crashed', None
+                if status == 'ok':
+                    idle.append((process, conn))
+                else:
+                    stop_worker(process, conn, kill=True)
+                    if queue:
+                        idle.append(start_worker(max_memory_mb))
+                yield digest, status, record, time.monotonic() - started
+            
+            now = time.monotonic()
+            for conn, (process, digest, started) in list(busy.items()):
+                if started + timeout <= now:
+                    del busy[conn]
+                    stop_worker(process, conn, kill=True)
+                    if queue:
+                        idle.append(start_worker(max_memory_mb))
+                    yield digest, 'timeout', None, now - started
+    finally:
+        for process, conn in idle:
+            stop_worker(process, conn)
+        for conn, (process, _, _) in busy.items():
+            stop_worker(process, conn, kill=True)
+
+# Patterns for dates like "May 17, 2025 at 07:24AM UTC"
+DATE_PATTERNS = [
+    r'(\w+)\s+(\d+),\s+(\d{4})\s+at\s+(\d+):(\d+)[AP]M',
+    r'(\w+)\s+(\d+),\s+(\d{4})',
+    r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',
+    r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',
+]
+
 def extract_date_from_text(text):
     """Extract completion date from PDF text."""
     if not text:
         return None, None
     
-    # Patterns for dates like "May 17, 2025 at 07:24AM UTC"
-    patterns = [
-        (r'(\w+)\s+(\d+),\s+(\d{4})\s+at\s+(\d+):(\d+)[AP]M', '%B %d, %Y'),
-        (r'(\w+)\s+(\d+),\s+(\d{4})', '%B %d, %Y'),
-        (r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', '%m/%d/%Y'),
-        (r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})', '%Y-%m-%d'),
-    ]
-    
-    for pattern, date_format in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for index, pattern in enumerate(DATE_PATTERNS):
+        match = rule_search('date_patterns', index, text)
         if match:
             try:
                 date_str = match.group(0).split(' at')[0].strip()
@@ -150,35 +794,40 @@ def extract_title_from_text(text):
     
     return None
 
+# Patterns: "1 hour 27 minutes", "30 minutes", "1h 27m", etc.
+DURATION_PATTERNS = [
+    (r'(\d+)\s+hour[s]?\s+(\d+)\s+minute[s]?', lambda m: f"{m.group(1)}h {m.group(2)}m"),
+    (r'(\d+)\s+hour[s]?', lambda m: f"{m.group(1)}h"),
+    (r'(\d+)\s+minute[s]?', lambda m: f"{m.group(1)}m"),
+    (r'(\d+)h\s*(\d+)m', lambda m: f"{m.group(1)}h {m.group(2)}m"),
+    (r'(\d+)h', lambda m: f"{m.group(1)}h"),
+    (r'(\d+)m', lambda m: f"{m.group(1)}m"),
+]
+
 def extract_duration_from_text(text):
     """Extract course duration from PDF text."""
     if not text:
         return None
     
-    # Patterns: "1 hour 27 minutes", "30 minutes", "1h 27m", etc.
-    patterns = [
-        (r'(\d+)\s+hour[s]?\s+(\d+)\s+minute[s]?', lambda m: f"{m.group(1)}h {m.group(2)}m"),
-        (r'(\d+)\s+hour[s]?', lambda m: f"{m.group(1)}h"),
-        (r'(\d+)\s+minute[s]?', lambda m: f"{m.group(1)}m"),
-        (r'(\d+)h\s*(\d+)m', lambda m: f"{m.group(1)}h {m.group(2)}m"),
-        (r'(\d+)h', lambda m: f"{m.group(1)}h"),
-        (r'(\d+)m', lambda m: f"{m.group(1)}m"),
-    ]
-    
-    for pattern, formatter in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for index, (pattern, formatter) in enumerate(DURATION_PATTERNS):
+        match = rule_search('duration_patterns', index, text)
         if match:
             return formatter(match)
     
     return None
 
-def format_skill_name(skill):
-    """Format a skill name to proper title case."""
+def format_skill_name(skill, pill=False):
+    """Format a skill name to proper title case.
+    
+    A pill (one skill of the template's skills region) keeps its
+    parentheses, as in "Artificial Intelligence (AI)".
+    """
     if not skill:
         return None
     
     # Clean up
-    skill = skill.strip('â€¢,.:;()[]').strip()
+    punctuation = 'â€¢,.:;[]' if pill else 'â€¢,.:;()[]'
+    skill = skill.strip(punctuation).strip()
     
     # Handle special cases
     # Preserve acronyms like "AI", "API", "SQL", etc.
@@ -197,27 +846,206 @@ def format_skill_name(skill):
     lowercase_words = {'for', 'and', 'or', 'the', 'of', 'in', 'on', 'at', 'to', 'a', 'an', 'as', 'by', 'with'}
     
     for i, word in enumerate(words):
-        word_clean = word.strip('â€¢,.:;()[]').strip()
+        word_clean = word.strip(punctuation).strip()
         if not word_clean:
             continue
         
-        word_lower = word_clean.lower()
+        # Cased without the parentheses a pill word keeps, e.g. "(LLMs)"
+        core = word_clean.strip('()') or word_clean
+        word_lower = core.lower()
         
         # If it's an acronym (all caps, 2-5 chars), keep it uppercase
-        if word_clean.isupper() and 2 <= len(word_clean) <= 5:
-            formatted_words.append(word_clean)
+        if core.isupper() and 2 <= len(core) <= 5:
+            formatted = core
         # If it's mixed case (like "JavaScript"), preserve it
-        elif word_clean[0].isupper() and any(c.islower() for c in word_clean[1:]):
-            formatted_words.append(word_clean)
+        elif core[0].isupper() and any(c.islower() for c in core[1:]):
+            formatted = core
         # If it's a lowercase word in the middle of phrase (not first word)
         elif i > 0 and word_lower in lowercase_words:
-            formatted_words.append(word_lower)
+            formatted = word_lower
         # Otherwise, capitalize first letter
         else:
-            formatted_words.append(word_clean.capitalize())
+            formatted = core.capitalize()
+        formatted_words.append(word_clean.replace(core, formatted, 1))
     
     return ' '.join(formatted_words)
 
+# Header and its ':'/whitespace run, which must hold a line break: headers
+# without one fail inside the regex engine instead of in a Python loop.
+# Only the header words ignore case; the run is a plain class.
+SKILL_HEADER = re.compile(r'(?i:Top\s+skills\s+covered)(?=[:\s]*\n)([:\s]*)')
+
+def find_skill_section(text):
+    """Lines after a "Top skills covered" header, up to the first blank line.
+    
+    Linear time (backtracking stays within one header's run). The header
+    must be followed by ':'/whitespace containing a line break; the section
+    starts after the last line break of that run that is followed by a
+    non-empty line.
+    Returns None when no header qualifies.
+    """
+    for header in SKILL_HEADER.finditer(text):
+        gap = header.group(1)
+        if header.end() == len(text):
+            # Trailing line breaks cannot start a (non-empty) section
+            gap = gap.rstrip('\n')
+        newline = gap.rfind('\n')
+        if newline == -1:
+            continue
+        start = header.start(1) + newline + 1
+        blank = text.find('\n\n', start)
+        return text[start:] if blank == -1 else text[start:blank + 1]
+    return None
+
+# Patterns that indicate we should stop processing (metadata lines)
+STOP_PATTERNS = [
+    r'Certificate\s+ID',
+    r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+Head',  # Signature lines like "Shea Hanson Head"
+    r'^[A-Z][a-z]+\s+Of\s+',  # Title fragments like "Head Of Learning"
+    r'^[A-Z][a-z]+\s+Strategy$',  # "Content Strategy"
+    r'^\d+[a-z]+\s+\d+[a-z]+$',  # Duration like "48m" or "1h 55m"
+    r'^\d{1,2}[-/]\d{1,2}[-/]\d{4}',  # Dates
+    r'^[A-Z][a-z]+\s+\d+,\s+\d{4}',  # Dates like "Jan 18, 2026"
+]
+
+# Words/phrases to skip (metadata, not actual skills); substring matches
+SKIP_PHRASES = [
+    'certificate id', 'head of', 'learning content', 'content strategy',
+    'shea hanson', 'provider', 'linkedin learning', 'course completed',
+    'completed by', 'top skills covered', 'institute inc', 'institute',
+    'activity #', 'activity', 'inc', 'ltd', 'llc', 'corp', 'corporation',
+    'pdus', 'pdu', 'contact hours', 'contacthours'
+]
+
+# Patterns that indicate metadata (not skills)
+METADATA_PATTERNS = [
+    r'^[A-Z][a-z]+\s+Inc\.?$',  # "Institute Inc"
+    r'^[A-Z][a-z]+\s+Inc$',  # "Institute Inc"
+    r'Activity\s*#',  # "Activity #"
+    r'^#\s*\d+',  # "# 12345"
+    r'^\d+[a-z0-9]+$',  # Alphanumeric IDs like "4101x2z28f"
+    r'^[a-z]+\d+[a-z0-9]+$',  # Mixed alphanumeric IDs
+    r'^\d+[a-z]+\d+',  # Number-letter-number patterns
+    r'PDUs?/ContactHours?',  # "PDUs/ContactHours 1.00"
+    r'Contact\s+Hours?',  # "Contact Hours"
+    r'PDUs?',  # "PDU" or "PDUs"
+]
+
+# Known skill patterns to help split concatenated skills
+# These are common multi-word skills that should be kept together
+# Order matters: longer patterns first to match correctly
+KNOWN_SKILL_PATTERNS = [
+    r'Artificial\s+Intelligence\s+for\s+Business',
+    r'AI\s+for\s+Business\s+Analysis',
+    r'AI\s+for\s+Business',
+    r'Artificial\s+Intelligence\s+for\s+Business\s+Analysis',
+    r'Media\s+Literacy',
+    r'Media\s+Psychology',
+    r'Software\s+Testing',
+    r'Programming\s+Foundations',
+    r'Software\s+Quality\s+Assurance',
+    r'Quality\s+Assurance',
+    r'Microsoft\s+Copilot',
+    r'Security\s+Operations',
+    r'Security\s+Incident\s+Response',
+    r'Generative\s+AI',
+    r'Artificial\s+Intelligence',
+    r'Visual\s+Studio\s+Code',
+    r'Visual\s+Studio',
+    r'Personal\s+Development',
+    r'Critical\s+Thinking',
+    r'Digital\s+Transformation',
+    r'Cloud\s+Computing',
+    r'Interpersonal\s+Communication',
+    r'SQL\s+Database',
+    r'Design\s+AI',
+    r'Data\s+Analysis',
+    r'Business\s+Analysis',
+]
+
+# Rule groups instrumented by --profile-rules and --explain: name ->
+# (fields the group contributes to, rules). Patterns match case-insensitively,
+# skip phrases are substrings of the lowercased line.
+RULE_GROUPS = {
+    'date_patterns': (['year', 'date'], DATE_PATTERNS),
+    'duration_patterns': (['duration'], [pattern for pattern, _ in DURATION_PATTERNS]),
+    'stop_patterns': (['skills'], STOP_PATTERNS),
+    'skip_phrases': (['skills'], SKIP_PHRASES),
+    'metadata_patterns': (['skills'], METADATA_PATTERNS),
+    'known_skill_patterns': (['skills'], KNOWN_SKILL_PATTERNS),
+}
+COMPILED_RULES = {group: [re.compile(rule, re.IGNORECASE) for rule in rules]
+                  for group, (_, rules) in RULE_GROUPS.items() if group != 'skip_phrases'}
+# LinkedIn template regions (see linkedin_regions) and the fields read from them
+TEMPLATE_REGIONS = [('title', ['title']), ('date_line', ['year', 'date', 'duration']), ('skills', ['skills'])]
+
+# {(group, index): [evaluations, hits, seconds]} while --profile-rules runs
+RULE_STATS = None
+# [(group, index, matched text)] while --explain runs
+RULE_TRACE = None
+
+def record_rule(group, index, started, matched):
+    if RULE_STATS is not None:
+        stats = RULE_STATS.setdefault((group, index), [0, 0, 0.0])
+        stats[0] += 1
+        stats[1] += bool(matched)
+        stats[2] += time.perf_counter() - started
+    if RULE_TRACE is not None and matched:
+        RULE_TRACE.append((group, index, matched))
+
+def rule_search(group, index, text):
+    """re.search with rule `index` of `group`, counted when profiling."""
+    if RULE_STATS is None and RULE_TRACE is None:
+        return COMPILED_RULES[group][index].search(text)
+    started = time.perf_counter()
+    match = COMPILED_RULES[group][index].search(text)
+    record_rule(group, index, started, match and match.group(0))
+    return match
+
+def rule_finditer(group, index, text):
+    """Matches of rule `index` of `group` (a list when profiling, counted)."""
+    if RULE_STATS is None and RULE_TRACE is None:
+        return COMPILED_RULES[group][index].finditer(text)
+    started = time.perf_counter()
+    matches = list(COMPILED_RULES[group][index].finditer(text))
+    record_rule(group, index, started, ', '.join(m.group(0) for m in matches))
+    return matches
+
+def rule_contains(group, index, text):
+    """Whether skip phrase `index` occurs in text, counted when profiling."""
+    if RULE_STATS is None and RULE_TRACE is None:
+        return RULE_GROUPS[group][1][index] in text
+    started = time.perf_counter()
+    found = RULE_GROUPS[group][1][index] in text
+    record_rule(group, index, started, found and RULE_GROUPS[group][1][index])
+    return found
+
+def rule_label(group, index):
+    if group == 'template_regions':
+        return f"template_regions[{TEMPLATE_REGIONS[index][0]}]"
+    return f"{group}[{index}] {RULE_GROUPS[group][1][index]!r}"
+
+def print_rule_report(stats, top=10):
+    """Hits and time per rule, dead rules and the most expensive ones."""
+    print("\nRule coverage:")
+    for group, (_, rules) in RULE_GROUPS.items():
+        evaluated = [stats.get((group, i), [0, 0, 0.0]) for i in range(len(rules))]
+        hit = sum(1 for calls, hits, _ in evaluated if hits)
+        seconds = sum(t for _, _, t in evaluated)
+        print(f"  {group:<22}{hit:>4}/{len(rules):<4} rules hit  "
+              f"{sum(c for c, _, _ in evaluated):>8} evaluations  {seconds * 1000:>8.2f} ms")
+    dead = [(group, i, stats.get((group, i), [0])[0]) for group, (_, rules) in RULE_GROUPS.items()
+            for i in range(len(rules)) if not stats.get((group, i), [0, 0])[1]]
+    print(f"\nDead rules ({len(dead)}, never matched this run):")
+    for group, index, calls in dead:
+        print(f"  {rule_label(group, index)}"
+              f"{' (never evaluated)' if not calls else f' ({calls} evaluations)'}")
+    costly = sorted(stats.items(), key=lambda item: -item[1][2])[:top]
+    print(f"\nMost expensive rules:")
+    for (group, index), (calls, hits, seconds) in costly:
+        print(f"  {seconds * 1000:>8.2f} ms {calls:>8} evaluations {hits:>6} hits "
+              f"{seconds / calls * 1e6:>7.2f} us/eval  {rule_label(group, index)}")
+
 def extract_skills_from_text(text):
     """Extract skills from PDF text.
     
@@ -237,10 +1065,9 @@ def extract_skills_from_text(text):
     
     # Find "Top skills covered" section
     # Look for the header and capture lines until we hit stop patterns
-    skill_section_pattern = r'Top\s+skills\s+covered[:\s]*\n((?:[^\n]+\n?)+?)(?=\n\s*\n|\nCertificate\s+ID|\n[A-Z][a-z]+\s+[A-Z][a-z]+\s+Head|\n[A-Z][A-Z\s]{15,}|$)'
-    skill_match = re.search(skill_section_pattern, text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    skill_section = find_skill_section(text)
     
-    if not skill_match:
+    if skill_section is None:
         # Try alternative pattern - skills might be on same line
         alt_pattern = r'Top\s+skills\s+covered[:\s]+([^\n]+)'
         alt_match = re.search(alt_pattern, text, re.IGNORECASE)
@@ -255,45 +1082,11 @@ def extract_skills_from_text(text):
                         skills.append(formatted)
         return skills[:5]
     
-    skill_text = skill_match.group(1).strip()
+    skill_text = skill_section.strip()
     
     # Split by newlines - each line is potentially a skill
     lines = skill_text.split('\n')
     
-    # Patterns that indicate we should stop processing (metadata lines)
-    stop_patterns = [
-        r'Certificate\s+ID',
-        r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+Head',  # Signature lines like "Shea Hanson Head"
-        r'^[A-Z][a-z]+\s+Of\s+',  # Title fragments like "Head Of Learning"
-        r'^[A-Z][a-z]+\s+Strategy$',  # "Content Strategy"
-        r'^\d+[a-z]+\s+\d+[a-z]+$',  # Duration like "48m" or "1h 55m"
-        r'^\d{1,2}[-/]\d{1,2}[-/]\d{4}',  # Dates
-        r'^[A-Z][a-z]+\s+\d+,\s+\d{4}',  # Dates like "Jan 18, 2026"
-    ]
-    
-    # Words/phrases to skip (metadata, not actual skills)
-    skip_phrases = {
-        'certificate id', 'head of', 'learning content', 'content strategy',
-        'shea hanson', 'provider', 'linkedin learning', 'course completed',
-        'completed by', 'top skills covered', 'institute inc', 'institute',
-        'activity #', 'activity', 'inc', 'ltd', 'llc', 'corp', 'corporation',
-        'pdus', 'pdu', 'contact hours', 'contacthours'
-    }
-    
-    # Patterns that indicate metadata (not skills)
-    metadata_patterns = [
-        r'^[A-Z][a-z]+\s+Inc\.?$',  # "Institute Inc"
-        r'^[A-Z][a-z]+\s+Inc$',  # "Institute Inc"
-        r'Activity\s*#',  # "Activity #"
-        r'^#\s*\d+',  # "# 12345"
-        r'^\d+[a-z0-9]+$',  # Alphanumeric IDs like "4101x2z28f"
-        r'^[a-z]+\d+[a-z0-9]+$',  # Mixed alphanumeric IDs
-        r'^\d+[a-z]+\d+',  # Number-letter-number patterns
-        r'PDUs?/ContactHours?',  # "PDUs/ContactHours 1.00"
-        r'Contact\s+Hours?',  # "Contact Hours"
-        r'PDUs?',  # "PDU" or "PDUs"
-    ]
-    
     for line in lines:
         # Clean the line
         line_clean = line.strip()
@@ -310,8 +1103,8 @@ def extract_skills_from_text(text):
         
         # Check stop patterns - if we hit metadata, stop processing
         should_stop = False
-        for pattern in stop_patterns:
-            if re.search(pattern, line_clean, re.IGNORECASE):
+        for index in range(len(STOP_PATTERNS)):
+            if rule_search('stop_patterns', index, line_clean):
                 should_stop = True
                 break
         
@@ -320,8 +1113,8 @@ def extract_skills_from_text(text):
         
         # Skip if line contains skip phrases
         skip_line = False
-        for phrase in skip_phrases:
-            if phrase in line_lower:
+        for index in range(len(SKIP_PHRASES)):
+            if rule_contains('skip_phrases', index, line_lower):
                 skip_line = True
                 break
         
@@ -330,8 +1123,8 @@ def extract_skills_from_text(text):
         
         # Check for metadata patterns
         is_metadata = False
-        for pattern in metadata_patterns:
-            if re.search(pattern, line_clean, re.IGNORECASE):
+        for index in range(len(METADATA_PATTERNS)):
+            if rule_search('metadata_patterns', index, line_clean):
                 is_metadata = True
                 break
         
@@ -359,38 +1152,6 @@ def extract_skills_from_text(text):
         # Skills are typically 1-4 words, so if we have more than 3 words, we might have multiple skills
         words = line_clean.split()
         
-        # Known skill patterns to help split concatenated skills
-        # These are common multi-word skills that should be kept together
-        # Order matters: longer patterns first to match correctly
-        known_skill_patterns = [
-            r'Artificial\s+Intelligence\s+for\s+Business',
-            r'AI\s+for\s+Business\s+Analysis',
-            r'AI\s+for\s+Business',
-            r'Artificial\s+Intelligence\s+for\s+Business\s+Analysis',
-            r'Media\s+Literacy',
-            r'Media\s+Psychology',
-            r'Software\s+Testing',
-            r'Programming\s+Foundations',
-            r'Software\s+Quality\s+Assurance',
-            r'Quality\s+Assurance',
-            r'Microsoft\s+Copilot',
-            r'Security\s+Operations',
-            r'Security\s+Incident\s+Response',
-            r'Generative\s+AI',
-            r'Artificial\s+Intelligence',
-            r'Visual\s+Studio\s+Code',
-            r'Visual\s+Studio',
-            r'Personal\s+Development',
-            r'Critical\s+Thinking',
-            r'Digital\s+Transformation',
-            r'Cloud\s+Computing',
-            r'Interpersonal\s+Communication',
-            r'SQL\s+Database',
-            r'Design\s+AI',
-            r'Data\s+Analysis',
-            r'Business\s+Analysis',
-        ]
-        
         # Strategy: Treat each line as potentially containing multiple skills
         # First, try to match known patterns (longest first)
         # Then process remaining text more carefully
@@ -400,8 +1161,8 @@ def extract_skills_from_text(text):
         pattern_positions = []
         
         # Find all known patterns and their positions
-        for pattern in known_skill_patterns:
-            matches = list(re.finditer(pattern, remaining_text, re.IGNORECASE))
+        for index in range(len(KNOWN_SKILL_PATTERNS)):
+            matches = rule_finditer('known_skill_patterns', index, remaining_text)
             for match in matches:
                 pattern_positions.append((match.start(), match.end(), match.group(0)))
         
@@ -476,8 +1237,8 @@ def extract_skills_from_text(text):
             found_patterns = []
             remaining_text = line_clean
             
-            for pattern in known_skill_patterns:
-                matches = re.finditer(pattern, remaining_text, re.IGNORECASE)
+            for index in range(len(KNOWN_SKILL_PATTERNS)):
+                matches = rule_finditer('known_skill_patterns', index, remaining_text)
                 for match in matches:
                     found_patterns.append(match.group(0))
                     # Remove matched pattern from remaining text
@@ -557,9 +1318,235 @@ def extract_skills_from_text(text):
     
     return unique_skills[:5]  # Limit to 5 skills
 
-def main():
+def hours_to_duration(hours):
+    """Format a decimal hour count (e.g. 10.5) like the other durations ("10h 30m")."""
+    total_minutes = round(float(hours) * 60)
+    h, m = divmod(total_minutes, 60)
+    if h and m:
+        return f"{h}h {m}m"
+    return f"{h}h" if h else f"{m}m"
+
+def line_after(lines, pattern):
+    """The text following the line matching pattern (same line remainder or next line)."""
+    for i, line in enumerate(lines):
+        match = re.search(pattern, line, re.IGNORECASE)
+        if match:
+            rest = line[match.end():].strip(' :')
+            if rest:
+                return rest
+            if i + 1 < len(lines):
+                return lines[i + 1]
+    return None
+
+def parse_linkedin(text, runs=None):
+    """LinkedIn Learning: title, "Course completed by", date + duration, top skills.
+    
+    Read from the template regions when the first page's runs are known,
+    from the flattened text otherwise.
+    """
+    regions = linkedin_regions(runs) if runs else None
+    if regions:
+        if RULE_TRACE is not None:
+            for index, (name, _) in enumerate(TEMPLATE_REGIONS):
+                RULE_TRACE.append(('template_regions', index, ' | '.join(regions[name])))
+        year, full_date = extract_date_from_text(' '.join(regions['date_line']))
+        skills = []
+        for skill in (format_skill_name(pill, pill=True) for pill in regions['skills']):
+            if skill and skill not in skills:
+                skills.append(skill)
+        # The duration follows the bullet, in a run of its own
+        duration = ' '.join(t for t in regions['date_line'] if not re.search(r'\d{4}', t))
+        return {
+            'title': re.sub(r'\s+', ' ', ' '.join(regions['title'])).strip(),
+            'year': year,
+            'date': full_date,
+            'duration': extract_duration_from_text(duration),
+            'skills': skills[:5],
+        }
+    year, full_date = extract_date_from_text(text)
+    return {
+        'title': extract_title_from_text(text),
+        'year': year,
+        'date': full_date,
+        'duration': extract_duration_from_text(text),
+        'skills': extract_skills_from_text(text),
+    }
+
+def parse_coursera(text, runs=None):
+    """Coursera: date, name, "has successfully completed", course title."""
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    year, full_date = extract_date_from_text(text)
+    return {
+        'title': line_after(lines, r'has\s+successfully\s+completed'),
+        'year': year,
+        'date': full_date,
+        'duration': None,
+        'skills': [],
+    }
+
+def parse_udemy(text, runs=None):
+    """Udemy: "CERTIFICATE OF COMPLETION", title, instructors, "Date", "Length N total hours"."""
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    # Udemy abbreviates months with a dot ("Jan. 5, 2023")
+    year, full_date = extract_date_from_text(re.sub(r'\b([A-Z][a-z]{2})\.', r'\1', text))
+    length = re.search(r'Length\s+([\d.]+)\s+total\s+hours?', text, re.IGNORECASE)
+    return {
+        'title': line_after(lines, r'certificate\s+of\s+completion'),
+        'year': year,
+        'date': full_date,
+        'duration': hours_to_duration(length.group(1)) if length else None,
+        'skills': [],
+    }
+
+def parse_generic(text, runs=None):
+    """Any other certificate of completion: best-effort title and date only."""
+    year, full_date = extract_date_from_text(text)
+    duration = None
+    if re.search(r'\d+\s+(hour|minute)', text, re.IGNORECASE):
+        duration = extract_duration_from_text(text)
+    return {
+        'title': extract_title_from_text(text),
+        'year': year,
+        'date': full_date,
+        'duration': duration,
+        'skills': [],
+    }
+
+# Provider parsers, most specific first. A parser claims a PDF when one of its
+# markers occurs in the start of the first page; a parser whose producer hint
+# matches the PDF producer is tried before the others.
+PROVIDER_PARSERS = [
+    {
+        'provider': 'LinkedIn Learning',
+        'producers': ['openhtmltopdf'],
+        'markers': [r'Course completed by', r'Head of Learning Content', r'LinkedIn Learning'],
+        'parse': parse_linkedin,
+    },
+    {
+        'provider': 'Coursera',
+        'producers': [],
+        'markers': [r'coursera\.org/verify', r'offered through Coursera'],
+        'parse': parse_coursera,
+    },
+    {
+        'provider': 'Udemy',
+        'producers': [],
+        'markers': [r'ude\.my/UC-', r'Certificate no:\s*UC-'],
+        'parse': parse_udemy,
+    },
+    {
+        'provider': 'Other',
+        'producers': [],
+        'markers': [r'certificate\s+of\s+(completion|achievement)', r'has\s+(successfully\s+)?completed',
+                    r'certifies\s+that'],
+        'parse': parse_generic,
+    },
+]
+
+# Characters of the first page used for the fingerprint
+FINGERPRINT_CHARS = 1024
+
+def select_parser(producer, first_page):
+    """Provider parser for a PDF, or None when it is not a certificate."""
+    if not first_page:
+        return None
+    probe = re.sub(r'\s+', ' ', first_page[:FINGERPRINT_CHARS])
+    producer = (producer or '').lower()
+    candidates = sorted(PROVIDER_PARSERS,
+                        key=lambda p: not any(hint in producer for hint in p['producers']))
+    for parser in candidates:
+        if any(re.search(marker, probe, re.IGNORECASE) for marker in parser['markers']):
+            return parser
+    return None
+
+def classify_pdf(size, record):
+    """(provider parser, None) for a certificate, (None, reason) otherwise."""
+    reason = metadata_exclusion(size, record['producer'], record['page_count'])
+    if reason:
+        return None, reason
+    parser = select_parser(record['producer'], record['first_page'])
+    if not parser:
+        return None, f"no certificate markers in the first {FINGERPRINT_CHARS} characters"
+    return parser, None
+
+# Upper bounds (seconds) of the per-file stage duration histogram
+DURATION_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+FAILURE_REASONS = ['timeout', 'memory', 'crashed']
+
+def default_metrics_file():
+    """Where node_exporter's textfile collector looks, if configured."""
+    directory = os.environ.get('PROMETHEUS_TEXTFILE_DIR')
+    if directory:
+        return Path(directory) / 'learning_extract.prom'
+    return Path('archived/.extraction-metrics.prom')
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for value in labels.values())
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + '}'
+
+def histogram_lines(name, samples_by_stage):
+    """Cumulative-bucket histogram series for {stage: [seconds, ...]}."""
+    lines = []
+    for stage, samples in samples_by_stage.items():
+        for bound in DURATION_BUCKETS:
+            count = sum(1 for sample in samples if sample <= bound)
+            lines.append(f"{name}_bucket{format_labels({'stage': stage, 'le': f'{bound:g}'})} {count}")
+        lines.append(f"{name}_bucket{format_labels({'stage': stage, 'le': '+Inf'})} {len(samples)}")
+        lines.append(f"{name}_sum{format_labels({'stage': stage})} {sum(samples):.6f}")
+        lines.append(f"{name}_count{format_labels({'stage': stage})} {len(samples)}")
+    return lines
+
+def write_metrics(path, gauges, histograms):
+    """Write a Prometheus textfile atomically (the collector may read it at
+    any moment). gauges: [(name, help, [(labels, value)])];
+    histograms: [(name, help, {stage: [seconds]})]."""
+    lines = []
+    for name, help_text, samples in gauges:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        lines += [f"{name}{format_labels(labels)} {value}" for labels, value in samples]
+    for name, help_text, samples_by_stage in histograms:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        lines += histogram_lines(name, samples_by_stage)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + '.tmp')
+    temporary.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    os.replace(temporary, path)
+
+def explain(pdf_path):
+    """Print the fields extracted from one PDF and the rules behind each."""
+    global RULE_TRACE
+    size = pdf_path.stat().st_size
+    record = read_pdf_record(pdf_path, size)
+    print(f"{pdf_path}: {record['page_count']} pages, producer {record['producer']!r}, "
+          f"{'template runs' if record['runs'] else 'extract_text'}")
+    parser, reason = classify_pdf(size, record)
+    if not parser:
+        print(f"Excluded: {reason}")
+        return
+    print(f"Parser: {parser['provider']}\n")
+    RULE_TRACE = []
+    try:
+        fields = parser['parse'](record['text'], record.get('runs'))
+    finally:
+        trace, RULE_TRACE = RULE_TRACE, None
+    for field, value in fields.items():
+        print(f"{field}: {value!r}")
+        fields_of = {group: fields for group, (fields, _) in RULE_GROUPS.items()}
+        for group, index, matched in trace:
+            targets = TEMPLATE_REGIONS[index][1] if group == 'template_regions' else fields_of[group]
+            if field in targets:
+                print(f"    <- {rule_label(group, index)}: {matched!r}")
+    if not any(group == 'template_regions' for group, _, _ in trace):
+        print("\n(the title comes from extract_title_from_text, whose heuristics are not rules)")
+
+def main(reparse=False, workers=None, timeout=60, max_memory_mb=1024, retry_quarantined=False,
+         metrics_file=None, shard=None, partial_file=None, profile_rules=False):
     archived_path = Path('archived')
     certificates = []
+    started = time.perf_counter()
     
     if not archived_path.exists():
         print(f"Error: {archived_path} directory not found!")
@@ -577,21 +1564,101 @@ def main():
     # Remove duplicates
     pdf_files = list(set(pdf_files))
     
-    print(f"Found {len(pdf_files)} certificate PDFs")
-    print("Extracting data from PDFs...\n")
+    print(f"Found {len(pdf_files)} PDFs")
+    if shard:
+        pdf_files = [pdf_file for pdf_file in pdf_files if shard_of(pdf_file, shard[1]) == shard[0]]
+        print(f"Shard {shard[0]}/{shard[1]}: {len(pdf_files)} PDFs")
+    if reparse:
+        print(f"Reparsing from {TEXT_STORE}...\n")
+    else:
+        print("Extracting data from PDFs...\n")
+    
+    excluded = []
+    providers = {}
+    # Per-file durations by stage, and whole-run durations by stage
+    file_seconds = {'read': [], 'parse': []}
+    stage_seconds = {}
+    stage_started = time.perf_counter()
+    cached = load_text_store() if reparse else {}
+    store = {}
+    previous_quarantine = load_quarantine()
+    quarantine = {}
+    if shard:
+        # Other shards' entries are kept; their files are not looked at here
+        shard_paths = {str(pdf_file) for pdf_file in pdf_files}
+        quarantine = {digest: entry for digest, entry in previous_quarantine.items()
+                      if entry['path'] not in shard_paths}
     
-    for i, pdf_file in enumerate(pdf_files, 1):
+    # Classify by size and look up the store; collect what must be read
+    candidates = []
+    to_read = {}
+    for pdf_file in pdf_files:
+        # Oversized files are excluded without being opened
+        size = pdf_file.stat().st_size
+        reason = metadata_exclusion(size)
+        if reason:
+            excluded.append((pdf_file, reason))
+            continue
+        
+        digest = file_hash(pdf_file)
+        if digest in previous_quarantine and not retry_quarantined:
+            quarantine[digest] = previous_quarantine[digest]
+            continue
+        candidates.append((pdf_file, size, digest))
+        if needs_read(cached.get(digest), size):
+            to_read[digest] = (pdf_file, size)
+        else:
+            store[digest] = cached[digest]
+    
+    stage_seconds['scan'] = time.perf_counter() - stage_started
+    stage_started = time.perf_counter()
+    
+    # Read the PDFs in isolated workers with a per-file time and memory budget
+    workers = workers or min(os.cpu_count() or 1, 8)
+    failures = dict.fromkeys(FAILURE_REASONS, 0)
+    for i, (digest, status, record, seconds) in enumerate(
+            read_isolated(to_read, workers, timeout, max_memory_mb), 1):
         if i % 50 == 0:
-            print(f"Processing {i}/{len(pdf_files)}...")
+            print(f"Read {i}/{len(to_read)}...")
+        file_seconds['read'].append(seconds)
+        if status != 'ok':
+            failures[status] += 1
+        if status == 'ok':
+            store[digest] = record
+        else:
+            quarantine[digest] = {
+                'path': str(to_read[digest][0]),
+                'reason': status,
+                'limits': f"{timeout}s, {max_memory_mb} MB",
+                'date': datetime.now().isoformat(timespec='seconds'),
+            }
+    
+    stage_seconds['read'] = time.perf_counter() - stage_started
+    stage_started = time.perf_counter()
+    
+    global RULE_STATS
+    if profile_rules:
+        RULE_STATS = {}
+    for pdf_file, size, digest in candidates:
+        record = store.get(digest)
+        if record is None:
+            continue  # quarantined
+        parse_started = time.perf_counter()
         
-        # Extract text
-        text = extract_text_from_pdf(pdf_file)
+        # Classify, then dispatch on the fingerprint; only the matching parser runs
+        parser, reason = classify_pdf(size, record)
+        if not parser:
+            excluded.append((pdf_file, reason))
+            continue
+        text = record['text']
         
         # Extract data
-        year, full_date = extract_date_from_text(text)
-        title = extract_title_from_text(text)
-        duration = extract_duration_from_text(text)
-        skills = extract_skills_from_text(text)
+        fields = parser['parse'](text, record.get('runs'))
+        year, full_date = fields['year'], fields['date']
+        title = fields['title']
+        duration = fields['duration']
+        skills = fields['skills']
+        providers[parser['provider']] = providers.get(parser['provider'], 0) + 1
         
         # If year not found, try to get from folder
         if not year:
@@ -612,44 +1679,91 @@ def main():
         # Determine domain from title and skills
         domain = categorize_domain(title, skills)
         
-        certificate = {
-            'id': len(certificates) + 1,
-            'title': title,
-            'path': str(pdf_file.relative_to(Path('.'))),
-            'domain': domain,
-            'year': year,
-            'date': full_date,
-            'duration': duration,
-            'skills': skills,
-            'provider': 'LinkedIn Learning'
-        }
+        certificate = certificate_record.Certificate(
+            title,
+            path=pdf_file.relative_to(Path('.')).as_posix(),
+            domain=domain,
+            year=year,
+            date=full_date,
+            duration=duration,
+            skills=skills,
+            provider=parser['provider'],
+            source_hash=digest,
+        )
         
         certificates.append(certificate)
+        file_seconds['parse'].append(time.perf_counter() - parse_started)
     
-    # Sort by year (newest first), then by title
-    certificates.sort(key=lambda x: (x['year'], x['title']), reverse=True)
+    stage_seconds['parse'] = time.perf_counter() - stage_started
+    rule_stats, RULE_STATS = RULE_STATS, None
+    stage_started = time.perf_counter()
     
-    # Generate statistics
-    stats = {
-        'total': len(certificates),
-        'domains': len(set(c['domain'] for c in certificates)),
-        'years': sorted(set(c['year'] for c in certificates), reverse=True),
-        'last_updated': datetime.now().isoformat()
-    }
+    if shard:
+        partial_file = partial_file or default_partial_file(shard)
+        write_partial(partial_file, shard, pdf_files, certificates, excluded)
+        outputs, changes = [partial_file], {}
+        print(f"\nâœ“ Wrote {partial_file} with {len(certificates)} certificates "
+              f"(merge all {shard[1]} shards with --merge)")
+    else:
+        changes, stats = update_catalog(certificates, {pdf_file.as_posix() for pdf_file, _ in excluded},
+                                        {pdf_file.as_posix() for pdf_file in pdf_files})
+        outputs = [OUTPUT_FILE, CATALOG]
+        print_catalog_update(changes, stats, len(certificates))
+        update_text_index(certificates, store)
+    print(f"  Providers: {', '.join(f'{name} ({count})' for name, count in sorted(providers.items()))}")
+    print(f"  PDFs opened: {len(to_read)}/{len(pdf_files)} by {workers} workers "
+          f"in {time.perf_counter() - started:.1f}s")
     
-    output = {
-        'metadata': stats,
-        'certificates': certificates
-    }
+    # Entries for deleted or changed PDFs are dropped; a shard keeps the
+    # entries of the other shards' files
+    if shard:
+        store = {**load_text_store(), **store}
+    save_text_store(store)
+    save_quarantine(quarantine)
+    stage_seconds['write'] = time.perf_counter() - stage_started
     
-    # Write JSON file
-    output_file = Path('assets/data/learning-data.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    metrics_file = metrics_file or default_metrics_file()
+    prefix = 'learning_extract'
+    write_metrics(metrics_file, [
+        (f'{prefix}_pdfs_discovered', "PDFs found under archived/.", [({}, len(pdf_files))]),
+        (f'{prefix}_pdfs_parsed', "PDFs parsed into certificates.", [({}, len(certificates))]),
+        (f'{prefix}_pdfs_cached', "PDFs served from the text store without being opened.",
+         [({}, len(candidates) - len(to_read))]),
+        (f'{prefix}_pdfs_failed', "PDFs whose worker failed this run, by reason.",
+         [({'reason': reason}, count) for reason, count in failures.items()]),
+        (f'{prefix}_pdfs_quarantined', "PDFs listed in the quarantine report.", [({}, len(quarantine))]),
+        (f'{prefix}_pdfs_excluded', "PDFs classified as non-certificates.", [({}, len(excluded))]),
+        (f'{prefix}_pdf_bytes_read', "Bytes of the PDFs opened this run.",
+         [({}, sum(size for _, size in to_read.values()))]),
+        (f'{prefix}_output_bytes', "Size of the generated files.",
+         [({'file': path.name}, path.stat().st_size) for path in outputs]),
+        (f'{prefix}_catalog_rows_changed', "Catalog rows written this run, by operation.",
+         [({'operation': operation}, changes[operation])
+          for operation in ('inserted', 'updated', 'removed') if operation in changes]),
+        (f'{prefix}_run_stage_seconds', "Wall-clock time of each stage of the run.",
+         [({'stage': stage}, round(seconds, 6)) for stage, seconds in stage_seconds.items()]),
+        (f'{prefix}_run_duration_seconds', "Wall-clock time of the run.",
+         [({}, round(time.perf_counter() - started, 6))]),
+        (f'{prefix}_last_run_timestamp_seconds', "Unix time the run finished.", [({}, int(time.time()))]),
+    ], [
+        (f'{prefix}_stage_duration_seconds', "Per-file duration of the read and parse stages.",
+         file_seconds),
+    ])
+    print(f"  Metrics: {metrics_file}")
     
-    print(f"\nâœ“ Generated {output_file} with {len(certificates)} certificates")
-    print(f"  Domains: {stats['domains']}")
-    print(f"  Years: {', '.join(stats['years'])}")
+    if quarantine:
+        print(f"\nQuarantined {len(quarantine)} PDFs (see {QUARANTINE_REPORT}, "
+              f"retry with --retry-quarantined):")
+        for entry in sorted(quarantine.values(), key=lambda e: e['path']):
+            print(f"  - {entry['path']} ({entry['reason']})")
+    
+    if excluded:
+        print(f"\nExcluded {len(excluded)} non-certificate PDFs:")
+        for pdf_file, reason in sorted(excluded):
+            print(f"  - {pdf_file} ({reason})")
+    
+    if rule_stats is not None:
+        print_rule_report(rule_stats)
 
 def categorize_domain(title, skills):
     """Categorize certificate into domain."""
@@ -678,7 +1792,52 @@ def categorize_domain(title, skills):
     return 'other'
 
 if __name__ == '__main__':
-    if not PDF_LIB:
+    arg_parser = argparse.ArgumentParser(description="Extract certificate data from the archived PDFs")
+    arg_parser.add_argument('--reparse', action='store_true',
+                            help=f"re-run field extraction from the raw text in {TEXT_STORE}")
+    arg_parser.add_argument('--workers', type=parse_workers, default=None,
+                            help="worker processes reading PDFs (default: CPU count, at most 8)")
+    arg_parser.add_argument('--timeout', type=float, default=60,
+                            help="seconds a worker may spend on one PDF (default: 60)")
+    arg_parser.add_argument('--max-memory', type=int, default=1024, metavar='MB',
+                            help="address-space cap per worker in MB, 0 for none (default: 1024)")
+    arg_parser.add_argument('--retry-quarantined', action='store_true',
+                            help=f"read the files listed in {QUARANTINE_REPORT} again")
+    arg_parser.add_argument('--metrics-file', type=Path, default=None,
+                            help="Prometheus textfile to write (default: $PROMETHEUS_TEXTFILE_DIR/"
+                                 "learning_extract.prom or archived/.extraction-metrics.prom)")
+    arg_parser.add_argument('--shard', type=parse_shard, default=None, metavar='i/N',
+                            help="only extract the PDFs of shard i of N and write a partial result")
+    arg_parser.add_argument('--partial', type=Path, default=None, metavar='PATH',
+                            help="partial result file of --shard "
+                                 "(default: archived/.extraction-shard-i-of-N.json)")
+    arg_parser.add_argument('--merge', nargs='+', type=Path, metavar='PARTIAL',
+                            help="combine the partial results of all shards into the catalog")
+    arg_parser.add_argument('--profile-rules', action='store_true',
+                            help="count hits and time per parser rule and list dead and costly rules")
+    arg_parser.add_argument('--explain', type=Path, default=None, metavar='FILE',
+                            help="show the fields extracted from one PDF and the rules behind them")
+    args = arg_parser.parse_args()
+    
+    if args.explain:
+        if not PDF_LIB:
+            arg_parser.error("--explain needs a PDF library (pip install pypdf)")
+        if not args.explain.is_file():
+            arg_parser.error(f"--explain: no such file: {args.explain}")
+        explain(args.explain)
+        exit(0)
+    if args.merge:
+        if args.shard:
+            arg_parser.error("--merge cannot be combined with --shard")
+        merge(args.merge)
+        exit(0)
+    if args.partial and not args.shard:
+        arg_parser.error("--partial needs --shard")
+    
+    if args.max_memory and resource is None:
+        print("Warning: per-worker memory caps are not supported on this platform")
+    
+    if not PDF_LIB and not (args.reparse and TEXT_STORE.exists()):
         print("ERROR: Please install a PDF library first:")
         print("  pip install pypdf")
         print("  OR")
@@ -686,5 +1845,8 @@ if __name__ == '__main__':
         exit(1)
     
     print(f"Using PDF library: {PDF_LIB}")
-    main()
+    main(reparse=args.reparse, workers=args.workers, timeout=args.timeout,
+         max_memory_mb=args.max_memory, retry_quarantined=args.retry_quarantined,
+         metrics_file=args.metrics_file, shard=args.shard, partial_file=args.partial,
+         profile_rules=args.profile_rules)
 
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Final organization: Extract dates from PDFs, move to year folders, remove course folders.
+
+Years come from the PDF metadata (see year_probe.py); the page text is only
+read when the metadata is missing and for a sample of files.
 """
 
 import os
@@ -9,6 +12,8 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
+from year_probe import YearProbe
+
 try:
     import pypdf
     HAS_PDF = True
@@ -52,6 +57,7 @@ def main():
     
     moved = 0
     already_organized = 0
+    probe = YearProbe(extract_year_from_pdf)
     
     for pdf_file in all_pdfs:
         # Skip if already in a year folder
@@ -60,8 +66,8 @@ def main():
             continue
         
         try:
-            # Extract year from PDF
-            year = extract_year_from_pdf(pdf_file)
+            # Extract year from PDF metadata (text as fallback)
+            year = probe.year(pdf_file)
             
             # Fallback: check folder name
             if not year:
@@ -95,12 +101,14 @@ def main():
     
     print(f"\n✓ Moved {moved} PDFs to year folders")
     print(f"✓ {already_organized} PDFs already in year folders")
+    print(f"✓ {probe.summary()}")
     
     # Clean up: remove all non-PDF files
     print("\nRemoving non-PDF files...")
     removed_files = 0
     for item in archived_path.rglob('*'):
-        if item.is_file() and not item.name.endswith('.pdf'):
+        # Files directly in archived/ (the catalog, text store, reports) are kept
+        if item.is_file() and not item.name.endswith('.pdf') and item.parent != archived_path:
             try:
                 item.unlink()
                 removed_files += 1
@@ -127,7 +135,7 @@ def main():
                     pdfs = list(folder.glob('**/*.pdf'))
                     for pdf in pdfs:
                         # Try to determine year
-                        year = extract_year_from_pdf(pdf) or '2024'
+                        year = probe.year(pdf) or '2024'
                         year_folder = archived_path / year
                         year_folder.mkdir(exist_ok=True)
                         try:
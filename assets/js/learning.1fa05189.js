@@ -0,0 +1,433 @@
+let allCertificates=[];
+let filteredCertificates=[];
+let currentView='list';
+let selectedSkills=new Set();
+const CERTIFICATE_BATCH_SIZE=24;
+function initLearningPage(){
+loadCertificates();
+setupEventListeners();
+}
+async function loadCertificates(){
+try{
+const response=await fetch('/assets/data/learning-data.cba7d8d1.json');
+if(!response.ok){
+throw new Error('Failed to load certificate data');
+}
+const data=await response.json();
+allCertificates=data.certificates||[];
+filteredCertificates=[...allCertificates];
+updateStatistics(data.metadata);
+const lang=document.documentElement.getAttribute('lang')||'en';
+const suffix=lang==='fr'?'-fr':'';
+renderCertificates(suffix);
+updateResultsCount(suffix);
+switchView('list',suffix);
+setTimeout(()=>{
+renderSkillsFilter();
+},100);
+}catch(error){
+console.error('Error loading certificates:',error);
+const grid=document.getElementById('certificates-grid');
+if(grid&&!grid.querySelector('[data-prerendered]')){
+grid.innerHTML=
+'<div class="no-results">Unable to load certificates. Please check the data file.</div>';
+}
+}
+}
+function updateStatistics(metadata){
+if(metadata){
+const totalEl=document.getElementById('total-certificates');
+const domainsEl=document.getElementById('total-domains');
+const yearsEl=document.getElementById('active-years');
+if(totalEl)totalEl.textContent=metadata.total||allCertificates.length;
+if(domainsEl)domainsEl.textContent=(metadata.domains||new Set(allCertificates.map(c=>c.domain)).size)+'+';
+if(yearsEl)yearsEl.textContent=(metadata.years?.length||new Set(allCertificates.map(c=>c.year)).size)+'+';
+}
+}
+function setupEventListeners(){
+const lang=document.documentElement.getAttribute('lang')||'en';
+const suffix=lang==='fr'?'-fr':'';
+const searchInput=document.getElementById('search-input'+suffix);
+if(searchInput){
+searchInput.addEventListener('input',handleSearch);
+}
+const domainFilter=document.getElementById('domain-filter'+suffix);
+if(domainFilter){
+domainFilter.addEventListener('change',handleFilter);
+}
+const yearFilter=document.getElementById('year-filter'+suffix);
+if(yearFilter){
+yearFilter.addEventListener('change',handleFilter);
+}
+const sortFilter=document.getElementById('sort-filter'+suffix);
+if(sortFilter){
+sortFilter.addEventListener('change',handleSort);
+}
+const clearBtn=document.getElementById('clear-filters'+suffix);
+if(clearBtn){
+clearBtn.addEventListener('click',clearFilters);
+}
+const gridViewBtn=document.getElementById('grid-view'+suffix);
+const listViewBtn=document.getElementById('list-view'+suffix);
+if(gridViewBtn){
+gridViewBtn.addEventListener('click',()=>switchView('grid',suffix));
+}
+if(listViewBtn){
+listViewBtn.addEventListener('click',()=>switchView('list',suffix));
+}
+const langObserver=new MutationObserver(()=>{
+setupEventListeners();
+});
+langObserver.observe(document.documentElement,{
+attributes:true,
+attributeFilter:['lang']
+});
+}
+function handleSearch(e){
+const query=e.target.value.toLowerCase().trim();
+applyFilters();
+}
+function handleFilter(){
+applyFilters();
+}
+function handleSort(){
+applyFilters();
+}
+function getAllSkillsWithCounts(){
+const skillCounts=new Map();
+allCertificates.forEach(cert=>{
+if(cert.skills&&Array.isArray(cert.skills)){
+cert.skills.forEach(skill=>{
+const skillLower=skill.toLowerCase().trim();
+if(skillLower){
+skillCounts.set(skillLower,(skillCounts.get(skillLower)||0)+1);
+}
+});
+}
+});
+return Array.from(skillCounts.entries())
+.map(([skill,count])=>({skill,count}))
+.sort((a,b)=>b.count-a.count);
+}
+function renderSkillsFilter(){
+if(!allCertificates||allCertificates.length===0){
+console.warn('No certificates loaded yet, skipping skills filter render');
+return;
+}
+const skills=getAllSkillsWithCounts();
+const lang=document.documentElement.getAttribute('lang')||'en';
+const suffix=lang==='fr'?'-fr':'';
+const skillsListEl=document.getElementById('skills-list'+suffix);
+if(!skillsListEl){
+console.warn('Skills list element not found:','skills-list'+suffix);
+return;
+}
+skillsListEl.innerHTML=skills.map(({skill,count})=>{
+const isSelected=selectedSkills.has(skill);
+return`
+      <button 
+        type="button" 
+        class="skill-filter-btn ${isSelected ? 'active' : ''}" 
+        data-skill="${escapeHtml(skill)}"
+        aria-label="Filter by ${escapeHtml(skill)} (${count} certificates)"
+      >
+        <span class="skill-name">${escapeHtml(skill)}</span>
+        <span class="skill-count">${count}</span>
+      </button>
+    `;
+}).join('');
+skillsListEl.querySelectorAll('.skill-filter-btn').forEach(btn=>{
+btn.addEventListener('click',()=>{
+const skill=btn.getAttribute('data-skill');
+toggleSkillFilter(skill);
+});
+});
+}
+function toggleSkillFilter(skill){
+if(selectedSkills.has(skill)){
+selectedSkills.delete(skill);
+}else{
+selectedSkills.add(skill);
+}
+renderSkillsFilter();
+applyFilters();
+}
+function applyFilters(){
+const lang=document.documentElement.getAttribute('lang')||'en';
+const suffix=lang==='fr'?'-fr':'';
+const searchQuery=document.getElementById('search-input'+suffix)?.value.toLowerCase().trim()||'';
+const domainFilter=document.getElementById('domain-filter'+suffix)?.value||'all';
+const yearFilter=document.getElementById('year-filter'+suffix)?.value||'all';
+const sortFilter=document.getElementById('sort-filter'+suffix)?.value||'date-desc';
+filteredCertificates=allCertificates.filter(cert=>{
+const matchesSearch=!searchQuery||
+cert.title.toLowerCase().includes(searchQuery)||
+cert.domain.toLowerCase().includes(searchQuery)||
+cert.skills?.some(skill=>skill.toLowerCase().includes(searchQuery))||
+cert.folder?.toLowerCase().includes(searchQuery);
+const matchesDomain=domainFilter==='all'||cert.domain===domainFilter;
+const matchesYear=yearFilter==='all'||cert.year===yearFilter;
+const matchesSkills=selectedSkills.size===0||
+(cert.skills&&Array.isArray(cert.skills)&&
+Array.from(selectedSkills).every(selectedSkill=>
+cert.skills.some(certSkill=>certSkill.toLowerCase().trim()===selectedSkill)
+));
+return matchesSearch&&matchesDomain&&matchesYear&&matchesSkills;
+});
+sortCertificates(sortFilter);
+updateActiveFilters(domainFilter,yearFilter,searchQuery,suffix);
+renderCertificates(suffix);
+updateResultsCount(suffix);
+}
+function sortCertificates(sortType){
+switch(sortType){
+case'date-desc':
+filteredCertificates.sort((a,b)=>{
+if(b.year!==a.year)return b.year.localeCompare(a.year);
+return b.title.localeCompare(a.title);
+});
+break;
+case'date-asc':
+filteredCertificates.sort((a,b)=>{
+if(a.year!==b.year)return a.year.localeCompare(b.year);
+return a.title.localeCompare(b.title);
+});
+break;
+case'title-asc':
+filteredCertificates.sort((a,b)=>a.title.localeCompare(b.title));
+break;
+case'title-desc':
+filteredCertificates.sort((a,b)=>b.title.localeCompare(a.title));
+break;
+case'domain':
+filteredCertificates.sort((a,b)=>{
+if(a.domain!==b.domain)return a.domain.localeCompare(b.domain);
+return a.title.localeCompare(b.title);
+});
+break;
+}
+}
+function clearFilters(){
+const lang=document.documentElement.getAttribute('lang')||'en';
+const suffix=lang==='fr'?'-fr':'';
+document.getElementById('search-input'+suffix).value='';
+document.getElementById('domain-filter'+suffix).value='all';
+document.getElementById('year-filter'+suffix).value='all';
+document.getElementById('sort-filter'+suffix).value='date-desc';
+selectedSkills.clear();
+renderSkillsFilter();
+applyFilters();
+}
+function updateActiveFilters(domain,year,search,suffix=''){
+const activeFiltersEl=document.getElementById('active-filters'+suffix);
+if(!activeFiltersEl)return;
+activeFiltersEl.innerHTML='';
+const lang=document.documentElement.getAttribute('lang')||'en';
+const isFr=lang==='fr';
+if(domain!=='all'){
+const label=isFr?'Domaine: ':'Domain: ';
+const tag=createFilterTag(label+formatDomainName(domain),()=>{
+document.getElementById('domain-filter'+suffix).value='all';
+applyFilters();
+});
+activeFiltersEl.appendChild(tag);
+}
+if(year!=='all'){
+const label=isFr?'AnnÃ©e: ':'Year: ';
+const tag=createFilterTag(label+year,()=>{
+document.getElementById('year-filter'+suffix).value='all';
+applyFilters();
+});
+activeFiltersEl.appendChild(tag);
+}
+if(search){
+const label=isFr?'Recherche: ':'Search: ';
+const tag=createFilterTag(label+search,()=>{
+document.getElementById('search-input'+suffix).value='';
+applyFilters();
+});
+activeFiltersEl.appendChild(tag);
+}
+if(selectedSkills.size>0){
+const label=isFr?'CompÃ©tences: ':'Skills: ';
+Array.from(selectedSkills).forEach(skill=>{
+const tag=createFilterTag(label+skill,()=>{
+selectedSkills.delete(skill);
+renderSkillsFilter();
+applyFilters();
+});
+activeFiltersEl.appendChild(tag);
+});
+}
+}
+function createFilterTag(text,onClick){
+const tag=document.createElement('div');
+tag.className='filter-tag';
+tag.innerHTML=`
+    <span>${text}</span>
+    <button type="button" aria-label="Remove filter">Ã—</button>
+  `;
+tag.querySelector('button').addEventListener('click',onClick);
+return tag;
+}
+function formatDomainName(domain){
+return domain.split('_').map(word=>
+word.charAt(0).toUpperCase()+word.slice(1)
+).join(' ');
+}
+function switchView(view,suffix=''){
+currentView=view;
+const grid=document.getElementById('certificates-grid'+suffix);
+const gridBtn=document.getElementById('grid-view'+suffix);
+const listBtn=document.getElementById('list-view'+suffix);
+if(!grid)return;
+if(view==='grid'){
+grid.classList.remove('list-view');
+if(gridBtn)gridBtn.classList.add('active');
+if(listBtn)listBtn.classList.remove('active');
+}else{
+grid.classList.add('list-view');
+if(listBtn)listBtn.classList.add('active');
+if(gridBtn)gridBtn.classList.remove('active');
+}
+}
+function renderCertificates(suffix=''){
+const container=document.getElementById('certificates-grid'+suffix);
+if(!container){
+console.error('Certificate container not found:','certificates-grid'+suffix);
+return;
+}
+const lang=document.documentElement.getAttribute('lang')||'en';
+const isFr=lang==='fr';
+if(container.certificateObserver){
+container.certificateObserver.disconnect();
+container.certificateObserver=null;
+}
+if(!filteredCertificates||filteredCertificates.length===0){
+const message=isFr?'Aucun certificat trouvÃ© correspondant Ã  vos filtres.':'No certificates found matching your filters.';
+container.innerHTML=`<div class="no-results">${message}</div>`;
+return;
+}
+if(!hydratePrerenderedCards(container)){
+container.innerHTML='';
+appendCertificateBatch(container,isFr);
+}
+observeCertificateSentinel(container,isFr);
+}
+function hydratePrerenderedCards(container){
+const prerendered=Array.from(container.querySelectorAll('.certificate-card-learning[data-prerendered]'));
+if(!prerendered.length)return false;
+const matches=prerendered.every((card,i)=>
+filteredCertificates[i]&&String(filteredCertificates[i].id)===card.getAttribute('data-id')
+);
+if(!matches)return false;
+prerendered.forEach(card=>card.removeAttribute('data-prerendered'));
+container.querySelectorAll('.loading-message').forEach(el=>el.remove());
+return true;
+}
+function appendCertificateBatch(container,isFr){
+const start=container.querySelectorAll('.certificate-card-learning').length;
+const batch=filteredCertificates.slice(start,start+CERTIFICATE_BATCH_SIZE);
+container.insertAdjacentHTML('beforeend',batch.map(cert=>createCertificateCard(cert,isFr)).join(''));
+}
+function observeCertificateSentinel(container,isFr){
+const rendered=()=>container.querySelectorAll('.certificate-card-learning').length;
+if(rendered()>=filteredCertificates.length)return;
+if(!('IntersectionObserver'in window)){
+while(rendered()<filteredCertificates.length){
+appendCertificateBatch(container,isFr);
+}
+return;
+}
+const sentinel=document.createElement('div');
+sentinel.className='certificates-sentinel';
+sentinel.setAttribute('aria-hidden','true');
+container.appendChild(sentinel);
+const observer=new IntersectionObserver((entries)=>{
+if(!entries.some(entry=>entry.isIntersecting))return;
+sentinel.remove();
+appendCertificateBatch(container,isFr);
+if(rendered()<filteredCertificates.length){
+container.appendChild(sentinel);
+}else{
+observer.disconnect();
+container.certificateObserver=null;
+}
+},{rootMargin:'600px 0px'});
+observer.observe(sentinel);
+container.certificateObserver=observer;
+}
+function formatDate(dateString){
+if(!dateString)return'';
+try{
+const date=new Date(dateString+'T00:00:00');
+const day=String(date.getDate()).padStart(2,'0');
+const month=String(date.getMonth()+1).padStart(2,'0');
+const year=date.getFullYear();
+return`${day}-${month}-${year}`;
+}catch(e){
+const parts=dateString.split('-');
+if(parts.length===3){
+return`${parts[2]}-${parts[1]}-${parts[0]}`;
+}
+return dateString;
+}
+}
+function createCertificateCard(cert,isFr=false){
+const domainName=formatDomainName(cert.domain);
+const uniqueSkills=cert.skills?.filter(skill=>{
+const skillLower=skill.toLowerCase();
+const domainLower=cert.domain.toLowerCase();
+return skillLower!==domainLower&&skillLower!==domainName.toLowerCase();
+})||[];
+const skillsHtml=uniqueSkills.map(skill=>
+`<span class="skill-badge-learning">${skill}</span>`
+).join('');
+const formattedDate=cert.date?formatDate(cert.date):(cert.year||'');
+const viewText=isFr?'Voir le Certificat':'View Certificate';
+const linkHtml=cert.path?`
+      <div class="certificate-actions">
+        <a href="/${cert.path}" target="_blank" rel="noopener noreferrer" class="certificate-link-learning">
+          ${viewText}
+        </a>
+      </div>`:'';
+const allSkillsHtml=skillsHtml;
+return`
+    <div class="certificate-card-learning" data-domain="${cert.domain}" data-year="${cert.year}" data-id="${cert.id}">
+      <div class="certificate-header-learning">
+        <h3 class="certificate-title-learning">${escapeHtml(cert.title)}</h3>
+      </div>
+      <div class="certificate-meta-learning">
+        ${formattedDate ? `<span>${formattedDate}</span>` : ''}
+        ${cert.duration ? `<span>${cert.duration}</span>` : ''}
+      </div>
+      ${allSkillsHtml ? `<div class="certificate-skills-learning">${allSkillsHtml}</div>` : '<div class="certificate-skills-learning"></div>'}${linkHtml}
+    </div>
+  `;
+}
+function escapeHtml(text){
+const div=document.createElement('div');
+div.textContent=text;
+return div.innerHTML;
+}
+function updateResultsCount(suffix=''){
+const countEl=document.getElementById('results-count'+suffix);
+if(countEl){
+const lang=document.documentElement.getAttribute('lang')||'en';
+const isFr=lang==='fr';
+const count=filteredCertificates.length;
+const total=allCertificates.length;
+if(count===total){
+const text=isFr?`Affichage de <strong>${total}</strong> certificats`:`Showing <strong>${total}</strong> certificates`;
+countEl.innerHTML=text;
+}else{
+const text=isFr
+?`Affichage de <strong>${count}</strong> sur <strong>${total}</strong> certificats`
+:`Showing <strong>${count}</strong> of <strong>${total}</strong> certificates`;
+countEl.innerHTML=text;
+}
+}
+}
+window.initLearningPage=initLearningPage;
+window.renderSkillsFilter=renderSkillsFilter;
+window.filteredCertificates=filteredCertificates;
@@ -7,6 +7,7 @@ let allCertificates = [];
 let filteredCertificates = [];
 let currentView = 'list';
 let selectedSkills = new Set(); // Track selected skills for AND filtering
+const CERTIFICATE_BATCH_SIZE = 24; // Cards rendered per lazy-load batch
 
 // Initialize the learning page
 function initLearningPage() {
@@ -43,8 +44,12 @@ async function loadCertificates() {
     }, 100);
   } catch (error) {
     console.error('Error loading certificates:', error);
-    document.getElementById('certificates-grid').innerHTML = 
-      '<div class="no-results">Unable to load certificates. Please check the data file.</div>';
+    // Keep the prerendered cards visible if the full dataset cannot be fetched
+    const grid = document.getElementById('certificates-grid');
+    if (grid && !grid.querySelector('[data-prerendered]')) {
+      grid.innerHTML = 
+        '<div class="no-results">Unable to load certificates. Please check the data file.</div>';
+    }
   }
 }
 
@@ -394,6 +399,8 @@ function switchView(view, suffix = '') {
 }
 
 // Render certificates
+// The first batch is rendered immediately (or hydrated from the cards
+// prerendered at build time); the rest load as the user scrolls.
 function renderCertificates(suffix = '') {
   const container = document.getElementById('certificates-grid' + suffix);
   if (!container) {
@@ -404,13 +411,77 @@ function renderCertificates(suffix = '') {
   const lang = document.documentElement.getAttribute('lang') || 'en';
   const isFr = lang === 'fr';
   
+  if (container.certificateObserver) {
+    container.certificateObserver.disconnect();
+    container.certificateObserver = null;
+  }
+  
   if (!filteredCertificates || filteredCertificates.length === 0) {
     const message = isFr ? 'Aucun certificat trouvÃ© correspondant Ã  vos filtres.' : 'No certificates found matching your filters.';
     container.innerHTML = `<div class="no-results">${message}</div>`;
     return;
   }
   
-  container.innerHTML = filteredCertificates.map(cert => createCertificateCard(cert, isFr)).join('');
+  if (!hydratePrerenderedCards(container)) {
+    container.innerHTML = '';
+    appendCertificateBatch(container, isFr);
+  }
+  observeCertificateSentinel(container, isFr);
+}
+
+// Keep the build-time prerendered cards if they already show the head of the list
+function hydratePrerenderedCards(container) {
+  const prerendered = Array.from(container.querySelectorAll('.certificate-card-learning[data-prerendered]'));
+  if (!prerendered.length) return false;
+  
+  const matches = prerendered.every((card, i) =>
+    filteredCertificates[i] && String(filteredCertificates[i].id) === card.getAttribute('data-id')
+  );
+  if (!matches) return false;
+  
+  prerendered.forEach(card => card.removeAttribute('data-prerendered'));
+  container.querySelectorAll('.loading-message').forEach(el => el.remove());
+  return true;
+}
+
+// Append the next batch of cards after the ones already in the container
+function appendCertificateBatch(container, isFr) {
+  const start = container.querySelectorAll('.certificate-card-learning').length;
+  const batch = filteredCertificates.slice(start, start + CERTIFICATE_BATCH_SIZE);
+  container.insertAdjacentHTML('beforeend', batch.map(cert => createCertificateCard(cert, isFr)).join(''));
+}
+
+// Lazy-load further batches when a sentinel after the last card scrolls into view
+function observeCertificateSentinel(container, isFr) {
+  const rendered = () => container.querySelectorAll('.certificate-card-learning').length;
+  if (rendered() >= filteredCertificates.length) return;
+  
+  if (!('IntersectionObserver' in window)) {
+    while (rendered() < filteredCertificates.length) {
+      appendCertificateBatch(container, isFr);
+    }
+    return;
+  }
+  
+  const sentinel = document.createElement('div');
+  sentinel.className = 'certificates-sentinel';
+  sentinel.setAttribute('aria-hidden', 'true');
+  container.appendChild(sentinel);
+  
+  const observer = new IntersectionObserver((entries) => {
+    if (!entries.some(entry => entry.isIntersecting)) return;
+    sentinel.remove();
+    appendCertificateBatch(container, isFr);
+    if (rendered() < filteredCertificates.length) {
+      container.appendChild(sentinel);
+    } else {
+      observer.disconnect();
+      container.certificateObserver = null;
+    }
+  }, { rootMargin: '600px 0px' });
+  
+  observer.observe(sentinel);
+  container.certificateObserver = observer;
 }
 
 // Format date from YYYY-MM-DD to dd-mm-yyyy
@@ -468,7 +539,7 @@ function createCertificateCard(cert, isFr = false) {
   const allSkillsHtml = skillsHtml;
   
   return `
-    <div class="certificate-card-learning" data-domain="${cert.domain}" data-year="${cert.year}">
+    <div class="certificate-card-learning" data-domain="${cert.domain}" data-year="${cert.year}" data-id="${cert.id}">
       <div class="certificate-header-learning">
         <h3 class="certificate-title-learning">${escapeHtml(cert.title)}</h3>
       </div>
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Learning analytics time series for assets/data/learning-analytics.json.
+
+Normalizes the free-text fields of the dataset (duration "1h 27m" ->
+87 minutes, date "2025-03-14" -> proleptic Gregorian ordinal) and rolls
+the certificates up per month and per year: certificate counts and minutes
+learned, in total, per domain and per skill (the TOP_SKILLS most frequent
+skills). Every series is a dense array aligned with the "months" / "years"
+axis, so the learning page can chart it without parsing or aggregating
+records. publish-site.py writes the file.
+
+Aggregation is vectorized with NumPy (one bincount per rollup) when it is
+installed, and done in pure Python otherwise; both give the same output.
+
+    import learning_analytics
+    analytics = learning_analytics.build(data["certificates"])
+
+    python assets/js/learning_analytics.py   # yearly hours per domain
+"""
+
+import json
+import re
+from datetime import date
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # optional: aggregation falls back to pure Python
+    np = None
+
+ROOT = Path(__file__).resolve().parents[2]
+DATA = ROOT / "assets" / "data" / "learning-data.json"
+ANALYTICS = ROOT / "assets" / "data" / "learning-analytics.json"
+TOP_SKILLS = 25
+
+DURATION = re.compile(r"\s*(?:(\d+)\s*h)?\s*(?:(\d+)\s*m)?\s*")
+# Ordinal of 1970-01-01, the NumPy datetime64 epoch
+EPOCH = date(1970, 1, 1).toordinal()
+
+
+def duration_minutes(value):
+    """'1h 27m' / '45m' / '2h' -> integer minutes, None when missing or unparsable."""
+    match = DURATION.fullmatch(value or "")
+    if not match or not any(match.groups()):
+        return None
+    hours, minutes = match.groups()
+    return int(hours or 0) * 60 + int(minutes or 0)
+
+
+def date_ordinal(value):
+    """'YYYY-MM-DD' -> date ordinal, None when missing or invalid."""
+    try:
+        return date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def month_numbers(ordinals):
+    """Months since 1970-01 of each date ordinal."""
+    if np is not None:
+        days = np.asarray(ordinals, dtype="int64") - EPOCH
+        return days.astype("datetime64[D]").astype("datetime64[M]").astype("int64")
+    months = []
+    for ordinal in ordinals:
+        day = date.fromordinal(ordinal)
+        months.append((day.year - 1970) * 12 + day.month - 1)
+    return months
+
+
+def rollup(keys, buckets, minutes, n_keys, n_buckets):
+    """(certificates, minutes): n_keys x n_buckets tables summed over rows
+    (keys[i], buckets[i]), as lists of lists."""
+    if np is not None:
+        flat = np.asarray(keys, dtype="int64") * n_buckets + np.asarray(buckets, dtype="int64")
+        size = n_keys * n_buckets
+        counts = np.bincount(flat, minlength=size).reshape(n_keys, n_buckets)
+        totals = np.bincount(flat, weights=np.asarray(minutes, dtype="float64"),
+                             minlength=size).reshape(n_keys, n_buckets)
+        return counts.tolist(), totals.astype("int64").tolist()
+    counts = [[0] * n_buckets for _ in range(n_keys)]
+    totals = [[0] * n_buckets for _ in range(n_keys)]
+    for key, bucket, value in zip(keys, buckets, minutes):
+        counts[key][bucket] += 1
+        totals[key][bucket] += value
+    return counts, totals
+
+
+def series(names, keys, months, years, minutes, axes):
+    """{name: {"monthly": {...}, "yearly": {...}}} for rows keyed by keys."""
+    result = {name: {} for name in names}
+    for period, buckets, size in (("monthly", months, len(axes["months"])),
+                                  ("yearly", years, len(axes["years"]))):
+        counts, totals = rollup(keys, buckets, minutes, len(names), size)
+        for name, count, total in zip(names, counts, totals):
+            result[name][period] = {"certificates": count, "minutes": total}
+    return result
+
+
+def build(certificates):
+    """The analytics structure of a list of learning-data.json certificates."""
+    normalized = [(date_ordinal(cert.get("date")), duration_minutes(cert.get("duration")), cert)
+                  for cert in certificates]
+    rows = [row for row in normalized if row[0] is not None]
+    summary = {
+        "certificates": len(certificates),
+        "dated": len(rows),
+        "with_duration": sum(1 for _, value, _ in normalized if value is not None),
+        "minutes": sum(value or 0 for _, value, _ in normalized),
+    }
+    if not rows:
+        return {"summary": summary, "months": [], "years": [], "total": {}, "domains": {}, "skills": {}}
+
+    month_of = [int(month) for month in month_numbers([ordinal for ordinal, _, _ in rows])]
+    first, last = min(month_of), max(month_of)
+    axes = {
+        "months": [f"{1970 + m // 12}-{m % 12 + 1:02d}" for m in range(first, last + 1)],
+        "years": [str(y) for y in range(1970 + first // 12, 1970 + last // 12 + 1)],
+    }
+    months = [m - first for m in month_of]
+    years = [m // 12 - first // 12 for m in month_of]
+    minutes = [value or 0 for _, value, _ in rows]
+
+    domains = sorted({cert["domain"] for _, _, cert in rows})
+    domain_code = {domain: i for i, domain in enumerate(domains)}
+
+    # Skills exploded: one row per (certificate, skill) for the top skills
+    frequency = {}
+    for _, _, cert in rows:
+        for skill in dict.fromkeys(cert.get("skills") or []):
+            frequency[skill] = frequency.get(skill, 0) + 1
+    skills = sorted(frequency, key=lambda skill: (-frequency[skill], skill))[:TOP_SKILLS]
+    skill_code = {skill: i for i, skill in enumerate(skills)}
+    exploded = [(i, skill_code[skill]) for i, (_, _, cert) in enumerate(rows)
+                for skill in dict.fromkeys(cert.get("skills") or []) if skill in skill_code]
+
+    return {
+        "summary": summary,
+        **axes,
+        "total": series(["total"], [0] * len(rows), months, years, minutes, axes)["total"],
+        "domains": series(domains, [domain_code[cert["domain"]] for _, _, cert in rows],
+                          months, years, minutes, axes),
+        "skills": series(skills, [code for _, code in exploded], [months[i] for i, _ in exploded],
+                         [years[i] for i, _ in exploded], [minutes[i] for i, _ in exploded], axes),
+    }
+
+
+def dump(analytics):
+    """learning-analytics.json bytes (compact: the page only parses it)."""
+    return (json.dumps(analytics, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def main():
+    data = json.loads(DATA.read_text(encoding="utf-8-sig"))
+    analytics = build(data["certificates"])
+    years = analytics["years"]
+    print(f"{'hours':<15}" + "".join(f"{year:>8}" for year in years))
+    for name, rollups in [("total", analytics["total"]), *analytics["domains"].items()]:
+        print(f"{name:<15}" + "".join(f"{m / 60:>8.1f}" for m in rollups["yearly"]["minutes"]))
+    summary = analytics["summary"]
+    print(f"\n{summary['dated']} of {summary['certificates']} certificates dated, "
+          f"{summary['with_duration']} with a duration ({summary['minutes'] / 60:.0f} hours); "
+          f"aggregated with {'NumPy' if np is not None else 'pure Python'}")
+
+
+if __name__ == "__main__":
+    main()
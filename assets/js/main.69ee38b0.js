@@ -0,0 +1,245 @@
+function switchLang(lang){
+document.querySelectorAll('.lang-content').forEach(el=>el.classList.remove('active'));
+document.querySelectorAll('.lang-toggle button').forEach(btn=>btn.classList.remove('active'));
+const selected=document.getElementById(lang);
+if(selected)selected.classList.add('active');
+const btn=document.querySelector(`.lang-toggle button[onclick*="${lang}"]`);
+if(btn)btn.classList.add('active');
+document.documentElement.setAttribute('lang',lang);
+document.documentElement.setAttribute('data-lang',lang);
+localStorage.setItem('language',lang);
+if(document.querySelector('.sidebar-nav a[data-target]')){
+updateSidebarLang(lang);
+initSmoothScroll();
+initNavigationHighlight();
+}
+if(window.initLearningPage){
+setTimeout(()=>{
+setupEventListeners();
+if(window.renderSkillsFilter){
+renderSkillsFilter();
+}
+const suffix=lang==='fr'?'-fr':'';
+if(window.filteredCertificates){
+renderCertificates(suffix);
+updateResultsCount(suffix);
+}
+},100);
+}
+}
+function updateSidebarLang(lang){
+const suffix=lang==='fr'?'-fr':'';
+document.querySelectorAll('.sidebar-nav a[data-target]').forEach(link=>{
+const base=link.getAttribute('data-target');
+link.setAttribute('href',`#${base}${suffix}`);
+});
+}
+function toggleTheme(){
+const currentTheme=document.documentElement.getAttribute('data-theme');
+const newTheme=currentTheme==='dark'?'light':'dark';
+document.documentElement.setAttribute('data-theme',newTheme);
+localStorage.setItem('theme',newTheme);
+updateThemeToggle(newTheme);
+}
+function updateThemeToggle(theme){
+const lightOption=document.getElementById('light-option');
+const darkOption=document.getElementById('dark-option');
+if(!lightOption||!darkOption)return;
+if(theme==='light'){
+lightOption.classList.add('active');
+darkOption.classList.remove('active');
+}else{
+darkOption.classList.add('active');
+lightOption.classList.remove('active');
+}
+}
+function initNavigationHighlight(){
+const activeContent=document.querySelector('.lang-content.active');
+if(!activeContent)return;
+const navLinks=document.querySelectorAll('.sidebar-nav a[href^="#"]');
+if(!navLinks.length)return;
+window.navigationClickTime=0;
+window.updateActiveNavLink=function(targetId){
+navLinks.forEach(link=>{
+link.classList.remove('active');
+if(link.getAttribute('href')===targetId){
+link.classList.add('active');
+}
+});
+};
+if(window.scrollHighlightHandler){
+window.removeEventListener('scroll',window.scrollHighlightHandler);
+}
+window.scrollHighlightHandler=function(){
+if(Date.now()-window.navigationClickTime<800){
+return;
+}
+const currentActiveContent=document.querySelector('.lang-content.active');
+if(!currentActiveContent)return;
+const currentSections=currentActiveContent.querySelectorAll('.section[id]');
+const scrollPosition=window.scrollY+200;
+let currentSection='';
+currentSections.forEach(section=>{
+const rect=section.getBoundingClientRect();
+const sectionTop=rect.top+window.scrollY;
+const sectionBottom=sectionTop+rect.height;
+if(scrollPosition>=sectionTop&&scrollPosition<=sectionBottom){
+currentSection='#'+section.id;
+}
+});
+if(currentSection&&window.updateActiveNavLink){
+updateActiveNavLink(currentSection);
+}
+};
+let isScrolling=false;
+window.addEventListener('scroll',()=>{
+if(!isScrolling){
+window.requestAnimationFrame(()=>{
+if(window.scrollHighlightHandler){
+window.scrollHighlightHandler();
+}
+isScrolling=false;
+});
+}
+isScrolling=true;
+});
+if(window.scrollHighlightHandler){
+setTimeout(()=>window.scrollHighlightHandler(),100);
+}
+}
+function initBackToTop(){
+const backToTop=document.createElement('button');
+backToTop.className='back-to-top';
+backToTop.innerHTML='↑';
+backToTop.setAttribute('aria-label','Back to top');
+backToTop.title='Back to top';
+document.body.appendChild(backToTop);
+window.addEventListener('scroll',()=>{
+if(window.pageYOffset>300){
+backToTop.classList.add('visible');
+}else{
+backToTop.classList.remove('visible');
+}
+});
+backToTop.addEventListener('click',()=>{
+window.scrollTo({
+top:0,
+behavior:'smooth'
+});
+});
+}
+function initSmoothScroll(){
+const navLinks=document.querySelectorAll('.sidebar-nav a[href^="#"]');
+navLinks.forEach(link=>{
+const newLink=link.cloneNode(true);
+link.parentNode.replaceChild(newLink,link);
+});
+document.querySelectorAll('.sidebar-nav a[href^="#"]').forEach(anchor=>{
+anchor.addEventListener('click',function(e){
+e.preventDefault();
+const targetId=this.getAttribute('href');
+window.navigationClickTime=Date.now();
+const activeContent=document.querySelector('.lang-content.active');
+if(!activeContent)return;
+const target=activeContent.querySelector(targetId);
+if(target){
+const headerOffset=80;
+const elementPosition=target.getBoundingClientRect().top;
+const offsetPosition=elementPosition+window.pageYOffset-headerOffset;
+window.scrollTo({
+top:offsetPosition,
+behavior:'smooth'
+});
+if(window.updateActiveNavLink){
+updateActiveNavLink(targetId);
+}
+}
+});
+});
+}
+function prefersReducedMotion(){
+return window.matchMedia('(prefers-reduced-motion: reduce)').matches;
+}
+function initReveal(){
+const targets=document.querySelectorAll('.reveal');
+if(!targets.length)return;
+document.querySelectorAll('[data-stagger]').forEach(group=>{
+Array.from(group.children).forEach((child,i)=>{
+if(child.classList.contains('reveal')){
+child.style.setProperty('--stagger-i',i);
+}
+});
+});
+if(prefersReducedMotion()||!('IntersectionObserver'in window)){
+targets.forEach(el=>el.classList.add('is-visible'));
+targets.forEach(el=>finalizeCounters(el));
+return;
+}
+const observer=new IntersectionObserver((entries)=>{
+entries.forEach(entry=>{
+if(entry.isIntersecting){
+entry.target.classList.add('is-visible');
+animateCounters(entry.target);
+observer.unobserve(entry.target);
+}
+});
+},{threshold:0.15,rootMargin:'0px 0px -10% 0px'});
+targets.forEach(el=>observer.observe(el));
+}
+function animateCounters(scope){
+scope.querySelectorAll('[data-count]:not([data-counted])').forEach(el=>{
+el.setAttribute('data-counted','true');
+const target=parseInt(el.getAttribute('data-count'),10);
+const suffix=el.getAttribute('data-suffix')||'';
+if(isNaN(target)||prefersReducedMotion()){
+el.textContent=target+suffix;
+return;
+}
+const duration=1200;
+const start=performance.now();
+function tick(now){
+const progress=Math.min((now-start)/duration,1);
+const eased=1-Math.pow(1-progress,3);
+el.textContent=Math.round(target*eased)+(progress===1?suffix:'');
+if(progress<1)requestAnimationFrame(tick);
+}
+requestAnimationFrame(tick);
+});
+}
+function finalizeCounters(scope){
+scope.querySelectorAll('[data-count]').forEach(el=>{
+el.setAttribute('data-counted','true');
+el.textContent=el.getAttribute('data-count')+(el.getAttribute('data-suffix')||'');
+});
+}
+function registerServiceWorker(){
+if(!('serviceWorker'in navigator))return;
+window.addEventListener('load',()=>{
+navigator.serviceWorker.register('/sw.js').catch(error=>{
+console.warn('Service worker registration failed:',error);
+});
+});
+}
+document.addEventListener('DOMContentLoaded',function(){
+const savedLang=localStorage.getItem('language')||'en';
+switchLang(savedLang);
+const currentTheme=document.documentElement.getAttribute('data-theme')||'light';
+updateThemeToggle(currentTheme);
+window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change',(e)=>{
+if(!localStorage.getItem('theme')){
+const newTheme=e.matches?'dark':'light';
+document.documentElement.setAttribute('data-theme',newTheme);
+updateThemeToggle(newTheme);
+}
+});
+initBackToTop();
+initReveal();
+registerServiceWorker();
+if(document.querySelector('.sidebar-nav a[href^="#"]')){
+initSmoothScroll();
+initNavigationHighlight();
+}
+if(window.initLearningPage){
+initLearningPage();
+}
+});
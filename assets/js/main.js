@@ -286,6 +286,17 @@ function finalizeCounters(scope) {
   });
 }
 
+// Offline support and instant repeat visits; /sw.js is generated by
+// assets/js/publish-site.py with a precache manifest of every asset.
+function registerServiceWorker() {
+  if (!('serviceWorker' in navigator)) return;
+  window.addEventListener('load', () => {
+    navigator.serviceWorker.register('/sw.js').catch(error => {
+      console.warn('Service worker registration failed:', error);
+    });
+  });
+}
+
 document.addEventListener('DOMContentLoaded', function () {
   // The pre-paint head snippet already set data-theme / lang / data-lang;
   // restore the language content visibility and sync toggle button states.
@@ -306,6 +317,7 @@ document.addEventListener('DOMContentLoaded', function () {
 
   initBackToTop();
   initReveal();
+  registerServiceWorker();
 
   if (document.querySelector('.sidebar-nav a[href^="#"]')) {
     initSmoothScroll();
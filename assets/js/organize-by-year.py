@@ -2,6 +2,9 @@
 """
 Organize LinkedIn Learning certificates by year based on PDF dates.
 Moves all PDFs to year folders and removes course folders.
+
+Years come from the PDF metadata (see year_probe.py); the page text is only
+read when the metadata is missing and for a sample of files.
 """
 
 import os
@@ -10,6 +13,8 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
+from year_probe import YearProbe
+
 try:
     import pypdf
     HAS_PDF = True
@@ -69,6 +74,7 @@ def organize_pdfs():
     
     organized = 0
     failed = 0
+    probe = YearProbe(extract_year_from_pdf)
     
     for pdf_file in all_pdfs:
         try:
@@ -76,8 +82,8 @@ def organize_pdfs():
             if pdf_file.parent.name.isdigit() and len(pdf_file.parent.name) == 4:
                 continue
             
-            # Extract year from PDF
-            year = extract_year_from_pdf(pdf_file)
+            # Extract year from PDF metadata (text as fallback)
+            year = probe.year(pdf_file)
             
             # Fallback: check folder name
             if not year:
@@ -111,6 +117,7 @@ def organize_pdfs():
             failed += 1
     
     print(f"\n✓ Organized {organized} PDFs into year folders")
+    print(f"✓ {probe.summary()}")
     if failed > 0:
         print(f"⚠ {failed} PDFs failed")
     
@@ -125,7 +132,8 @@ def cleanup_folders(archived_path):
     
     # First pass: remove all non-PDF files
     for item in archived_path.rglob('*'):
-        if item.is_file() and not item.name.endswith('.pdf'):
+        # Files directly in archived/ (the catalog, text store, reports) are kept
+        if item.is_file() and not item.name.endswith('.pdf') and item.parent != archived_path:
             try:
                 item.unlink()
                 removed_files += 1
@@ -0,0 +1,1645 @@
+#!/usr/bin/env python3
+"""Publish stage: derive the generated parts of the site from the
+certificate catalog (archived/learning-catalog.sqlite, see catalog.py).
+
+Exports assets/data/learning-data.json from the catalog, loads the dataset
+once and regenerates:
+  - the CollectionPage JSON-LD in pages/learning.html (top 30 certificates,
+    queried from the catalog's date index)
+  - the prerendered first certificate cards, skill facets and stat counts
+    in pages/learning.html, so first paint needs no fetch
+  - the certificate counts quoted in llms.txt
+  - static landing pages per domain and per year
+    (pages/learning-<domain|year>.html, then -2.html, ... of 24 cards
+    each) carrying only their slice of certificate cards, a CollectionPage
+    JSON-LD and canonical links, listed in sitemap.xml; a page is only
+    regenerated when its content changes
+  - assets/data/learning-analytics.json: monthly and yearly certificate
+    counts and minutes learned, in total, per domain and per top skill
+    (see learning_analytics.py), ready to chart
+  - archived/exports/: the catalog as typed columnar tables (certificates
+    and their exploded skills) for notebooks and BI tools, in Parquet with
+    pyarrow and CSV without (see columnar_export.py); rewritten only when
+    the certificates change
+  - favicon / apple-touch-icon / favicon.ico sizes and AVIF, WebP and
+    fallback variants of the site images at several widths, with
+    <picture> srcset/sizes markup rewritten into the pages (needs Pillow;
+    outputs are cached by source hash, so unchanged images are skipped)
+  - per-page critical CSS (rules matching the first elements of the page)
+    inlined into <head>, with the full stylesheets loaded non-blocking
+  - minified, content-hashed copies of the dataset, scripts and stylesheets
+    (e.g. learning-data.<hash>.json), with every reference rewritten to
+    them and stale fingerprints pruned, so they can be cached forever
+  - precache-manifest.json (every static asset with its content hash) and
+    the service worker /sw.js built from assets/js/service-worker.js
+  - maximum-level .gz (and .br, when the brotli package is installed)
+    siblings of every served HTML, JSON, JS, CSS and SVG file, for
+    assets/js/serve-site.py and hosts that serve precompressed files
+  - the <lastmod> dates in sitemap.xml
+
+Every artifact is written only when its content hash changes, so untouched
+files keep their mtimes (and their CDN cache entries). Run from anywhere:
+
+    python assets/js/publish-site.py
+    python assets/js/publish-site.py --watch   # rebuild whenever a source changes
+"""
+
+import argparse
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+import subprocess
+import time
+from datetime import date, datetime
+from html.parser import HTMLParser
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+import catalog
+import columnar_export
+import learning_analytics
+
+ROOT = Path(__file__).resolve().parents[2]
+DATA = ROOT / "assets" / "data" / "learning-data.json"
+PAGE = ROOT / "pages" / "learning.html"
+LLMS = ROOT / "llms.txt"
+SITEMAP = ROOT / "sitemap.xml"
+TOP_N = 30
+PRERENDER_CARDS = 24
+PRERENDER_SKILLS = 30
+SITE = "https://brbousnguar.github.io"
+HASH_LENGTH = 8
+
+# Fingerprinted assets, in dependency order: the dataset comes first because
+# the scripts reference it, so their hashes must cover the rewritten URL.
+FINGERPRINT_SOURCES = [
+    ROOT / "assets" / "data" / "learning-data.json",
+    ROOT / "assets" / "js" / "learning.js",
+    ROOT / "assets" / "js" / "main.js",
+    ROOT / "assets" / "css" / "style.css",
+    ROOT / "assets" / "css" / "about.css",
+    ROOT / "assets" / "css" / "learning.css",
+]
+SERVICE_WORKER_SOURCE = ROOT / "assets" / "js" / "service-worker.js"
+SERVICE_WORKER = ROOT / "sw.js"
+PRECACHE_MANIFEST = ROOT / "precache-manifest.json"
+# Static files precached besides the pages, fingerprinted assets and the
+# <img> fallback of each responsive picture (the variant a browser picks is
+# left to the cache-first runtime route)
+PRECACHE_GLOBS = ["favicon.ico"]
+IMAGE_DIR = ROOT / "assets" / "img" / "generated"
+IMAGE_CACHE = IMAGE_DIR / "image-cache.json"
+FAVICON_SOURCE = "assets/img/favicon.png"
+FAVICON_ICO = ROOT / "favicon.ico"
+# (source glob, display widths in CSS px, sizes attribute). 2x/3x widths are
+# derived from these and capped at the source's own width.
+RESPONSIVE_IMAGES = [
+    ("assets/img/profile.jpeg", [120, 180], "(max-width: 900px) 120px, 180px"),
+    ("assets/img/favicon.png", [40], "40px"),
+    ("assets/icons/icon-*.png", [32], "32px"),
+]
+# Output encodings in <source> order; the fallback keeps the source format
+IMAGE_FORMATS = [("avif", "image/avif", {"quality": 50}),
+                 ("webp", "image/webp", {"quality": 80, "method": 6})]
+FALLBACK_OPTIONS = {"JPEG": {"quality": 82, "optimize": True, "progressive": True},
+                    "PNG": {"optimize": True}}
+RESPONSIVE_MARKUP = re.compile(
+    r'<picture data-responsive>\s*(?:<source[^>]*>\s*)*(<img\b[^>]*>)\s*</picture>|<img\b[^>]*>')
+LINK_TAG = re.compile(r'<link rel="(icon|apple-touch-icon)"[^>]*>')
+ATTRIBUTE = re.compile(r'([\w-]+)="([^"]*)"')
+
+# Elements from the top of <body> treated as above the fold
+FOLD_ELEMENTS = 200
+# Set by the pre-paint script or main.js before the full CSS arrives
+DYNAMIC_CLASSES = {"js", "active", "is-visible", "visible"}
+DYNAMIC_ATTRIBUTES = {"data-theme", "lang", "data-lang"}
+STYLESHEET_LINK = re.compile(
+    r'<link rel="preload" href="(?P<pre>[^"]*assets/css/[^"]+)" as="style"[^>]*>'
+    r'<noscript><link rel="stylesheet" href="(?P=pre)"></noscript>'
+    r'|<link rel="stylesheet" href="(?P<href>[^"]*assets/css/[^"]+)">')
+CRITICAL_STYLE = re.compile(r"<style data-critical>.*?</style>", re.DOTALL)
+
+# Served text formats that get precompressed siblings
+COMPRESSIBLE = {".html", ".json", ".js", ".css", ".svg"}
+# Directories that are not part of the served site (or hold only PDFs)
+UNSERVED_DIRS = {".git", ".github", ".vscode", "archived", "docs", "__pycache__"}
+
+JSONLD_OPEN = '<script type="application/ld+json">'
+JSONLD_CLOSE = "</script>"
+COLLECTION_MARKER = '"@type": "CollectionPage"'
+
+# Per-domain and per-year landing pages (pages/learning-<key>.html, then
+# learning-<key>-2.html, ... of LANDING_PAGE_SIZE cards each); the marker
+# holds the hash of the page's content
+LANDING_DIR = ROOT / "pages"
+LANDING_PAGE_SIZE = 24
+LANDING_MARKER = "<!-- landing-slice:{digest} -->"
+FILTER_OPTION = re.compile(r'<option value="([^"]*)">([^<]*)</option>')
+LANDING_SITEMAP_ENTRY = re.compile(
+    r"  <url>\s*<loc>" + re.escape(SITE) + r"/pages/learning-[^<]+\.html</loc>.*?</url>\n", re.DOTALL)
+LANDING_TEMPLATE = """<!DOCTYPE html>
+<html lang="en" data-lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+  <!-- landing-slice: -->
+  <title>{title} | Brahim Bousnguar</title>
+  <meta name="description" content="{description}">
+  <meta property="og:type" content="website">
+  <meta property="og:url" content="{url}">
+  <meta property="og:title" content="{title} | Brahim Bousnguar">
+  <meta property="og:description" content="{description}">
+  <meta property="og:image" content="{site}/assets/img/profile.jpeg">
+  <meta name="author" content="Brahim Bousnguar">
+  <meta name="robots" content="index, follow">
+  <link rel="canonical" href="{url}">
+  <link rel="alternate" hreflang="en" href="{url}">
+  <link rel="alternate" hreflang="x-default" href="{url}">{pager_links}
+  <link rel="icon" type="image/png" href="../assets/img/favicon.png">
+  <meta name="theme-color" media="(prefers-color-scheme: light)" content="#faf9f7">
+  <meta name="theme-color" media="(prefers-color-scheme: dark)" content="#121110">
+  {script}
+  <link rel="stylesheet" href="../assets/css/style.css">
+  <script src="../assets/js/main.js" defer></script>
+  <link rel="stylesheet" href="../assets/css/learning.css">
+{jsonld}
+</head>
+<body>
+  <a href="#main-content" class="skip-link">Skip to main content</a>
+  {header}
+    <main class="main-content" id="main-content">
+      <div class="container">
+        <nav class="breadcrumb" aria-label="Breadcrumb">
+          <a href="../index.html">Home</a>
+          <span class="separator" aria-hidden="true">›</span>
+          <a href="learning.html">Learning & Certifications</a>
+          <span class="separator" aria-hidden="true">›</span>
+          <span>{title}</span>
+        </nav>
+{sections}
+      </div>
+    </main>
+  </div>
+</body>
+</html>
+"""
+
+# Prerendered regions are delimited by <!-- prerender:NAME --> ... <!-- /prerender:NAME -->
+PRERENDER_REGION = "<!-- prerender:{name} -->"
+PRERENDER_REGION_END = "<!-- /prerender:{name} -->"
+
+# (pattern, replacement template) pairs for the counts quoted in llms.txt
+LLMS_COUNTS = [
+    (re.compile(r"\d+\+ LinkedIn Learning certificates across \d+ technology domains"),
+     "{total}+ LinkedIn Learning certificates across {domains} technology domains"),
+    (re.compile(r"all \d+ LinkedIn Learning certificates"),
+     "all {total} LinkedIn Learning certificates"),
+    (re.compile(r"\(\d+ entries with"),
+     "({total} entries with"),
+]
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path, text):
+    """Write text (str or bytes) to path only if its bytes differ from what
+    is on disk.
+
+    Returns True when the file was (re)written.
+    """
+    new = text.encode("utf-8") if isinstance(text, str) else text
+    if path.exists() and content_hash(path.read_bytes()) == content_hash(new):
+        return False
+    path.write_bytes(new)
+    return True
+
+
+def course_items(certificates, start=1):
+    """schema.org ListItems of Course entries for certificates, numbered
+    from start."""
+    items = []
+    for cert in certificates:
+        item = {
+            "@type": "Course",
+            "name": cert["title"],
+            "provider": {
+                "@type": "Organization",
+                "name": cert.get("provider") or "LinkedIn Learning",
+            },
+            "datePublished": cert.get("date") or "",
+        }
+        if cert.get("duration"):
+            item["timeRequired"] = cert["duration"]
+        if cert.get("skills"):
+            item["about"] = cert["skills"]
+        items.append({
+            "@type": "ListItem",
+            "position": start + len(items),
+            "item": item,
+        })
+    return items
+
+
+def build_schema(data):
+    items = course_items(data["top_certificates"])
+
+    total = data["metadata"]["total"]
+    domains = data["metadata"]["domains"]
+    return {
+        "@context": "https://schema.org",
+        "@type": "CollectionPage",
+        "name": "Continuous Learning & Certifications - Brahim Bousnguar",
+        "description": (
+            f"{total} LinkedIn Learning certificates across {domains} technology "
+            "domains including AI, Programming, Cloud, DevOps, and APIs"
+        ),
+        "url": f"{SITE}/pages/learning.html",
+        "mainEntity": {
+            "@type": "ItemList",
+            "numberOfItems": total,
+            "itemListElement": items,
+        },
+        "about": {
+            "@type": "Person",
+            "name": "Brahim Bousnguar",
+            "jobTitle": "Senior E-Commerce Integration Consultant",
+        },
+    }
+
+
+def find_collection_block(page):
+    """Return (start, end) of the <script> element holding the CollectionPage
+    JSON-LD, using plain substring scans instead of a regex over the page."""
+    marker = page.find(COLLECTION_MARKER)
+    if marker == -1:
+        return None
+    start = page.rfind(JSONLD_OPEN, 0, marker)
+    end = page.find(JSONLD_CLOSE, marker)
+    # The marker must sit inside a single JSON-LD <script> element
+    if start == -1 or end == -1 or page.find(JSONLD_CLOSE, start, marker) != -1:
+        return None
+    return start, end + len(JSONLD_CLOSE)
+
+
+def publish_schema(data, changed):
+    schema = build_schema(data)
+    block = json.dumps(schema, indent=2, ensure_ascii=False)
+    # Match the page's 2-space base indentation inside the <script> tag
+    block = "\n".join("  " + line for line in block.splitlines())
+
+    page = PAGE.read_text(encoding="utf-8")
+    span = find_collection_block(page)
+    if span is None:
+        raise SystemExit("CollectionPage JSON-LD block not found in learning.html")
+
+    start, end = span
+    page = page[:start] + JSONLD_OPEN + "\n" + block + "\n  " + JSONLD_CLOSE + page[end:]
+    if write_if_changed(PAGE, page):
+        changed.add(PAGE)
+    print(f"JSON-LD: numberOfItems={data['metadata']['total']}, "
+          f"top {len(schema['mainEntity']['itemListElement'])} certificates")
+
+
+def publish_llms(data, changed):
+    counts = {
+        "total": data["metadata"]["total"],
+        "domains": data["metadata"]["domains"],
+    }
+    text = LLMS.read_text(encoding="utf-8")
+    for pattern, template in LLMS_COUNTS:
+        text = pattern.sub(template.format(**counts), text)
+    if write_if_changed(LLMS, text):
+        changed.add(LLMS)
+    print(f"llms.txt: {counts['total']} certificates, {counts['domains']} domains")
+
+
+def publish_analytics(data, changed):
+    analytics = learning_analytics.build(data["certificates"])
+    if write_if_changed(learning_analytics.ANALYTICS, learning_analytics.dump(analytics)):
+        changed.add(learning_analytics.ANALYTICS)
+    engine = "NumPy" if learning_analytics.np is not None else "pure Python"
+    print(f"Analytics: {len(analytics['months'])} months, {len(analytics['domains'])} domains, "
+          f"{len(analytics['skills'])} skills ({engine})")
+
+
+def publish_columnar(data, changed):
+    manifest, written = columnar_export.export(data["certificates"])
+    changed.update(written)
+    tables = ", ".join(f"{name} {table['rows']} rows" for name, table in manifest["tables"].items())
+    print(f"Columnar export: {manifest['format']}, {tables}{'' if written else ' (up to date)'}")
+
+
+def escape_html(text):
+    """Same escaping as learning.js escapeHtml (textContent -> innerHTML)."""
+    return html.escape(str(text), quote=False)
+
+
+def format_domain_name(domain):
+    return " ".join(word[:1].upper() + word[1:] for word in domain.split("_"))
+
+
+def format_date(date_string):
+    """YYYY-MM-DD -> dd-mm-yyyy, as learning.js formatDate."""
+    parts = date_string.split("-")
+    if len(parts) == 3:
+        return f"{parts[2]}-{parts[1]}-{parts[0]}"
+    return date_string
+
+
+def certificate_card(cert, is_fr=False):
+    """Card markup mirroring createCertificateCard() in learning.js.
+
+    Returns a list of lines; the caller indents them into the page.
+    """
+    domain = cert["domain"]
+    domain_name = format_domain_name(domain)
+    skills_html = "".join(
+        f'<span class="skill-badge-learning">{escape_html(skill)}</span>'
+        for skill in cert.get("skills") or []
+        if skill.lower() not in (domain.lower(), domain_name.lower())
+    )
+    formatted_date = format_date(cert["date"]) if cert.get("date") else (cert.get("year") or "")
+
+    lines = [
+        f'<div class="certificate-card-learning" data-domain="{domain}" '
+        f'data-year="{cert.get("year")}" data-id="{cert["id"]}" data-prerendered>',
+        '  <div class="certificate-header-learning">',
+        f'    <h3 class="certificate-title-learning">{escape_html(cert["title"])}</h3>',
+        '  </div>',
+        '  <div class="certificate-meta-learning">',
+    ]
+    if formatted_date:
+        lines.append(f"    <span>{formatted_date}</span>")
+    if cert.get("duration"):
+        lines.append(f"    <span>{cert['duration']}</span>")
+    lines += [
+        '  </div>',
+        f'  <div class="certificate-skills-learning">{skills_html}</div>',
+    ]
+    # Certificates synced from the archive metadata may not have a local PDF yet
+    if cert.get("path"):
+        lines += [
+            '  <div class="certificate-actions">',
+            f'    <a href="/{cert["path"]}" target="_blank" rel="noopener noreferrer" '
+            'class="certificate-link-learning">',
+            f'      {"Voir le Certificat" if is_fr else "View Certificate"}',
+            '    </a>',
+            '  </div>',
+        ]
+    lines.append('</div>')
+    return lines
+
+
+def skill_counts(certificates):
+    """(skill, count) pairs, most frequent first, as getAllSkillsWithCounts()."""
+    counts = {}
+    for cert in certificates:
+        for skill in cert.get("skills") or []:
+            key = skill.lower().strip()
+            if key:
+                counts[key] = counts.get(key, 0) + 1
+    return sorted(counts.items(), key=lambda item: -item[1])
+
+
+def skill_button(skill, count):
+    """Skill facet markup mirroring renderSkillsFilter() in learning.js."""
+    skill = escape_html(skill)
+    return (
+        f'<button type="button" class="skill-filter-btn" data-skill="{skill}" '
+        f'aria-label="Filter by {skill} ({count} certificates)">'
+        f'<span class="skill-name">{skill}</span>'
+        f'<span class="skill-count">{count}</span></button>'
+    )
+
+
+def replace_region(page, name, lines):
+    """Swap the content between a pair of prerender markers, indenting
+    each line to the markers' own indentation."""
+    open_marker = PRERENDER_REGION.format(name=name)
+    close_marker = PRERENDER_REGION_END.format(name=name)
+    start = page.find(open_marker)
+    end = page.find(close_marker, start)
+    if start == -1 or end == -1:
+        raise SystemExit(f"Prerender region '{name}' not found in learning.html")
+    start += len(open_marker)
+    indent = page[page.rfind("\n", 0, end) + 1:end]
+    content = "".join("\n" + indent + line for line in lines)
+    return page[:start] + content + "\n" + indent + page[end:]
+
+
+def replace_element_text(page, element_id, content):
+    """Replace the inner HTML of a single-line element by id."""
+    pattern = re.compile(r'(<(\w+)[^>]*\bid="' + re.escape(element_id) + r'"[^>]*>).*?(</\2>)')
+    page, found = pattern.subn(lambda m: m.group(1) + content + m.group(3), page, count=1)
+    if not found:
+        raise SystemExit(f"Element #{element_id} not found in learning.html")
+    return page
+
+
+def prerender_learning(data, changed):
+    certificates = data["certificates"]
+    metadata = data["metadata"]
+    # The cards learning.js renders first: the dataset's leading rows
+    first = certificates[:PRERENDER_CARDS]
+    skills = skill_counts(certificates)[:PRERENDER_SKILLS]
+    total = metadata.get("total") or len(certificates)
+    domains = metadata.get("domains") or len({c["domain"] for c in certificates})
+    years = len(metadata.get("years") or {c["year"] for c in certificates})
+
+    page = PAGE.read_text(encoding="utf-8")
+    buttons = [skill_button(skill, count) for skill, count in skills]
+    for suffix, is_fr in (("", False), ("-fr", True)):
+        cards = [line for cert in first for line in certificate_card(cert, is_fr)]
+        page = replace_region(page, "certificates" + suffix, cards)
+        page = replace_region(page, "skills" + suffix, buttons)
+        page = replace_element_text(page, "total-certificates" + suffix, str(total))
+        page = replace_element_text(page, "total-domains" + suffix, f"{domains}+")
+        page = replace_element_text(page, "active-years" + suffix, f"{years}+")
+        results = (f"Affichage de <strong>{total}</strong> certificats" if is_fr
+                   else f"Showing <strong>{total}</strong> certificates")
+        page = replace_element_text(page, "results-count" + suffix, results)
+
+    if write_if_changed(PAGE, page):
+        changed.add(PAGE)
+    print(f"Prerender: {len(first)} cards, {len(skills)} skill facets per language")
+
+
+def filter_labels(page, select_id):
+    """{value: label} of the <option>s of a <select> in page."""
+    start = page.find(f'<select id="{select_id}"')
+    end = page.find("</select>", start)
+    if start == -1 or end == -1:
+        raise SystemExit(f"Select #{select_id} not found in learning.html")
+    return {value: html.unescape(label) for value, label in FILTER_OPTION.findall(page[start:end])}
+
+
+def landing_slices(certificates, page):
+    """{landing page: (kind, key, {"en": label, "fr": label}, certificates
+    newest first)}, one per domain and one per year. Domains are labelled as
+    in learning.html's domain filter."""
+    labels = {"en": filter_labels(page, "domain-filter"), "fr": filter_labels(page, "domain-filter-fr")}
+    newest = sorted(certificates, key=lambda c: (c.get("date") or "", c["title"]), reverse=True)
+    slices = {}
+    for kind in ("domain", "year"):
+        for key in sorted({c.get(kind) for c in newest if c.get(kind)}):
+            names = {lang: key if kind == "year" else labels[lang].get(key) or format_domain_name(key)
+                     for lang in labels}
+            slices[LANDING_DIR / f"learning-{key}.html"] = (
+                kind, key, names, [c for c in newest if c.get(kind) == key])
+    return slices
+
+
+def plural(count, word):
+    """'1 certificate', '2 certificates' (also right for 'certificat')."""
+    return f"{count} {word}{'' if count == 1 else 's'}"
+
+
+def landing_title(names, lang="en", number=1):
+    title = f"Certificats {names['fr']}" if lang == "fr" else f"{names['en']} Certificates"
+    return title if number == 1 else f"{title} - Page {number}"
+
+
+def landing_url(page):
+    return f"{SITE}/{page.relative_to(ROOT).as_posix()}"
+
+
+def landing_description(kind, key, names, certificates):
+    scope = f"completed in {key}" if kind == "year" else f"in {names['en']}"
+    return f"{plural(len(certificates), 'LinkedIn Learning certificate')} {scope} by Brahim Bousnguar."
+
+
+def landing_pages(page, certificates):
+    """[(path, certificates)] of the pages of a slice, LANDING_PAGE_SIZE
+    cards each: the slice's own page, then <stem>-2.html, <stem>-3.html, ..."""
+    chunks = [certificates[i:i + LANDING_PAGE_SIZE]
+              for i in range(0, len(certificates), LANDING_PAGE_SIZE)] or [[]]
+    return [(page if number == 1 else page.with_name(f"{page.stem}-{number}.html"), chunk)
+            for number, chunk in enumerate(chunks, 1)]
+
+
+def landing_schemas(url, number, kind, key, names, certificates, chunk):
+    """(BreadcrumbList, CollectionPage) JSON-LD of one page of a slice."""
+    title = landing_title(names, number=number)
+    breadcrumb = {
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {"@type": "ListItem", "position": 1, "name": "Home", "item": f"{SITE}/"},
+            {"@type": "ListItem", "position": 2, "name": "Learning", "item": f"{SITE}/pages/learning.html"},
+            {"@type": "ListItem", "position": 3, "name": title, "item": url},
+        ],
+    }
+    collection = {
+        "@context": "https://schema.org",
+        "@type": "CollectionPage",
+        "name": f"{title} - Brahim Bousnguar",
+        "description": landing_description(kind, key, names, certificates),
+        "url": url,
+        "isPartOf": {"@type": "CollectionPage", "url": f"{SITE}/pages/learning.html"},
+        "mainEntity": {
+            "@type": "ItemList",
+            "numberOfItems": len(certificates),
+            "itemListElement": course_items(chunk, start=(number - 1) * LANDING_PAGE_SIZE + 1),
+        },
+    }
+    return breadcrumb, collection
+
+
+def landing_links(page, slices, lang):
+    """Links to every landing page, styled as skill facets."""
+    headings = {"domain": {"en": "Domains", "fr": "Domaines"}, "year": {"en": "Years", "fr": "Années"}}
+    lines = []
+    for kind, heading in headings.items():
+        lines += [f'<p class="skills-filter-label">{heading[lang]}</p>', '<nav class="skills-list">']
+        for other, (other_kind, _, names, certs) in slices.items():
+            if other_kind == kind:
+                current = ' aria-current="page"' if other == page else ""
+                lines.append(f'  <a class="skill-filter-btn" href="{other.name}"{current}>'
+                             f'<span class="skill-name">{escape_html(names[lang])}</span>'
+                             f'<span class="skill-count">{len(certs)}</span></a>')
+        lines.append('</nav>')
+    return lines
+
+
+def landing_pager(paths, number):
+    """Links to the pages of a slice (none when it has a single page)."""
+    if len(paths) == 1:
+        return []
+    lines = ['<nav class="skills-list" aria-label="Pages">']
+    for other_number, other in enumerate(paths, 1):
+        current = ' aria-current="page"' if other_number == number else ""
+        lines.append(f'  <a class="skill-filter-btn" href="{other.name}"{current}>'
+                     f'<span class="skill-name">{other_number}</span></a>')
+    lines.append('</nav>')
+    return lines
+
+
+def landing_chrome(page):
+    """(pre-paint script, header + sidebar markup) of learning.html, shared
+    by the landing pages."""
+    script_start = page.find("<script>")
+    script_end = page.find("</script>", script_start)
+    chrome_start = page.find('<header class="top-header">')
+    chrome_end = page.find("</aside>", chrome_start)
+    if -1 in (script_start, script_end, chrome_start, chrome_end):
+        raise SystemExit("Header or pre-paint script not found in learning.html")
+    return (page[script_start:script_end + len("</script>")],
+            page[chrome_start:chrome_end + len("</aside>")])
+
+
+def landing_page(slice_page, paths, number, chunk, slices, chrome):
+    """Page number (from 1) of the slice of slice_page, holding chunk."""
+    kind, key, names, certificates = slices[slice_page]
+    script, header = chrome
+    url = landing_url(paths[number - 1])
+    jsonld = "\n".join(
+        "  " + JSONLD_OPEN + "\n"
+        + "\n".join("  " + line for line in json.dumps(schema, indent=2, ensure_ascii=False).splitlines())
+        + "\n  " + JSONLD_CLOSE
+        for schema in landing_schemas(url, number, kind, key, names, certificates, chunk))
+    pager_links = "".join(f'\n  <link rel="{rel}" href="{landing_url(paths[other - 1])}">'
+                          for rel, other in (("prev", number - 1), ("next", number + 1))
+                          if 1 <= other <= len(paths))
+    pages = f" Page {number}/{len(paths)}." if len(paths) > 1 else ""
+    sections = []
+    for lang in ("en", "fr"):
+        intro = (f'{plural(len(certificates), "certificat")} LinkedIn Learning.{pages} '
+                 f'<a href="learning.html">Parcourir tous les certificats</a>' if lang == "fr" else
+                 f'{plural(len(certificates), "LinkedIn Learning certificate")}.{pages} '
+                 f'<a href="learning.html">Browse all certificates</a>')
+        sections += [
+            f'<div id="{lang}" class="lang-content{" active" if lang == "en" else ""}">',
+            '  <section class="learning-header">',
+            f'    <h1>{escape_html(landing_title(names, lang, number))}</h1>',
+            f'    <p class="learning-subtitle">{intro}</p>',
+            '  </section>',
+            *("  " + line for line in landing_links(slice_page, slices, lang)),
+            '</div>',
+        ]
+    # One card list for both languages keeps the page light
+    sections += [
+        '<section class="certificates-container">',
+        '  <div class="certificates-grid list-view">',
+        *("    " + line for cert in chunk for line in certificate_card(cert)),
+        '  </div>',
+        *("  " + line for line in landing_pager(paths, number)),
+        '</section>',
+    ]
+    return LANDING_TEMPLATE.format(
+        title=escape_html(landing_title(names, number=number)),
+        description=escape_html(landing_description(kind, key, names, certificates)),
+        url=url, pager_links=pager_links, site=SITE, script=script, jsonld=jsonld, header=header,
+        sections="\n".join("        " + line for line in sections))
+
+
+def landing_sitemap(xml, paths):
+    """sitemap.xml with one <url> per landing page, replacing the old ones.
+    Pages already listed keep their <lastmod>; new ones get an empty one,
+    which publish_sitemap fills in."""
+    lastmod = dict(re.findall(r"<loc>([^<]*)</loc>\s*<lastmod>([^<]*)</lastmod>",
+                              "".join(LANDING_SITEMAP_ENTRY.findall(xml))))
+    xml = LANDING_SITEMAP_ENTRY.sub("", xml)
+    entries = "".join(
+        f"  <url>\n    <loc>{url}</loc>\n    <lastmod>{lastmod.get(url, '')}</lastmod>\n"
+        f"    <changefreq>monthly</changefreq>\n    <priority>0.6</priority>\n  </url>\n"
+        for url in map(landing_url, paths))
+    return xml.replace("</urlset>", entries + "</urlset>")
+
+
+def publish_landing_pages(data, changed):
+    learning = PAGE.read_text(encoding="utf-8")
+    slices = landing_slices(data["certificates"], learning)
+    chrome = landing_chrome(learning)
+    # The links to the other slices (names and counts) are part of every page
+    siblings = [(page.name, names, len(certs)) for page, (_, _, names, certs) in slices.items()]
+    written = removed = 0
+    published = []
+    for slice_page, (_, _, _, certificates) in slices.items():
+        pages = landing_pages(slice_page, certificates)
+        paths = [path for path, _ in pages]
+        published += paths
+        for number, (path, chunk) in enumerate(pages, 1):
+            # Only a page whose content (or shared markup) changed is
+            # regenerated; the later stages post-process it in place
+            digest = content_hash(json.dumps(
+                [LANDING_TEMPLATE, chrome, siblings, len(certificates), number, len(paths),
+                 [cert.to_dict() for cert in chunk]], sort_keys=True).encode("utf-8"))[:HASH_LENGTH * 2]
+            if path.exists() and LANDING_MARKER.format(digest=digest) in path.read_text(encoding="utf-8"):
+                continue
+            text = landing_page(slice_page, paths, number, chunk, slices, chrome)
+            text = text.replace(LANDING_MARKER.format(digest=""), LANDING_MARKER.format(digest=digest), 1)
+            path.write_text(text, encoding="utf-8")
+            changed.add(path)
+            written += 1
+
+    marker_prefix = LANDING_MARKER.split("{")[0]
+    for page in LANDING_DIR.glob("learning-*.html"):
+        if page not in published and marker_prefix in page.read_text(encoding="utf-8"):
+            page.unlink()
+            changed.add(page)
+            removed += 1
+
+    if write_if_changed(SITEMAP, landing_sitemap(SITEMAP.read_text(encoding="utf-8"), published)):
+        changed.add(SITEMAP)
+    print(f"Landing pages: {len(published)} pages for {len(slices)} slices, "
+          f"{written} regenerated, {removed} removed")
+
+
+def load_image_cache():
+    if IMAGE_CACHE.exists():
+        return json.loads(IMAGE_CACHE.read_text(encoding="utf-8"))
+    return {"sources": {}}
+
+
+def variant_path(source, label, digest, extension):
+    """assets/img/profile.jpeg -> assets/img/generated/profile-180.<hash>.webp"""
+    return IMAGE_DIR / f"{source.stem}-{label}.{digest[:HASH_LENGTH]}.{extension}"
+
+
+def rel_url(path):
+    return path.relative_to(ROOT).as_posix()
+
+
+def resized(image, width):
+    height = round(image.height * width / image.width)
+    return image.resize((width, height), Image.LANCZOS)
+
+
+def render_variants(source, digest, widths):
+    """Encode every width in every format; returns the cache entry."""
+    image = Image.open(source)
+    image.load()
+    fallback_format = image.format
+    extension = source.suffix.lstrip(".").lower()
+    targets = sorted({min(w * scale, image.width) for w in widths for scale in (1, 2, 3)})
+
+    variants = []
+    for width in targets:
+        frame = resized(image, width) if width < image.width else image.copy()
+        for name, mime, options in IMAGE_FORMATS + [(fallback_format, None, None)]:
+            if mime is None:
+                out = variant_path(source, width, digest, extension)
+                mime = Image.MIME.get(fallback_format, "image/" + extension)
+                options = FALLBACK_OPTIONS.get(fallback_format, {})
+                frame_out = frame.convert("RGB") if fallback_format == "JPEG" else frame
+            else:
+                out = variant_path(source, width, digest, name)
+                frame_out = frame
+            frame_out.save(out, format=name.upper(), **options)
+            variants.append({"path": rel_url(out), "width": width, "type": mime})
+    return {"hash": digest, "width": image.width, "height": image.height,
+            "variants": variants}
+
+
+def render_favicons(source, digest):
+    image = Image.open(source)
+    image.load()
+    icon = variant_path(source, 32, digest, "png")
+    resized(image, 32).save(icon, format="PNG", optimize=True)
+    touch = IMAGE_DIR / f"apple-touch-icon.{digest[:HASH_LENGTH]}.png"
+    resized(image, 180).save(touch, format="PNG", optimize=True)
+    image.save(FAVICON_ICO, format="ICO", sizes=[(16, 16), (32, 32), (48, 48)])
+    return {"icon": rel_url(icon), "apple-touch-icon": rel_url(touch),
+            "ico": rel_url(FAVICON_ICO)}
+
+
+def entry_outputs(entry):
+    outputs = [v["path"] for v in entry.get("variants", [])]
+    return outputs + list(entry.get("favicons", {}).values())
+
+
+def build_images(data, changed):
+    cache = load_image_cache()
+    sources = {}
+    for pattern, widths, sizes in RESPONSIVE_IMAGES:
+        for source in sorted(ROOT.glob(pattern)):
+            sources[rel_url(source)] = (source, widths, sizes)
+
+    built = skipped = 0
+    IMAGE_DIR.mkdir(parents=True, exist_ok=True)
+    for rel, (source, widths, sizes) in sources.items():
+        digest = content_hash(source.read_bytes())
+        entry = cache["sources"].get(rel)
+        if (entry and entry["hash"] == digest
+                and all((ROOT / out).exists() for out in entry_outputs(entry))):
+            skipped += 1
+            continue
+        if Image is None:
+            print(f"Images: Pillow not installed, {rel} not rebuilt (pip install pillow)")
+            continue
+
+        new_entry = render_variants(source, digest, widths)
+        if rel == FAVICON_SOURCE:
+            new_entry["favicons"] = render_favicons(source, digest)
+        # Outputs of the previous source revision are now stale
+        for out in set(entry_outputs(entry or {})) - set(entry_outputs(new_entry)):
+            (ROOT / out).unlink(missing_ok=True)
+        cache["sources"][rel] = new_entry
+        changed.update(ROOT / out for out in entry_outputs(new_entry))
+        built += 1
+
+    if write_if_changed(IMAGE_CACHE, json.dumps(cache, indent=2, sort_keys=True) + "\n"):
+        changed.add(IMAGE_CACHE)
+
+    specs = {rel: (widths, sizes) for rel, (_, widths, sizes) in sources.items()}
+    for page in html_pages():
+        if page.exists():
+            text = page.read_text(encoding="utf-8")
+            text = rewrite_image_markup(text, page, cache["sources"], specs)
+            if write_if_changed(page, text):
+                changed.add(page)
+    print(f"Images: {built} sources rebuilt, {skipped} unchanged (cached by source hash)")
+
+
+def page_url(page, rel):
+    """URL of a repo-relative path as written in page (page-relative)."""
+    return os.path.relpath(ROOT / rel, page.parent).replace(os.sep, "/")
+
+
+def source_of(page, url):
+    """Repo-relative path a page-relative URL points at, or None."""
+    if not url or "://" in url:
+        return None
+    target = (ROOT / url.lstrip("/")) if url.startswith("/") else (page.parent / url)
+    try:
+        return target.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return None
+
+
+def picture_markup(img, page, rel, entry, spec):
+    widths, sizes = spec
+    attrs = dict(ATTRIBUTE.findall(img))
+    by_type = {}
+    for variant in entry["variants"]:
+        by_type.setdefault(variant["type"], []).append(variant)
+
+    def srcset(variants):
+        return ", ".join(f"{page_url(page, v['path'])} {v['width']}w" for v in variants)
+
+    fallback_type = next(t for t in by_type if t not in {m for _, m, _ in IMAGE_FORMATS})
+    fallbacks = by_type[fallback_type]
+    display = int(attrs.get("width") or widths[0])
+    src = next((v for v in fallbacks if v["width"] >= display), fallbacks[-1])
+
+    # Keep the original attributes and their order; swap src, add the rest
+    attrs["src"] = page_url(page, src["path"])
+    attrs["srcset"] = srcset(fallbacks)
+    attrs["sizes"] = sizes
+    attrs["data-source"] = page_url(page, rel)
+    img_tag = "<img " + " ".join(f'{k}="{v}"' for k, v in attrs.items()) + ">"
+    sources = "".join(
+        f'<source type="{mime}" srcset="{srcset(by_type[mime])}" sizes="{sizes}">'
+        for _, mime, _ in IMAGE_FORMATS if mime in by_type
+    )
+    return f"<picture data-responsive>{sources}{img_tag}</picture>"
+
+
+def rewrite_image_markup(text, page, entries, specs):
+    def replace_picture(match):
+        img = match.group(1) or match.group(0)
+        attrs = dict(ATTRIBUTE.findall(img))
+        rel = source_of(page, attrs.get("data-source") or attrs.get("src"))
+        if rel not in entries or rel not in specs:
+            return match.group(0)
+        return picture_markup(img, page, rel, entries[rel], specs[rel])
+
+    def replace_link(match):
+        favicons = entries.get(FAVICON_SOURCE, {}).get("favicons")
+        if not favicons:
+            return match.group(0)
+        if match.group(1) == "icon":
+            return (f'<link rel="icon" type="image/png" sizes="32x32" '
+                    f'href="{page_url(page, favicons["icon"])}">')
+        return (f'<link rel="apple-touch-icon" sizes="180x180" '
+                f'href="{page_url(page, favicons["apple-touch-icon"])}">')
+
+    text = RESPONSIVE_MARKUP.sub(replace_picture, text)
+    return LINK_TAG.sub(replace_link, text)
+
+
+def scan_string(text, i):
+    """Index just past the quoted string starting at text[i]."""
+    quote = text[i]
+    i += 1
+    while i < len(text) and text[i] != quote:
+        i += 2 if text[i] == "\\" else 1
+    return i + 1
+
+
+def outside_strings(text, transform):
+    """Apply transform to the parts of CSS text that are not quoted strings."""
+    out, start, i = [], 0, 0
+    while i < len(text):
+        if text[i] in "\"'":
+            end = scan_string(text, i)
+            out.append(transform(text[start:i]))
+            out.append(text[i:end])
+            start = i = end
+        else:
+            i += 1
+    out.append(transform(text[start:]))
+    return "".join(out)
+
+
+def strip_css_comments(css):
+    return outside_strings(css, lambda part: re.sub(r"/\*.*?\*/", "", part, flags=re.DOTALL))
+
+
+def matching_brace(css, i):
+    """Index of the '}' closing the '{' at css[i]."""
+    depth = 0
+    while i < len(css):
+        char = css[i]
+        if char in "\"'":
+            i = scan_string(css, i)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    raise ValueError("unbalanced braces in stylesheet")
+
+
+def parse_css(css):
+    """Parse a stylesheet (comments already stripped) into nodes:
+
+    ("rule", selectors, body)    style rule
+    ("group", prelude, nodes)    @media / @supports / @container / @layer block
+    ("atrule", prelude, body)    any other block at-rule (@keyframes, @font-face)
+    ("statement", text)          @import / @charset
+    """
+    nodes, i = [], 0
+    while i < len(css):
+        while i < len(css) and css[i] in " \t\r\n}":
+            i += 1
+        if i >= len(css):
+            break
+        j, paren = i, 0
+        while j < len(css):
+            char = css[j]
+            if char in "\"'":
+                j = scan_string(css, j)
+                continue
+            if char == "(":
+                paren += 1
+            elif char == ")":
+                paren -= 1
+            elif paren == 0 and char in "{;":
+                break
+            j += 1
+        prelude = css[i:j].strip()
+        if j >= len(css) or css[j] == ";":
+            if prelude:
+                nodes.append(("statement", prelude))
+            i = j + 1
+            continue
+        end = matching_brace(css, j)
+        body = css[j + 1:end]
+        if re.match(r"@(media|supports|container|layer)\b", prelude):
+            nodes.append(("group", prelude, parse_css(body)))
+        elif prelude.startswith("@"):
+            nodes.append(("atrule", prelude, body))
+        else:
+            nodes.append(("rule", split_selectors(prelude), body))
+        i = end + 1
+    return nodes
+
+
+def split_selectors(prelude):
+    """Split a selector list on top-level commas."""
+    selectors, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return [s for s in selectors if s]
+
+
+def minify_selector(selector):
+    def compact(part):
+        part = re.sub(r"\s+", " ", part)
+        return re.sub(r"\s*([>+~,])\s*", r"\1", part)
+    return outside_strings(selector, compact).strip()
+
+
+def minify_declarations(body):
+    def compact(part):
+        part = re.sub(r"\s+", " ", part)
+        part = re.sub(r"\s*([:;,{}])\s*", r"\1", part)
+        return part.replace(" !important", "!important")
+    return outside_strings(body, compact).strip().rstrip(";")
+
+
+def serialize_css(nodes):
+    """Minified CSS text for parsed nodes."""
+    out = []
+    for node in nodes:
+        kind = node[0]
+        if kind == "rule":
+            selectors = ",".join(minify_selector(s) for s in node[1])
+            out.append(f"{selectors}{{{minify_declarations(node[2])}}}")
+        elif kind == "group":
+            prelude = re.sub(r"\s+", " ", node[1])
+            out.append(f"{prelude}{{{serialize_css(node[2])}}}")
+        elif kind == "atrule":
+            prelude = re.sub(r"\s+", " ", node[1])
+            out.append(f"{prelude}{{{minify_declarations(node[2])}}}")
+        else:
+            out.append(node[1] + ";")
+    return "".join(out)
+
+
+def minify_css(css):
+    return serialize_css(parse_css(strip_css_comments(css)))
+
+
+def css_selectors(nodes):
+    """Every selector in parsed nodes, normalized, in order."""
+    for node in nodes:
+        if node[0] == "rule":
+            yield from (minify_selector(s) for s in node[1])
+        elif node[0] == "group":
+            yield from css_selectors(node[2])
+
+
+# Punctuators after which a '/' starts a regex literal rather than a division
+REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^") | {"return", "typeof", "case", "do",
+                                                  "else", "in", "of", "void", "yield"}
+
+
+def scan_template(js, i):
+    """Index just past the template literal starting at js[i], including any
+    nested ${...} expressions (which may hold strings and templates)."""
+    i += 1
+    while i < len(js):
+        char = js[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "`":
+            return i + 1
+        if js.startswith("${", i):
+            depth, i = 1, i + 2
+            while i < len(js) and depth:
+                char = js[i]
+                if char in "\"'":
+                    i = scan_string(js, i)
+                    continue
+                if char == "`":
+                    i = scan_template(js, i)
+                    continue
+                depth += {"{": 1, "}": -1}.get(char, 0)
+                i += 1
+            continue
+        i += 1
+    raise ValueError("unterminated template literal")
+
+
+def scan_regex(js, i):
+    """Index just past the regex literal (and flags) starting at js[i]."""
+    i += 1
+    in_class = False
+    while i < len(js):
+        char = js[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            i += 1
+            while i < len(js) and (js[i].isalnum() or js[i] == "_"):
+                i += 1
+            return i
+        elif char == "\n":
+            raise ValueError("unterminated regex literal")
+        i += 1
+    raise ValueError("unterminated regex literal")
+
+
+def js_tokens(js):
+    """Tokenize JavaScript into (token, newline_before, space_before) tuples,
+    dropping comments and whitespace. Strings, templates and regex literals
+    are kept as single opaque tokens."""
+    tokens, i = [], 0
+    newline = space = False
+    while i < len(js):
+        char = js[i]
+        if char in " \t\r\n﻿":
+            newline |= char == "\n"
+            space = True
+            i += 1
+            continue
+        if js.startswith("//", i):
+            end = js.find("\n", i)
+            i = len(js) if end == -1 else end
+            continue
+        if js.startswith("/*", i):
+            end = js.index("*/", i + 2)
+            newline |= "\n" in js[i:end]
+            space = True
+            i = end + 2
+            continue
+        if char in "\"'":
+            end = scan_string(js, i)
+        elif char == "`":
+            end = scan_template(js, i)
+        elif char == "/" and (not tokens or tokens[-1][0] in REGEX_PRECEDERS):
+            end = scan_regex(js, i)
+        elif char.isalnum() or char in "_$":
+            end = i + 1
+            while end < len(js) and (js[end].isalnum() or js[end] in "_$."):
+                # A '.' only continues numeric literals such as 0.15
+                if js[end] == "." and not js[i].isdigit():
+                    break
+                end += 1
+        else:
+            end = i + 1
+            # Greedy multi-character punctuators (=== !== => && || ?. ...)
+            while end < len(js) and js[i:end + 1] in JS_PUNCTUATORS:
+                end += 1
+        tokens.append((js[i:end], newline, space))
+        newline = space = False
+        i = end
+    return tokens
+
+
+JS_PUNCTUATORS = {
+    "==", "===", "!=", "!==", "<=", ">=", "=>", "&&", "||", "??", "?.", "++", "--",
+    "+=", "-=", "*=", "/=", "%=", "**", "**=", "&=", "|=", "^=", "<<", ">>", ">>>",
+    "<<=", ">>=", ">>>=", "&&=", "||=", "??=", "...", "..",
+}
+
+
+def minify_js(js):
+    """Conservative minifier: drops comments, indentation and blank lines and
+    the spaces that cannot matter, but keeps line breaks so automatic
+    semicolon insertion behaves exactly as in the source."""
+    out = []
+    previous = ""
+    for token, newline, space in js_tokens(js):
+        if out and newline:
+            out.append("\n")
+        elif out and space:
+            word = re.compile(r"[\w$]")
+            if (word.match(previous[-1]) and word.match(token[0])) or \
+                    (previous[-1] in "+-/" and token[0] in "+-/"):
+                out.append(" ")
+        out.append(token)
+        previous = token
+    return "".join(out) + "\n"
+
+
+def verify_minified(source, minified, kind):
+    """The minifiers must only drop whitespace and comments."""
+    if kind == ".css":
+        before = list(css_selectors(parse_css(strip_css_comments(source))))
+        after = list(css_selectors(parse_css(minified)))
+    else:
+        before = [token for token, _, _ in js_tokens(source)]
+        after = [token for token, _, _ in js_tokens(minified)]
+    if before != after:
+        raise SystemExit(f"Minified {kind} output does not match its source")
+
+
+def minified(source):
+    content = source.read_bytes()
+    if source.suffix not in (".css", ".js"):
+        return content
+    text = content.decode("utf-8-sig")
+    result = minify_css(text) if source.suffix == ".css" else minify_js(text)
+    verify_minified(text, result, source.suffix)
+    return result.encode("utf-8")
+
+
+class FoldCollector(HTMLParser):
+    """Collect the tags, classes, ids and attribute names of the first
+    FOLD_ELEMENTS body elements (inline SVG internals excluded)."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tags = {"html", "body"}
+        self.classes = set(DYNAMIC_CLASSES)
+        self.ids = set()
+        self.attrs = set(DYNAMIC_ATTRIBUTES)
+        self.in_body = False
+        self.count = 0
+        self.svg_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self.in_body = True
+        if self.in_body and (self.svg_depth or self.count >= FOLD_ELEMENTS):
+            self.svg_depth += tag == "svg"
+            return
+        if self.in_body:
+            self.count += 1
+            self.svg_depth += tag == "svg"
+            self.tags.add(tag)
+            for name, value in attrs:
+                self.attrs.add(name)
+                if name == "class" and value:
+                    self.classes.update(value.split())
+                elif name == "id" and value:
+                    self.ids.add(value)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.svg_depth -= tag == "svg"
+
+    def handle_endtag(self, tag):
+        if tag == "svg" and self.svg_depth:
+            self.svg_depth -= 1
+
+
+class DomRecorder(HTMLParser):
+    """Flat record of the <body> element tree, for before/after comparison."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.events = []
+        self.in_body = False
+
+    def handle_starttag(self, tag, attrs):
+        self.in_body |= tag == "body"
+        if self.in_body:
+            self.events.append(("start", tag, tuple(attrs)))
+
+    def handle_endtag(self, tag):
+        if self.in_body:
+            self.events.append(("end", tag))
+
+    def handle_data(self, data):
+        if self.in_body and data.strip():
+            self.events.append(("text", data.strip()))
+
+
+def parse_with(parser_class, text):
+    parser = parser_class()
+    parser.feed(text)
+    parser.close()
+    return parser
+
+
+def compound_used(compound, fold):
+    tag = re.match(r"[a-zA-Z][\w-]*", compound)
+    if tag and tag.group(0).lower() not in fold.tags:
+        return False
+    attrs = re.findall(r"\[\s*([\w-]+)", compound)
+    compound = re.sub(r"\[[^\]]*\]", "", compound)
+    return (all(a in fold.attrs for a in attrs)
+            and all(c in fold.classes for c in re.findall(r"\.([\w-]+)", compound))
+            and all(i in fold.ids for i in re.findall(r"#([\w-]+)", compound)))
+
+
+def selector_used(selector, fold):
+    """Over-inclusive match: every compound's tag, classes, ids and attribute
+    names occur above the fold (pseudo-classes and elements are ignored)."""
+    selector = re.sub(r"::?[\w-]+(\((?:[^()]|\([^()]*\))*\))?", "", selector)
+    compounds = re.split(r"\s*[>+~]\s*|\s+", selector.strip())
+    return all(compound_used(c, fold) for c in compounds if c and c != "*")
+
+
+def critical_nodes(nodes, fold):
+    kept = []
+    for node in nodes:
+        if node[0] == "rule":
+            if any(selector_used(s, fold) for s in node[1]):
+                kept.append(node)
+        elif node[0] == "group":
+            children = critical_nodes(node[2], fold)
+            if children:
+                kept.append((node[0], node[1], children))
+        elif node[0] == "statement":
+            kept.append(node)
+    return kept
+
+
+def referenced_keyframes(nodes, all_nodes):
+    """@keyframes blocks whose names the kept rules use."""
+    text = serialize_css(nodes)
+    return [node for node in all_nodes
+            if node[0] == "atrule" and node[1].startswith("@keyframes")
+            and re.search(r"\b" + re.escape(node[1].split()[-1]) + r"\b", text)]
+
+
+def selector_classes(selectors):
+    return {c for s in selectors for c in re.findall(r"\.([\w-]+)", re.sub(r"\[[^\]]*\]", "", s))}
+
+
+def local_stylesheets(page, text):
+    """Source stylesheets a page links to, in order."""
+    sheets = []
+    for match in STYLESHEET_LINK.finditer(text):
+        # Links already deferred by an earlier run only fill the "pre" group
+        rel = source_of(page, match.group("href") or match.group("pre"))
+        if not rel:
+            continue
+        # style.<hash>.css -> style.css
+        source = ROOT / re.sub(r"\.[0-9a-f]{%d}(\.css)$" % HASH_LENGTH, r"\1", rel)
+        if source.exists() and source not in sheets:
+            sheets.append(source)
+    return sheets
+
+
+def deferred_stylesheet(href):
+    return (f'<link rel="preload" href="{href}" as="style" '
+            f'onload="this.onload=null;this.rel=\'stylesheet\'">'
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+
+
+def inline_critical_css(data, changed):
+    report = []
+    for page in html_pages():
+        text = page.read_text(encoding="utf-8")
+        sheets = local_stylesheets(page, text)
+        if not sheets:
+            continue
+        fold = parse_with(FoldCollector, text)
+        full = parse_css(strip_css_comments(
+            "\n".join(sheet.read_text(encoding="utf-8-sig") for sheet in sheets)))
+        kept = critical_nodes(full, fold)
+        critical = serialize_css(kept + referenced_keyframes(kept, full))
+
+        # Class coverage: every above-the-fold class styled by the full CSS
+        # must still be styled by the (re-parsed) inline critical CSS.
+        used = [s for s in css_selectors(full) if selector_used(s, fold)]
+        needed = selector_classes(used) & fold.classes
+        covered = selector_classes(css_selectors(parse_css(critical)))
+        missing = needed - covered
+        if missing:
+            raise SystemExit(f"Critical CSS for {page.name} misses: {', '.join(sorted(missing))}")
+
+        style = f"<style data-critical>{critical}</style>"
+        updated = CRITICAL_STYLE.sub(lambda m: style, text, count=1)
+        if updated == text and "<style data-critical>" not in text:
+            first = STYLESHEET_LINK.search(text)
+            updated = text[:first.start()] + style + "\n  " + text[first.start():]
+        updated = STYLESHEET_LINK.sub(lambda m: deferred_stylesheet(m.group("href") or m.group("pre")), updated)
+
+        # The body DOM must be untouched: only <head> styling changes
+        if parse_with(DomRecorder, updated).events != parse_with(DomRecorder, text).events:
+            raise SystemExit(f"Critical CSS stage changed the DOM of {page.name}")
+
+        if write_if_changed(page, updated):
+            changed.add(page)
+        report.append(f"{page.relative_to(ROOT).as_posix()} {len(critical) / 1024:.1f} KB "
+                      f"({len(needed)} fold classes covered)")
+    print("Critical CSS: " + "; ".join(report))
+
+
+def html_pages():
+    return [ROOT / "index.html", ROOT / "about.html", ROOT / "learning.html",
+            *sorted((ROOT / "pages").glob("*.html"))]
+
+
+def fingerprinted(path, digest):
+    """learning-data.json -> learning-data.<hash>.json"""
+    return path.with_name(f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}")
+
+
+def prune_fingerprints(path, keep):
+    """Delete fingerprinted copies of path other than keep."""
+    stale = re.compile(re.escape(path.stem) + r"\.[0-9a-f]{%d}" % HASH_LENGTH
+                       + re.escape(path.suffix) + "$")
+    removed = []
+    for candidate in path.parent.iterdir():
+        if candidate != keep and stale.match(candidate.name):
+            candidate.unlink()
+            removed.append(candidate)
+    return removed
+
+
+def reference_pattern(path):
+    """Match root- or page-relative references to path, hashed or not."""
+    rel = path.relative_to(ROOT).as_posix()
+    base = rel[:-len(path.suffix)]
+    return re.compile(
+        r"(?<=[\"'/])" + re.escape(base) + r"(?:\.[0-9a-f]{%d})?" % HASH_LENGTH
+        + re.escape(path.suffix) + r"(?=[\"'?#)])"
+    )
+
+
+def fingerprint_target(source):
+    """(hashed path, minified bytes) for a fingerprinted source, with its
+    references to the sources before it rewritten to their hashed URLs (the
+    source file itself keeps the plain URLs). The hash is taken over the
+    bytes actually served."""
+    content = minified(source)
+    if source.suffix in (".css", ".js"):
+        text = content.decode("utf-8")
+        for dependency in FINGERPRINT_SOURCES[:FINGERPRINT_SOURCES.index(source)]:
+            url = fingerprint_target(dependency)[0].relative_to(ROOT).as_posix()
+            text = reference_pattern(dependency).sub(url, text)
+        content = text.encode("utf-8")
+    return fingerprinted(source, content_hash(content)), content
+
+
+def fingerprint_assets(data, changed):
+    referrers = html_pages()
+    pruned = 0
+    raw = served = 0
+    for source in FINGERPRINT_SOURCES:
+        target, content = fingerprint_target(source)
+        if not target.exists():
+            target.write_bytes(content)
+            changed.add(target)
+        pruned += len(prune_fingerprints(source, target))
+        if source.suffix in (".css", ".js"):
+            raw += source.stat().st_size
+            served += len(content)
+
+        pattern = reference_pattern(source)
+        url = target.relative_to(ROOT).as_posix()
+        for referrer in referrers:
+            if not referrer.exists():
+                continue
+            text = referrer.read_text(encoding="utf-8")
+            if write_if_changed(referrer, pattern.sub(url, text)):
+                changed.add(referrer)
+    print(f"Fingerprints: {len(FINGERPRINT_SOURCES)} assets, {pruned} stale copies pruned, "
+          f"CSS/JS minified {raw / 1024:.0f} KB -> {served / 1024:.0f} KB")
+
+
+def precache_entries():
+    # Landing pages are left to the network-first runtime cache of navigations
+    landing = set(LANDING_DIR.glob("learning-*.html"))
+    pages = [page for page in html_pages() if page not in landing]
+    files = pages + [fingerprint_target(source)[0] for source in FINGERPRINT_SOURCES]
+    for page in filter(Path.is_file, pages):
+        for match in RESPONSIVE_MARKUP.finditer(page.read_text(encoding="utf-8")):
+            rel = match.group(1) and source_of(page, dict(ATTRIBUTE.findall(match.group(1))).get("src"))
+            if rel and ROOT / rel not in files:
+                files.append(ROOT / rel)
+    for pattern in PRECACHE_GLOBS:
+        files.extend(sorted(ROOT.glob(pattern)))
+    return [
+        {
+            "url": "/" + path.relative_to(ROOT).as_posix(),
+            "revision": content_hash(path.read_bytes())[:HASH_LENGTH],
+        }
+        for path in files
+        if path.is_file()
+    ]
+
+
+def publish_service_worker(data, changed):
+    entries = precache_entries()
+    version = content_hash(json.dumps(entries).encode("utf-8"))[:HASH_LENGTH]
+    manifest = json.dumps({"version": version, "entries": entries}, indent=2)
+    if write_if_changed(PRECACHE_MANIFEST, manifest + "\n"):
+        changed.add(PRECACHE_MANIFEST)
+
+    worker = SERVICE_WORKER_SOURCE.read_text(encoding="utf-8")
+    worker = worker.replace("__PRECACHE_VERSION__", version)
+    if write_if_changed(SERVICE_WORKER, worker):
+        changed.add(SERVICE_WORKER)
+    print(f"Service worker: {len(entries)} precached assets, version {version}")
+
+
+def served_files():
+    for path in sorted(ROOT.rglob("*")):
+        rel = path.relative_to(ROOT)
+        if path.is_file() and not UNSERVED_DIRS.intersection(rel.parts[:-1]):
+            yield path
+
+
+def precompress(path, changed):
+    """Write .gz/.br siblings of path unless they are already newer."""
+    content = None
+    encoders = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append((".br", lambda data: brotli.compress(data, quality=11)))
+    for suffix, encode in encoders:
+        sibling = path.with_name(path.name + suffix)
+        if sibling.exists() and sibling.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            continue
+        content = content if content is not None else path.read_bytes()
+        if write_if_changed(sibling, encode(content)):
+            changed.add(sibling)
+
+
+def precompress_assets(data, changed):
+    count = removed = 0
+    for path in served_files():
+        if path.suffix in COMPRESSIBLE:
+            precompress(path, changed)
+            count += 1
+        elif path.suffix in (".gz", ".br") and not path.with_suffix("").exists():
+            # Sibling of a pruned fingerprint or deleted page
+            path.unlink()
+            removed += 1
+    encodings = "gzip + brotli" if brotli is not None else "gzip only (pip install brotli for .br)"
+    print(f"Precompressed: {count} files, {encodings}, {removed} orphaned siblings removed")
+
+
+def last_modified(path, changed):
+    """Date a page last changed: today if this run (or an uncommitted edit)
+    touched it, otherwise its last commit date, falling back to mtime."""
+    if path in changed:
+        return date.today().isoformat()
+    try:
+        rel = str(path.relative_to(ROOT))
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--", rel],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        if dirty:
+            return date.today().isoformat()
+        committed = subprocess.run(
+            ["git", "log", "-1", "--format=%cs", "--", rel],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        if committed:
+            return committed
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return datetime.fromtimestamp(path.stat().st_mtime).date().isoformat()
+
+
+def page_for_url(loc):
+    rel = loc[len(SITE):].lstrip("/") if loc.startswith(SITE) else ""
+    return ROOT / (rel or "index.html")
+
+
+def publish_sitemap(data, changed):
+    xml = SITEMAP.read_text(encoding="utf-8")
+
+    def refresh(match):
+        page = page_for_url(match.group(2))
+        if not page.exists():
+            return match.group(0)
+        return match.group(1) + last_modified(page, changed) + match.group(4)
+
+    xml = re.sub(
+        r"(<loc>([^<]*)</loc>\s*<lastmod>)([^<]*)(</lastmod>)",
+        refresh,
+        xml,
+    )
+    if write_if_changed(SITEMAP, xml):
+        changed.add(SITEMAP)
+    print("sitemap.xml: lastmod refreshed")
+
+
+# Order matters: critical CSS rewrites the stylesheet links before they are
+# fingerprinted, fingerprinting must see the final page and script contents,
+# the sitemap reads which pages the earlier stages rewrote, and compression
+# runs last on the final bytes.
+STAGES = [publish_schema, prerender_learning, publish_llms, publish_analytics, publish_columnar,
+          publish_landing_pages, build_images,
+          inline_critical_css, fingerprint_assets, publish_service_worker, publish_sitemap,
+          precompress_assets]
+
+
+def load_dataset(changed):
+    """Export learning-data.json from the catalog and return the dataset.
+
+    Refuses to overwrite a learning-data.json edited after the catalog was
+    last written: such edits have to be merged with `catalog.py import`.
+    """
+    conn = catalog.connect()
+    with conn:
+        data = catalog.dataset(conn)
+        exported = catalog.dump(data)
+        data["top_certificates"] = catalog.top_certificates(conn, TOP_N)
+    conn.close()
+    if DATA.exists() and DATA.read_bytes() != exported \
+            and DATA.stat().st_mtime > catalog.CATALOG.stat().st_mtime:
+        raise SystemExit(f"{DATA.relative_to(ROOT)} was edited after the catalog; merge it with "
+                         "`python assets/js/catalog.py import` first")
+    if write_if_changed(DATA, exported):
+        changed.add(DATA)
+    return data
+
+
+def publish():
+    changed = set()
+    data = load_dataset(changed)
+    for stage in STAGES:
+        stage(data, changed)
+
+    if changed:
+        print("\nUpdated: " + ", ".join(
+            sorted(str(p.relative_to(ROOT)) for p in changed)))
+    else:
+        print("\nAll artifacts up to date")
+
+
+def watched_files():
+    files = {DATA, catalog.CATALOG, SERVICE_WORKER_SOURCE, *FINGERPRINT_SOURCES,
+             *html_pages()}
+    for pattern, _, _ in RESPONSIVE_IMAGES:
+        files.update(ROOT.glob(pattern))
+    return files
+
+
+def snapshot():
+    state = {}
+    for path in watched_files():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def watch(interval):
+    """Re-run the pipeline whenever the dataset or any source asset changes."""
+    publish()
+    # Snapshot after each build so the pipeline's own writes don't retrigger it
+    last = snapshot()
+    print(f"\nWatching for changes every {interval}s (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot()
+            if current != last:
+                print()
+                publish()
+                last = snapshot()
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and rebuild when a source file changes")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="seconds between change checks in --watch mode")
+    args = parser.parse_args()
+
+    if args.watch:
+        watch(args.interval)
+    else:
+        publish()
+
+
+if __name__ == "__main__":
+    main()
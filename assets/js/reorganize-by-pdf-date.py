@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
 Reorganize PDFs to correct year folders based on actual PDF dates.
+
+Years come from the PDF metadata (see year_probe.py); the page text is only
+read to confirm a file really belongs in another year before moving it,
+when the metadata is missing, and for a sample of files.
 """
 
 import os
@@ -8,6 +12,8 @@ import re
 import shutil
 from pathlib import Path
 
+from year_probe import YearProbe
+
 try:
     import pypdf
 except ImportError:
@@ -15,7 +21,7 @@ except ImportError:
     exit(1)
 
 def extract_year_from_pdf(pdf_path):
-    """Extract year from PDF."""
+    """Extract year from PDF text."""
     try:
         with open(pdf_path, 'rb') as file:
             pdf_reader = pypdf.PdfReader(file)
@@ -48,11 +54,12 @@ def main():
     
     moved = 0
     correct = 0
+    probe = YearProbe(extract_year_from_pdf)
     
     for pdf_file in all_pdfs:
         try:
-            # Extract year from PDF
-            pdf_year = extract_year_from_pdf(pdf_file)
+            # Year from the metadata, checked against the text before a move
+            pdf_year = probe.year(pdf_file, expected=pdf_file.parent.name)
             
             if not pdf_year:
                 correct += 1  # Can't determine, leave as is
@@ -89,6 +96,7 @@ def main():
     
     print(f"\n✓ Moved {moved} PDFs to correct year folders")
     print(f"✓ {correct} PDFs already in correct folders")
+    print(f"✓ {probe.summary()}")
     
     # Clean up: remove all non-PDF files and empty folders
     print("\nCleaning up...")
@@ -97,7 +105,8 @@ def main():
     
     # Remove non-PDF files
     for item in archived_path.rglob('*'):
-        if item.is_file() and not item.name.endswith('.pdf'):
+        # Files directly in archived/ (the catalog, text store, reports) are kept
+        if item.is_file() and not item.name.endswith('.pdf') and item.parent != archived_path:
             try:
                 item.unlink()
                 removed_files += 1
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Local dev server that behaves like a caching production host.
+
+Unlike `python -m http.server`, it:
+  - negotiates Accept-Encoding and serves the .br/.gz siblings written by
+    assets/js/publish-site.py (with Vary: Accept-Encoding)
+  - sends strong ETags and answers If-None-Match with 304
+  - marks fingerprinted files (name.<hash>.ext) as immutable for a year,
+    HTML / sw.js / manifests as no-cache, everything else for 10 minutes
+    (the GitHub Pages default)
+  - logs the transferred vs. raw size of every response
+
+Run from anywhere, then open http://localhost:5173:
+
+    python assets/js/publish-site.py   # writes the compressed siblings
+    python assets/js/serve-site.py [--port 5173] [--no-compress]
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+FINGERPRINTED = re.compile(r"\.[0-9a-f]{8}\.[a-z0-9]+$")
+NO_CACHE_NAMES = {"sw.js", "precache-manifest.json"}
+# Preferred order when the client accepts several encodings
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+
+def accepted_encodings(header):
+    """Encodings the client accepts (q > 0), from an Accept-Encoding header."""
+    accepted = set()
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        if name and q > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def cache_control(path):
+    if FINGERPRINTED.search(path.name):
+        return "public, max-age=31536000, immutable"
+    if path.suffix == ".html" or path.name in NO_CACHE_NAMES:
+        return "no-cache"
+    return "public, max-age=600"
+
+
+class CachingHandler(SimpleHTTPRequestHandler):
+    compress = True
+    # (path, encoding) -> (mtime_ns, etag)
+    etags = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(ROOT), **kwargs)
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def resolve(self):
+        """Filesystem path for the request, or None after sending a response."""
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            if not self.path.split("?", 1)[0].endswith("/"):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header("Location", self.path.split("?", 1)[0] + "/")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+            path = path / "index.html"
+        if not path.is_file():
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        return path
+
+    def choose_variant(self, path):
+        """(file to send, content-encoding or None)"""
+        if not self.compress:
+            return path, None
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        for encoding, suffix in ENCODINGS:
+            sibling = path.with_name(path.name + suffix)
+            if (encoding in accepted and sibling.is_file()
+                    and sibling.stat().st_mtime_ns >= path.stat().st_mtime_ns):
+                return sibling, encoding
+        return path, None
+
+    def etag(self, variant, encoding):
+        mtime = variant.stat().st_mtime_ns
+        key = (variant, encoding)
+        cached = self.etags.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        digest = hashlib.sha256(variant.read_bytes()).hexdigest()[:16]
+        tag = f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+        self.etags[key] = (mtime, tag)
+        return tag
+
+    def serve(self, send_body):
+        path = self.resolve()
+        if path is None:
+            return
+        variant, encoding = self.choose_variant(path)
+        tag = self.etag(variant, encoding)
+        raw_size = path.stat().st_size
+
+        not_modified = tag in [t.strip() for t in
+                               self.headers.get("If-None-Match", "").split(",")]
+        status = HTTPStatus.NOT_MODIFIED if not_modified else HTTPStatus.OK
+        self.send_response(status)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("ETag", tag)
+        self.send_header("Cache-Control", cache_control(path))
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+
+        body = b""
+        if not not_modified:
+            body = variant.read_bytes()
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body and body:
+            self.wfile.write(body)
+        self.log_transfer(status, len(body) if send_body else 0, raw_size, encoding)
+
+    def log_transfer(self, status, sent, raw_size, encoding):
+        saved = f"{100 - 100 * sent / raw_size:.0f}%" if sent and raw_size else "-"
+        sys.stderr.write(
+            f"{self.command:4} {int(status)} {self.path:<60} "
+            f"{sent:>9,} B sent / {raw_size:>9,} B raw  "
+            f"{encoding or 'identity':8} saved {saved}\n"
+        )
+
+    def log_request(self, code="-", size="-"):
+        # Successful responses are logged by log_transfer with sizes
+        if isinstance(code, HTTPStatus):
+            code = code.value
+        if str(code).startswith(("4", "5")):
+            super().log_request(code, size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local caching dev server for the site")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 5173)))
+    parser.add_argument("--bind", default="127.0.0.1")
+    parser.add_argument("--no-compress", action="store_true",
+                        help="ignore the .br/.gz siblings and serve identity encoding")
+    args = parser.parse_args()
+
+    CachingHandler.compress = not args.no_compress
+    server = ThreadingHTTPServer((args.bind, args.port), CachingHandler)
+    print(f"Serving {ROOT} at http://{args.bind}:{args.port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
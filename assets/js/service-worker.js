@@ -0,0 +1,100 @@
+/*
+ * Service worker source. Do not register this file directly:
+ * assets/js/publish-site.py copies it to /sw.js (so it controls the whole
+ * site) with PRECACHE_VERSION set to the hash of /precache-manifest.json.
+ * Any asset change therefore changes sw.js, which makes browsers install
+ * the new worker and precache the new manifest.
+ *
+ * Strategies:
+ *   - HTML pages: network-first, falling back to the precache offline
+ *   - /assets/data/ JSON: stale-while-revalidate
+ *   - everything else same-origin: cache-first (fingerprinted, immutable)
+ */
+
+const PRECACHE_VERSION = '__PRECACHE_VERSION__';
+const PRECACHE = `bb-precache-${PRECACHE_VERSION}`;
+const RUNTIME = 'bb-runtime';
+const MANIFEST_URL = '/precache-manifest.json';
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(
+    fetch(MANIFEST_URL, { cache: 'no-cache' })
+      .then(response => response.json())
+      .then(manifest => caches.open(PRECACHE).then(cache =>
+        cache.addAll(manifest.entries.map(entry => new Request(entry.url, { cache: 'no-cache' })))
+      ))
+      .then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(
+    caches.keys()
+      // Old precaches and runtime copies of superseded fingerprints
+      .then(keys => Promise.all(keys
+        .filter(key => key.startsWith('bb-') && key !== PRECACHE)
+        .map(key => caches.delete(key))))
+      .then(() => self.clients.claim())
+  );
+});
+
+self.addEventListener('fetch', (event) => {
+  const request = event.request;
+  if (request.method !== 'GET') return;
+
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) return;
+
+  if (request.mode === 'navigate' || request.destination === 'document') {
+    event.respondWith(networkFirst(request, url));
+  } else if (url.pathname.startsWith('/assets/data/')) {
+    event.respondWith(staleWhileRevalidate(event, request));
+  } else {
+    event.respondWith(cacheFirst(request));
+  }
+});
+
+// "/" and "/pages/" are precached under their index.html URL
+function pageCacheKey(url) {
+  return url.pathname.endsWith('/') ? url.pathname + 'index.html' : url.pathname;
+}
+
+async function networkFirst(request, url) {
+  try {
+    const response = await fetch(request);
+    if (response.ok) {
+      const cache = await caches.open(PRECACHE);
+      cache.put(pageCacheKey(url), response.clone());
+    }
+    return response;
+  } catch (error) {
+    const cached = await caches.match(pageCacheKey(url));
+    if (cached) return cached;
+    throw error;
+  }
+}
+
+async function staleWhileRevalidate(event, request) {
+  const cache = await caches.open(RUNTIME);
+  const cached = await caches.match(request);
+  const network = fetch(request).then(response => {
+    if (response.ok) cache.put(request, response.clone());
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+  }
+  return network;
+}
+
+async function cacheFirst(request) {
+  const cached = await caches.match(request);
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (response.ok) {
+    const cache = await caches.open(RUNTIME);
+    cache.put(request, response.clone());
+  }
+  return response;
+}
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Full-text search over the extracted certificate text.
+
+An on-disk inverted index (archived/.certificate-text-index.sqlite) over the
+text extraction keeps in archived/.pdf-text-store.json.gz, so finding the
+certificates that mention a topic anywhere in their text does not re-read
+the PDFs. Documents are keyed by the SHA-256 of their PDF (the catalog's
+source_hash); identical PDFs share one document.
+
+  - postings: one row per (term, document) with the term frequency and the
+    term's positions in the document (a packed array), clustered by term so
+    a term's postings are one range scan
+  - documents: the length of each document in terms, for BM25 length
+    normalization
+
+extract-pdf-data.py updates the index as it runs: documents whose PDF
+disappeared or changed are dropped and only new ones are tokenized.
+Queries are ranked by BM25 (computed inside SQLite); "quoted phrases" must
+occur as consecutive terms, checked against the positions.
+
+    import text_search
+    conn = text_search.connect()
+    text_search.update(conn, {source_hash: text, ...})
+    text_search.search(conn, 'docker "continuous integration"', limit=10)
+
+    python assets/js/text_search.py index    # (re)build from the text store
+    python assets/js/text_search.py query 'docker "continuous integration"' [--limit N]
+"""
+
+import argparse
+import gzip
+import json
+import math
+import re
+import sqlite3
+from array import array
+from pathlib import Path
+
+import catalog
+
+ROOT = Path(__file__).resolve().parents[2]
+INDEX = ROOT / "archived" / ".certificate-text-index.sqlite"
+TEXT_STORE = ROOT / "archived" / ".pdf-text-store.json.gz"
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+
+# Terms: letters and digits, keeping the symbols of names like c++ and c#
+TOKEN = re.compile(r"[^\W_]+[+#]*")
+PHRASE = re.compile(r'"([^"]*)"')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc INTEGER PRIMARY KEY,
+    source_hash TEXT NOT NULL UNIQUE,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc INTEGER NOT NULL REFERENCES documents (doc) ON DELETE CASCADE,
+    tf INTEGER NOT NULL,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc);
+"""
+
+
+def tokenize(text):
+    """Lowercased terms of text, in order."""
+    return TOKEN.findall(text.casefold())
+
+
+def connect(path=INDEX):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def add_document(conn, source_hash, text):
+    terms = tokenize(text)
+    positions = {}
+    for position, term in enumerate(terms):
+        positions.setdefault(term, array("I")).append(position)
+    doc = conn.execute("INSERT INTO documents (source_hash, length) VALUES (?, ?)",
+                       (source_hash, len(terms))).lastrowid
+    conn.executemany("INSERT INTO postings (term, doc, tf, positions) VALUES (?, ?, ?, ?)",
+                     [(term, doc, len(p), p.tobytes()) for term, p in positions.items()])
+
+
+def update(conn, texts):
+    """Make the index hold exactly the documents of texts ({source_hash: text}).
+    Only documents that are not indexed yet are tokenized. Returns (added,
+    removed) counts."""
+    indexed = {row["source_hash"]: row["doc"] for row in conn.execute("SELECT doc, source_hash FROM documents")}
+    stale = [doc for source_hash, doc in indexed.items() if source_hash not in texts]
+    conn.executemany("DELETE FROM documents WHERE doc = ?", [(doc,) for doc in stale])
+    added = 0
+    for source_hash, text in texts.items():
+        if source_hash not in indexed:
+            add_document(conn, source_hash, text)
+            added += 1
+    return added, len(stale)
+
+
+def parse_query(query):
+    """(terms, phrases): every query term, and the term lists of the quoted
+    phrases of two or more terms."""
+    phrases = [terms for terms in map(tokenize, PHRASE.findall(query)) if len(terms) > 1]
+    return tokenize(query), phrases
+
+
+def phrase_docs(conn, phrase):
+    """Documents in which the terms of phrase occur consecutively."""
+    postings = []
+    for term in dict.fromkeys(phrase):
+        rows = conn.execute("SELECT doc, positions FROM postings WHERE term = ?", (term,))
+        postings.append({row["doc"]: row["positions"] for row in rows})
+    docs = set.intersection(*(set(p) for p in postings)) if postings else set()
+    by_term = dict(zip(dict.fromkeys(phrase), postings))
+    matched = set()
+    for doc in docs:
+        starts = set(array("I", by_term[phrase[0]][doc]))
+        for offset, term in enumerate(phrase[1:], 1):
+            following = array("I", by_term[term][doc])
+            starts &= {position - offset for position in following}
+            if not starts:
+                break
+        if starts:
+            matched.add(doc)
+    return matched
+
+
+def search(conn, query, limit=10):
+    """[(source_hash, score)] of the best BM25 matches of query, best first.
+    A document matches when it contains any query term and every phrase."""
+    terms, phrases = parse_query(query)
+    if not terms:
+        return []
+    count, average = conn.execute("SELECT COUNT(*), AVG(length) FROM documents").fetchone()
+    if not count:
+        return []
+    weights = []
+    for term in dict.fromkeys(terms):
+        df = conn.execute("SELECT COUNT(*) FROM postings WHERE term = ?", (term,)).fetchone()[0]
+        if df:
+            weights.append((term, math.log(1 + (count - df + 0.5) / (df + 0.5)) * terms.count(term)))
+    if not weights:
+        return []
+
+    allowed = None
+    for phrase in phrases:
+        docs = phrase_docs(conn, phrase)
+        allowed = docs if allowed is None else allowed & docs
+        if not allowed:
+            return []
+    values = ", ".join("(?, ?)" for _ in weights)
+    sql = (f"WITH query (term, weight) AS (VALUES {values}) "
+           "SELECT d.source_hash, SUM(q.weight * p.tf * (? + 1) / "
+           "(p.tf + ? * (1 - ? + ? * d.length / ?))) AS score "
+           "FROM query q JOIN postings p ON p.term = q.term JOIN documents d ON d.doc = p.doc ")
+    params = [value for weight in weights for value in weight] + [K1, K1, B, B, average]
+    if allowed is not None:
+        sql += f"WHERE d.doc IN ({', '.join(str(doc) for doc in allowed)}) "
+    sql += "GROUP BY d.doc ORDER BY score DESC, d.doc LIMIT ?"
+    return [(row["source_hash"], row["score"]) for row in conn.execute(sql, params + [limit])]
+
+
+def store_texts(path=TEXT_STORE):
+    """{source_hash: text} of every PDF in the text store that has text."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        entries = json.load(f).get("entries", {})
+    return {source_hash: entry["text"] for source_hash, entry in entries.items() if entry.get("text")}
+
+
+def load_texts(path=TEXT_STORE, catalog_path=catalog.CATALOG):
+    """{source_hash: text} of the catalog's certificates found in the text store."""
+    texts = store_texts(path)
+    conn = catalog.connect(catalog_path)
+    hashes = {row[0] for row in conn.execute("SELECT source_hash FROM certificates WHERE source_hash IS NOT NULL")}
+    conn.close()
+    return {source_hash: texts[source_hash] for source_hash in hashes if source_hash in texts}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text search over the certificate text")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("index", help="bring the index up to date with the text store")
+    query = commands.add_parser("query", help="rank certificates by BM25")
+    query.add_argument("query", help='terms and "quoted phrases"')
+    query.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    conn = connect()
+    if args.command == "index":
+        if not TEXT_STORE.exists():
+            raise SystemExit(f"No text store at {TEXT_STORE}: run extract-pdf-data.py first")
+        with conn:
+            added, removed = update(conn, load_texts())
+        total = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        print(f"Text index: {added} added, {removed} removed, {total} documents")
+    else:
+        results = search(conn, args.query, args.limit)
+        catalog_conn = catalog.connect()
+        for source_hash, score in results:
+            for cert in catalog_conn.execute("SELECT id, date, title FROM certificates WHERE source_hash = ? "
+                                             "ORDER BY position", (source_hash,)):
+                print(f"{score:>7.2f}  {cert['id']:>5}  {cert['date'] or '':<10}  {cert['title']}")
+        catalog_conn.close()
+        if not results:
+            print("No matches")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
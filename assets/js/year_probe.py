@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Metadata-first year probe for the archive reorganizer scripts.
+
+Reads a certificate's year from the PDF metadata instead of decoding its
+pages: the trailer at the end of the file points (through the cross-reference
+table) at the document-info dictionary, whose /CreationDate is read, and at
+the catalog, whose XMP packet's xmp:CreateDate is read when it is stored
+uncompressed. That is a few kilobytes per file.
+
+The metadata is the date the PDF was generated, which is not always the
+completion date printed on the certificate (a certificate downloaded again
+later carries the new date). The text of the first pages, parsed by the
+calling script's own extractor, is therefore still read when:
+  - the metadata is missing, unparsable or XMP and /CreationDate disagree
+  - the metadata year differs from the year the caller expects (e.g. the
+    year folder the file already sits in), before anything is moved
+  - the file is one of every SAMPLE_EVERY files (the cross-check); after
+    a sampled file disagrees, the metadata is distrusted for the rest of
+    the run and every file is read
+
+    probe = YearProbe(extract_year_from_pdf)
+    year = probe.year(pdf_file, expected=pdf_file.parent.name)
+    print(probe.summary())
+"""
+
+import re
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+YEARS = range(2020, 2031)
+SAMPLE_EVERY = 10
+# Bytes read from the end of the file for the trailer, and per object
+TAIL_BYTES = 2048
+OBJECT_BYTES = 2048
+# XMP packets are read this far into their stream
+XMP_BYTES = 8192
+
+STARTXREF = re.compile(rb'startxref\s+(\d+)\s+%%EOF', re.DOTALL)
+TRAILER_REF = rb'/%s\s+(\d+)\s+(\d+)\s+R'
+XREF_SUBSECTION = re.compile(rb'(\d+)\s+(\d+)[ \t]*\r?\n')
+CREATION_DATE = re.compile(rb'/CreationDate\s*\(\s*(?:D:)?(\d{4})')
+XMP_CREATE_DATE = re.compile(rb'xmp:CreateDate(?:>|=[\'"])\s*(\d{4})')
+
+
+def read_at(file, offset, size):
+    file.seek(offset)
+    return file.read(size)
+
+
+def object_offset(file, xref_offset, number):
+    """Byte offset of object number from a classic cross-reference table,
+    or None (cross-reference streams and missing entries)."""
+    data = read_at(file, xref_offset, 64)
+    if not data.startswith(b'xref'):
+        return None
+    position = xref_offset + len(b'xref')
+    while True:
+        header = read_at(file, position, 64)
+        match = XREF_SUBSECTION.match(header.lstrip())
+        if not match:
+            return None
+        position += len(header) - len(header.lstrip()) + match.end()
+        first, count = int(match.group(1)), int(match.group(2))
+        if first <= number < first + count:
+            # Entries are exactly 20 bytes: "0000012345 00000 n\r\n"
+            entry = read_at(file, position + (number - first) * 20, 20)
+            if entry[17:18] != b'n':
+                return None
+            return int(entry[:10])
+        position += count * 20
+
+
+def read_object(file, xref_offset, tail, name, size=OBJECT_BYTES):
+    """Leading bytes of the object the trailer's /name entry points at."""
+    match = re.search(TRAILER_REF % name, tail)
+    if not match:
+        return None
+    offset = object_offset(file, xref_offset, int(match.group(1)))
+    return read_at(file, offset, size) if offset is not None else None
+
+
+def metadata_years(pdf_path):
+    """(CreationDate year, XMP CreateDate year) read from the trailer
+    onwards; either is None when missing or not readable this way."""
+    creation = xmp = None
+    with open(pdf_path, 'rb') as file:
+        file.seek(0, 2)
+        size = file.tell()
+        tail = read_at(file, max(0, size - TAIL_BYTES), TAIL_BYTES)
+        startxref = STARTXREF.findall(tail)
+        trailer = tail.rfind(b'trailer')
+        if not startxref or trailer < 0:
+            return None, None
+        xref_offset, tail = int(startxref[-1]), tail[trailer:]
+
+        info = read_object(file, xref_offset, tail, b'Info')
+        match = info and CREATION_DATE.search(info)
+        if match:
+            creation = match.group(1).decode()
+
+        root = read_object(file, xref_offset, tail, b'Root')
+        ref = root and re.search(rb'/Metadata\s+(\d+)\s+\d+\s+R', root)
+        if ref:
+            offset = object_offset(file, xref_offset, int(ref.group(1)))
+            packet = read_at(file, offset, XMP_BYTES) if offset is not None else b''
+            # Compressed XMP streams are not decoded here
+            match = b'/Filter' not in packet.split(b'stream', 1)[0] and XMP_CREATE_DATE.search(packet)
+            if match:
+                xmp = match.group(1).decode()
+    return creation, xmp
+
+
+def library_metadata_year(pdf_path):
+    """CreationDate year through pypdf (parses the file, decodes no pages)."""
+    if pypdf is None:
+        return None
+    try:
+        creation = pypdf.PdfReader(pdf_path).metadata.creation_date
+    except Exception:
+        return None
+    return str(creation.year) if creation else None
+
+
+class YearProbe:
+    """Year of a certificate PDF from its metadata, cross-checked against
+    text_year(pdf_path) (the caller's page-text extractor)."""
+
+    def __init__(self, text_year, sample_every=SAMPLE_EVERY):
+        self.text_year = text_year
+        self.sample_every = sample_every
+        self.distrusted = False
+        self.probed = self.from_metadata = self.from_text = 0
+        self.sampled = self.disagreed = 0
+
+    def metadata_year(self, pdf_path):
+        try:
+            creation, xmp = metadata_years(pdf_path)
+        except (OSError, ValueError):
+            creation = xmp = None
+        if creation is None and xmp is None:
+            creation = library_metadata_year(pdf_path)
+        if creation and xmp and creation != xmp:
+            return None
+        year = xmp or creation
+        return year if year and int(year) in YEARS else None
+
+    def year(self, pdf_path, expected=None):
+        self.probed += 1
+        meta = None if self.distrusted else self.metadata_year(pdf_path)
+        sampled = meta is not None and self.probed % self.sample_every == 0
+        if meta is not None and not sampled and (expected is None or meta == expected):
+            self.from_metadata += 1
+            return meta
+
+        text = self.text_year(pdf_path)
+        self.from_text += 1
+        if sampled:
+            self.sampled += 1
+        if meta and text and meta != text:
+            self.disagreed += 1
+            if sampled:
+                self.distrusted = True
+        return text or meta
+
+    def summary(self):
+        line = (f"Year probe: {self.from_metadata} from metadata, {self.from_text} from page text "
+                f"({self.sampled} sampled, {self.disagreed} disagreed with the metadata)")
+        if self.distrusted:
+            line += "; metadata distrusted after a sampled mismatch"
+        return line